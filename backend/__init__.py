@@ -1,7 +1,13 @@
 """Resume Builder Backend - Utility tools for resume processing."""
 
 # Text extraction
-from .extractors import extract_text
+from .extractors import extract_text, extract_text_batch
+
+# Structured PDF layout (parsed once, shared by extractors and monitor)
+from .layout import PdfLayout, extract_layout
+
+# Section segmentation & ResumeData pre-fill
+from .segmenter import segment_text, prefill_resume
 
 # Data models
 from .models import ResumeData, Contact, WorkEntry, ProjectEntry, EducationEntry
@@ -12,28 +18,91 @@ from .generator import (
     generate_letter_typst,
     compile_pdf,
     check_page_count,
+    compile_source,
+    render_resume,
+    compile_pdf_async,
+    generate_and_compile_async,
     AVAILABLE_TEMPLATES,
 )
+# Warm Typst worker pool (used transparently by compile_pdf when active)
+from .compile_service import CompileService, set_compile_service
+
+# Fit-to-one-page optimizer
+from .estimator import estimate_layout
+from .fit import fit_to_one_page
+
+# Bulk tailoring (master resume × job descriptions)
+from .batch import run_batch
+
 # Resume quality monitoring
-from .monitor import detect_runts, check_page_fill
+from .monitor import analyze_pdf, detect_runts, check_page_fill
+
+# Keyword alignment scoring (docs/scoring_rules.md)
+from .keywords import parse_keywords, score_alignment, score_batch
+
+# Bullet relevance ranking against job descriptions
+from .rank import rank_bullets, score_bullets
+
+# Bullet selection under a one-page line budget
+from .knapsack import select_bullets
+
+# Full-text search across personas and tailored resumes
+from .search import search, update_index
 
 # Persona management
-from .ingest import list_personas, update_current_persona, ingest_resume_from_json
+from .ingest import (
+    list_personas,
+    get_persona,
+    update_current_persona,
+    ingest_resume_from_json,
+    read_bulk_manifest,
+    bulk_ingest,
+)
 
 __all__ = [
     # Extraction
     'extract_text',
+    'extract_text_batch',
+    # Layout
+    'PdfLayout',
+    'extract_layout',
+    # Segmentation
+    'segment_text',
+    'prefill_resume',
     # Generation
     'generate_typst',
     'generate_letter_typst',
     'compile_pdf',
     'check_page_count',
+    'compile_source',
+    'render_resume',
+    'compile_pdf_async',
+    'generate_and_compile_async',
     'AVAILABLE_TEMPLATES',
+    'CompileService',
+    'set_compile_service',
+    'estimate_layout',
+    'fit_to_one_page',
+    'run_batch',
     # Monitoring
+    'analyze_pdf',
     'detect_runts',
     'check_page_fill',
+    # Keywords
+    'parse_keywords',
+    'score_alignment',
+    'score_batch',
+    'rank_bullets',
+    'score_bullets',
+    'select_bullets',
+    # Search
+    'search',
+    'update_index',
     # Personas
     'list_personas',
+    'get_persona',
     'update_current_persona',
     'ingest_resume_from_json',
+    'read_bulk_manifest',
+    'bulk_ingest',
 ]
@@ -0,0 +1,346 @@
+"""
+Bulk tailoring: one master resume × a directory of job descriptions.
+
+Each job description (.txt/.md) produces a tailored resume. Work runs as
+three stages connected by bounded queues, so a slow stage applies
+backpressure instead of buffering hundreds of resumes in memory:
+
+    generate (1 thread)   tailor the master for the JD, render Typst source
+    compile  (N threads)  Typst over stdin, PDF bytes out (no temp files)
+    validate (1 thread)   page count, runts and fill on one PDF parse,
+                          then write .typ/.pdf and append to summary.jsonl
+
+summary.jsonl doubles as the checkpoint: a record is appended only after
+its files are written, and a rerun skips every job whose record is "ok"
+for the same master, JD text and template. Killing a run loses at most
+the jobs in flight.
+
+Usage:
+    from backend.batch import run_batch
+
+    result = run_batch(master, "jds/", "output/alex/tailored", workers=4)
+
+    python -m backend.batch --json master.json --jds jds/ --out output/alex/tailored
+"""
+
+import json
+import os
+import queue
+import re
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+from .cache import hash_bytes
+from .generator import (
+    AVAILABLE_TEMPLATES,
+    DEFAULT_SOURCE_DIR,
+    anchor_imports,
+    compile_source,
+    generate_typst,
+)
+from .knapsack import tailor_to_page
+from .models import ResumeData
+from .monitor import analyze_pdf
+
+
+JD_EXTENSIONS = (".txt", ".md")
+
+SUMMARY_FILE = "summary.jsonl"
+
+# A tailor turns (master, JD text) into a new ResumeData; it must not
+# modify the master
+Tailor = Callable[[ResumeData, str], ResumeData]
+
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#.-]*[a-z0-9+#]|[a-z]")
+
+_STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or our that
+    the their this to we will with you your who what which while about across
+    into over under more most other such than then them they were was been
+    can may must should would able strong work working team teams role
+""".split())
+
+_SENTINEL = None
+
+
+def _terms(text: str) -> set[str]:
+    return {w for w in _WORD_RE.findall(text.lower()) if len(w) > 2 and w not in _STOPWORDS}
+
+
+def tailor_for_jd(master: ResumeData, jd_text: str) -> ResumeData:
+    """
+    Default tailor: reorder content by overlap with the JD's terms.
+
+    Bullets within each work/project entry are stably sorted by how many
+    distinct JD terms they contain, and skills within each category are
+    moved forward if the JD mentions them. Entries keep their order, and
+    nothing is added or removed.
+    """
+    jd_terms = _terms(jd_text)
+
+    def overlap(text: str) -> int:
+        return len(_terms(text) & jd_terms)
+
+    data = ResumeData.from_dict(master.to_dict())
+    for entry in (*data.work, *data.projects):
+        entry.bullets.sort(key=overlap, reverse=True)
+    for items in data.skills.values():
+        items.sort(key=lambda item: not (_terms(item) & jd_terms))
+    return data
+
+
+def iter_job_descriptions(jd_dir: Union[str, Path]) -> Iterator[Path]:
+    """
+    Job description files in a directory, sorted by name.
+
+    Raises:
+        ValueError: If two files share a stem (e.g. acme.txt and acme.md),
+            since the stem is the job id and names its output files
+    """
+    paths = [
+        path for path in sorted(Path(jd_dir).iterdir())
+        if path.is_file() and path.suffix.lower() in JD_EXTENSIONS
+    ]
+    seen: dict[str, Path] = {}
+    for path in paths:
+        # Case-insensitive, as the output files may be on such a filesystem
+        other = seen.setdefault(path.stem.casefold(), path)
+        if other is not path:
+            raise ValueError(f"Job descriptions {other.name} and {path.name} would share the job id {path.stem!r}")
+    return iter(paths)
+
+
+def load_summary(summary_path: Union[str, Path]) -> dict[str, dict]:
+    """
+    Latest summary record per job id.
+
+    A line torn by a crash mid-write is ignored, so that job simply reruns.
+    """
+    records: dict[str, dict] = {}
+    try:
+        with open(summary_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                records[record["id"]] = record
+    except FileNotFoundError:
+        pass
+    return records
+
+
+@dataclass
+class _Job:
+    id: str
+    jd_file: Path
+    key: str
+    source: str = ""
+    pdf: bytes = b""
+    pages: int = 0
+    error: Optional[str] = None
+    started: float = field(default_factory=time.perf_counter)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def run_batch(
+    master: ResumeData,
+    jd_dir: Union[str, Path],
+    output_dir: Union[str, Path],
+    template: str = "modern",
+    tailor: Optional[Tailor] = None,
+    workers: Optional[int] = None,
+    queue_size: int = 8,
+    force: bool = False,
+    on_record: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Tailor, compile and validate the master resume for every JD in a directory.
+
+    Args:
+        master: Master resume (not modified)
+        jd_dir: Directory of .txt/.md job descriptions; the file stem is
+            the job id and names the output files, so stems must be unique
+        output_dir: Directory for {stem}.typ, {stem}.pdf and summary.jsonl
+        template: Template name
+        tailor: Function (master, jd_text) -> ResumeData; defaults to
+            tailor_for_jd (reorder only). knapsack.tailor_to_page also
+            drops the least relevant bullets to fit one page.
+        workers: Concurrent Typst compiles (default: CPU count)
+        queue_size: Capacity of each inter-stage queue
+        force: Redo jobs already recorded as done
+        on_record: Called with each summary record as it is written
+
+    Returns:
+        dict with total, skipped, ok, errors, overflow, seconds and
+        summary_file
+
+    Raises:
+        ValueError: On an unknown template or two JDs with the same stem
+    """
+    if template not in AVAILABLE_TEMPLATES:
+        raise ValueError(f"Unknown template: {template}. Available: {AVAILABLE_TEMPLATES}")
+
+    workers = workers or os.cpu_count() or 4
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary_path = output_dir / SUMMARY_FILE
+
+    master_hash = hash_bytes(json.dumps(master.to_dict(), sort_keys=True), template)
+    if tailor is not None and tailor is not tailor_for_jd:
+        # Another tailor produces different resumes from the same inputs
+        master_hash = hash_bytes(master_hash, f"{tailor.__module__}.{tailor.__qualname__}")
+    tailor = tailor or tailor_for_jd
+    done = {} if force else load_summary(summary_path)
+
+    jobs: list[_Job] = []
+    skipped = 0
+    for jd_file in iter_job_descriptions(jd_dir):
+        key = hash_bytes(master_hash, jd_file.read_bytes())
+        record = done.get(jd_file.stem)
+        if (
+            record is not None
+            and record.get("status") == "ok"
+            and record.get("key") == key
+            and (output_dir / f"{jd_file.stem}.pdf").exists()
+        ):
+            skipped += 1
+            continue
+        jobs.append(_Job(id=jd_file.stem, jd_file=jd_file, key=key))
+
+    start = time.perf_counter()
+    to_compile: "queue.Queue[Optional[_Job]]" = queue.Queue(maxsize=queue_size)
+    to_validate: "queue.Queue[Optional[_Job]]" = queue.Queue(maxsize=queue_size)
+    counts = {"ok": 0, "errors": 0, "overflow": 0}
+
+    def generate_stage() -> None:
+        try:
+            for job in jobs:
+                job.started = time.perf_counter()
+                try:
+                    data = tailor(master, job.jd_file.read_text())
+                    # Root-absolute imports: output_dir may sit at any depth
+                    job.source = anchor_imports(generate_typst(data, template), DEFAULT_SOURCE_DIR)
+                except Exception as e:
+                    job.error = f"Tailoring failed: {e}"
+                to_compile.put(job)
+        finally:
+            for _ in range(workers):
+                to_compile.put(_SENTINEL)
+
+    def compile_stage() -> None:
+        try:
+            while (job := to_compile.get()) is not _SENTINEL:
+                if job.error is None:
+                    try:
+                        success, message, job.pdf, job.pages = compile_source(job.source)
+                    except Exception as e:
+                        # A dead compile thread would stall the generate stage
+                        success, message = False, f"Compilation failed: {e}"
+                    if not success:
+                        job.error = message
+                to_validate.put(job)
+        finally:
+            to_validate.put(_SENTINEL)
+
+    def validate_stage(summary) -> None:
+        finished = 0
+        while finished < workers:
+            job = to_validate.get()
+            if job is _SENTINEL:
+                finished += 1
+                continue
+
+            record = {"id": job.id, "jd_file": str(job.jd_file), "key": job.key}
+            if job.error is None:
+                try:
+                    analysis = analyze_pdf(job.pdf)
+                    typst_path = output_dir / f"{job.id}.typ"
+                    pdf_path = output_dir / f"{job.id}.pdf"
+                    _write_atomic(typst_path, job.source.encode("utf-8"))
+                    _write_atomic(pdf_path, job.pdf)
+                except Exception as e:
+                    job.error = f"Validation failed: {e}"
+                else:
+                    record.update({
+                        "status": "ok",
+                        "pages": job.pages,
+                        "fits": job.pages <= 1,
+                        "fill_percent": analysis.fill["fill_percent"],
+                        "runts": len(analysis.runts),
+                        "typst_file": str(typst_path),
+                        "pdf_file": str(pdf_path),
+                    })
+                    counts["ok"] += 1
+                    counts["overflow"] += job.pages > 1
+
+            if job.error is not None:
+                record.update({"status": "error", "message": job.error})
+                counts["errors"] += 1
+
+            record["seconds"] = round(time.perf_counter() - job.started, 3)
+            summary.write(json.dumps(record) + "\n")
+            summary.flush()
+            if on_record is not None:
+                on_record(record)
+
+    threads = [threading.Thread(target=generate_stage, name="batch-generate", daemon=True)]
+    threads += [
+        threading.Thread(target=compile_stage, name=f"batch-compile-{i}", daemon=True)
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    with open(summary_path, "a") as summary:
+        validate_stage(summary)
+    for thread in threads:
+        thread.join()
+
+    return {
+        "total": len(jobs) + skipped,
+        "skipped": skipped,
+        **counts,
+        "seconds": round(time.perf_counter() - start, 3),
+        "summary_file": str(summary_path),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tailor a master resume for a directory of job descriptions")
+    parser.add_argument("--json", required=True, help="Path to the master resume JSON")
+    parser.add_argument("--jds", required=True, help="Directory of .txt/.md job descriptions")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--template", default="modern", help="Resume template")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent Typst compiles")
+    parser.add_argument("--force", action="store_true", help="Redo jobs already in summary.jsonl")
+    parser.add_argument(
+        "--select-bullets", action="store_true",
+        help="Keep only the bullets most relevant to each JD that fit one page (default: reorder only)",
+    )
+
+    args = parser.parse_args()
+    master = ResumeData.from_dict(json.loads(Path(args.json).read_text()))
+    result = run_batch(
+        master, args.jds, args.out, args.template,
+        tailor=tailor_to_page if args.select_bullets else None, workers=args.workers, force=args.force,
+        on_record=lambda record: print(json.dumps(record), flush=True),
+    )
+    print(json.dumps(result), file=sys.stderr)
+    sys.exit(0 if result["errors"] == 0 else 1)
@@ -0,0 +1,396 @@
+"""
+Micro-benchmarks for backend hot paths.
+
+Usage:
+    python -m backend.bench typst [--entries 40] [--bullets 8] [--repeat 200]
+    python -m backend.bench estimate [--repeat 200]
+    python -m backend.bench pipeline [--entries 40] [--bullets 8] [--repeat 200]
+    python -m backend.bench runts [--entries 40] [--bullets 8] [--repeat 200]
+    python -m backend.bench models [--entries 40] [--bullets 8] [--repeat 200]
+    python -m backend.bench personas [--entries 40] [--repeat 200]
+    python -m backend.bench keywords [--entries 40] [--bullets 8] [--repeat 200]
+    python -m backend.bench rank [--entries 40] [--bullets 8] [--jds 200]
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable
+
+from .models import ResumeData, Contact, WorkEntry, ProjectEntry, EducationEntry
+
+
+def _timeit(fn: Callable[[], object], repeat: int) -> float:
+    """Best-of-3 mean seconds per call."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def _report(label: str, baseline: float, optimized: float) -> None:
+    speedup = baseline / optimized if optimized else float("inf")
+    print(f"{label:<32} {baseline * 1e6:>10.1f}us {optimized * 1e6:>10.1f}us {speedup:>7.1f}x")
+
+
+def large_resume(entries: int = 40, bullets: int = 8) -> ResumeData:
+    """Synthetic resume with many entries and Typst-special characters."""
+    bullet = (
+        "Led a #{i} cross-functional team shipping $2M <platform> features "
+        "for @partners, improving \"completion\" by *{j}%* across markets"
+    )
+    return ResumeData(
+        contact=Contact(name="Alex Chen", email="alex@example.com", phone="415-555-8820"),
+        summary="Product leader with 8+ years building consumer and B2B products.",
+        work=[
+            WorkEntry(
+                title=f"Product Manager {i}",
+                company=f"Company {i}",
+                dates="2019.06 – 2022.02",
+                bullets=[bullet.format(i=i, j=j) for j in range(bullets)],
+                url="https://example.com",
+                description="Global marketplace",
+            )
+            for i in range(entries)
+        ],
+        projects=[
+            ProjectEntry(title=f"Project {i}", dates="2021", bullets=[bullet.format(i=i, j=0)])
+            for i in range(entries // 4)
+        ],
+        education=[EducationEntry(degree="MBA", institution="Haas", dates="2017")],
+        skills={"Tools": [f"Tool {i}" for i in range(30)]},
+    )
+
+
+def bench_typst(args: argparse.Namespace) -> None:
+    """Escaping and incremental generate_typst vs. a from-scratch render."""
+    from . import generator
+
+    data = large_resume(args.entries, args.bullets)
+    texts = [b for job in data.work for b in job.bullets]
+
+    def chained_replace() -> None:
+        # The previous implementation: one str.replace pass per character
+        for text in texts:
+            for old, new in (("\\", "\\\\"), ("#", "\\#"), ("$", "\\$"),
+                             ("@", "\\@"), ("<", "\\<"), (">", "\\>")):
+                text = text.replace(old, new)
+
+    def escape_typst() -> None:
+        # Current implementation: replace only \\ and ", and only if present
+        for text in texts:
+            generator._escape_typst(text)
+
+    def cold() -> None:
+        generator.clear_fragment_cache()
+        generator.generate_typst(data)
+
+    counter = [0]
+
+    def incremental() -> None:
+        # Typical tailoring edit: one bullet changes between renders
+        counter[0] += 1
+        data.work[0].bullets[0] = f"Edited bullet revision {counter[0]}"
+        generator.generate_typst(data)
+
+    n_bullets = len(texts)
+    print(f"Resume: {len(data.work)} jobs, {n_bullets} work bullets")
+    print(f"{'':<32} {'baseline':>12} {'optimized':>12} {'speedup':>8}")
+    _report(f"escape {n_bullets} bullets", _timeit(chained_replace, args.repeat), _timeit(escape_typst, args.repeat))
+    generator.generate_typst(data)  # Warm the fragment cache
+    _report("generate_typst (1 bullet edit)", _timeit(cold, args.repeat), _timeit(incremental, args.repeat))
+
+
+def bench_estimate(args: argparse.Namespace) -> None:
+    """Estimator speed and accuracy against real Typst compiles."""
+    import tempfile
+    from pathlib import Path
+
+    from .estimator import estimate_layout
+    from .generator import compile_and_count, generate_typst
+    from .monitor import check_page_fill
+
+    # Scratch files sit two levels below the project root so the template import resolves
+    output = Path(__file__).parent.parent / "output"
+    output.mkdir(exist_ok=True)
+
+    print(f"{'resume':<10} {'pages':>9} {'fill %':>13} {'estimate':>10} {'compile':>10}")
+    hits = total = 0
+    with tempfile.TemporaryDirectory(dir=output) as tmp:
+        for entries in range(1, 9):
+            for bullets in (2, 4, 6):
+                data = large_resume(entries, bullets)
+                est = estimate_layout(data)
+                est_time = _timeit(lambda: estimate_layout(data), args.repeat)
+
+                typst_path = Path(tmp) / "bench.typ"
+                generate_typst(data, "modern", typst_path)
+                start = time.perf_counter()
+                success, message, pages = compile_and_count(typst_path, use_cache=False)
+                compile_time = time.perf_counter() - start
+                if not success:
+                    print(message, file=sys.stderr)
+                    return
+                fill = check_page_fill(typst_path.with_suffix(".pdf"))["fill_percent"]
+
+                total += 1
+                hits += est.pages == pages
+                print(
+                    f"{entries}x{bullets:<8} {est.pages:>4}/{pages:<4} {est.fill_percent:>6.1f}/{fill:<6.1f}"
+                    f" {est_time * 1e3:>8.2f}ms {compile_time * 1e3:>8.1f}ms"
+                )
+    print(f"Page count predicted correctly for {hits}/{total} resumes")
+
+
+def bench_pipeline(args: argparse.Namespace) -> None:
+    """File-based generate/compile/check loop vs. the in-memory pipeline."""
+    import tempfile
+    from pathlib import Path
+
+    from .generator import compile_and_count, generate_typst, render_resume
+    from .monitor import check_page_fill, detect_runts
+
+    data = large_resume(args.entries, args.bullets)
+    output = Path(__file__).parent.parent / "output"
+    output.mkdir(exist_ok=True)
+    repeat = max(args.repeat // 20, 1)  # Each call runs Typst
+
+    with tempfile.TemporaryDirectory(dir=output) as tmp:
+        typst_path = Path(tmp) / "bench.typ"
+
+        def on_disk() -> None:
+            generate_typst(data, "modern", typst_path)
+            compile_and_count(typst_path, use_cache=False)
+            pdf_path = typst_path.with_suffix(".pdf")
+            detect_runts(pdf_path)
+            check_page_fill(pdf_path)
+
+        def in_memory() -> None:
+            render_resume(data, use_cache=False)
+
+        print(f"Resume: {len(data.work)} jobs, {args.bullets} bullets each")
+        print(f"{'':<32} {'baseline':>12} {'optimized':>12} {'speedup':>8}")
+        _report("generate+compile+check", _timeit(on_disk, repeat), _timeit(in_memory, repeat))
+
+
+def bench_runts(args: argparse.Namespace) -> None:
+    """Geometry-based runt detection vs. the old per-block character count."""
+    import re
+
+    from .generator import render_resume
+    from .layout import extract_layout
+    from .monitor import detect_runts
+
+    data = large_resume(args.entries, args.bullets)
+    layout = extract_layout(render_resume(data)["pdf"])
+
+    def char_count() -> list[str]:
+        # The previous implementation: last line of each block under 15 chars
+        runts = []
+        for block in range(len(layout.block_x0)):
+            if not layout.block_is_text[block]:
+                continue
+            last = layout.block_text(block).strip().split("\n")[-1].strip()
+            if 0 < len(last) <= 15 and not re.match(r"^\d{4}\s*[\u2013\-]\s*(Present|\d{4})$", last):
+                runts.append(last)
+        return runts
+
+    print(f"Layout: {layout.page_count} pages, {layout.line_count} lines")
+    print(f"Runts found: {len(char_count())} by char count, {len(detect_runts(layout))} by geometry")
+    print(f"{'':<32} {'baseline':>12} {'optimized':>12} {'speedup':>8}")
+    _report("detect_runts", _timeit(char_count, args.repeat), _timeit(lambda: detect_runts(layout), args.repeat))
+
+
+def bench_models(args: argparse.Namespace) -> None:
+    """Hand-written to_dict/from_dict vs. dataclasses.asdict and **kwargs."""
+    import dataclasses
+
+    data = large_resume(args.entries, args.bullets)
+    raw = data.to_dict()
+
+    def kwargs_from_dict() -> ResumeData:
+        # The previous implementation: no type checks, opaque TypeErrors
+        return ResumeData(
+            contact=Contact(**raw["contact"]),
+            work=[WorkEntry(**w) for w in raw["work"]],
+            projects=[ProjectEntry(**p) for p in raw["projects"]],
+            education=[EducationEntry(**e) for e in raw["education"]],
+            skills=raw["skills"],
+            summary=raw["summary"],
+        )
+
+    print(f"Resume: {len(data.work)} jobs, {args.bullets} bullets each")
+    print(f"{'':<32} {'baseline':>12} {'optimized':>12} {'speedup':>8}")
+    _report("to_dict", _timeit(lambda: dataclasses.asdict(data), args.repeat), _timeit(data.to_dict, args.repeat))
+    _report(
+        "from_dict (validating)",
+        _timeit(kwargs_from_dict, args.repeat),
+        _timeit(lambda: ResumeData.from_dict(raw), args.repeat),
+    )
+
+
+def bench_personas(args: argparse.Namespace) -> None:
+    """Indexed list_personas/get_persona vs. a full directory scan."""
+    import tempfile
+    from pathlib import Path
+
+    import yaml
+
+    from . import ingest
+
+    with tempfile.TemporaryDirectory() as tmp:
+        personas_dir = Path(tmp)
+        count = args.entries * 5
+        for i in range(count):
+            persona_dir = personas_dir / f"persona{i}"
+            persona_dir.mkdir()
+            for role in ("pm", "eng"):
+                (persona_dir / f"persona{i}_{role}_master_resume.typ").write_text("")
+            (persona_dir / "config.yaml").write_text(yaml.safe_dump({
+                "name": f"Persona {i}", "preferred_name": "P", "default_role": "pm",
+                "has_career_profile": False,
+            }))
+
+        def full_scan() -> list[dict]:
+            # The previous implementation: glob + pure-Python YAML per persona
+            personas = []
+            for persona_dir in personas_dir.iterdir():
+                if not persona_dir.is_dir():
+                    continue
+                roles = [f.stem.split("_")[-3] for f in persona_dir.glob("*_master_resume.typ")]
+                with open(persona_dir / "config.yaml") as f:
+                    config = yaml.safe_load(f) or {}
+                personas.append({"name": persona_dir.name, "roles": roles, **config})
+            return personas
+
+        ingest.list_personas(personas_dir)  # Build the index
+        repeat = max(args.repeat // 20, 1)
+        print(f"Personas: {count}")
+        print(f"{'':<32} {'baseline':>12} {'optimized':>12} {'speedup':>8}")
+        scan = _timeit(full_scan, repeat)
+        _report("list_personas", scan, _timeit(lambda: ingest.list_personas(personas_dir), repeat))
+        _report("get_persona", scan, _timeit(lambda: ingest.get_persona("persona7", personas_dir), args.repeat))
+
+
+def bench_keywords(args: argparse.Namespace) -> None:
+    """Compiled keyword matcher and batch scoring vs. one regex per keyword."""
+    import re
+
+    from .keywords import KeywordMatcher, _segments, normalize, parse_keywords, score_alignment, score_batch
+
+    data = large_resume(args.entries, args.bullets)
+    vocabulary = (
+        "cross-functional platform features partners completion markets product roadmap SQL Jira "
+        "A/B testing stakeholder management healthcare machine learning OKRs PRD go-to-market "
+        "user research B2B SaaS Figma Tableau Excel agile discovery pricing onboarding retention"
+    ).split()
+    lists = [
+        parse_keywords({
+            "high": vocabulary[i % 7::7][:6],
+            "med": vocabulary[(i + 3) % 5::5][:5],
+            "low": vocabulary[(i + 1) % 4::4][:4],
+        })
+        for i in range(50)
+    ]
+
+    def per_keyword(keywords) -> int:
+        # Straightforward approach: normalize each segment, one search per keyword form
+        texts = [normalize(text) for _, text in _segments(data)]
+        matched = 0
+        for keyword in keywords:
+            patterns = [re.compile(r"(?<!\S)" + re.escape(form) + r"(?!\S)") for form in keyword.forms()]
+            matched += any(p.search(text) for p in patterns for text in texts)
+        return matched
+
+    matcher = KeywordMatcher(lists[0])
+    repeat = max(args.repeat // 10, 1)
+    print(f"Bullets: {sum(len(e.bullets) for e in data.work)}, keyword lists: {len(lists)}")
+    print(f"{'':<32} {'baseline':>12} {'optimized':>12} {'speedup':>8}")
+    _report("one list", _timeit(lambda: per_keyword(lists[0]), args.repeat),
+            _timeit(lambda: matcher.score(data), args.repeat))
+    _report(f"{len(lists)} lists", _timeit(lambda: [score_alignment(data, k) for k in lists], repeat),
+            _timeit(lambda: score_batch(data, lists), repeat))
+
+
+def bench_rank(args: argparse.Namespace) -> None:
+    """Matrix BM25 over bullets × JDs vs. a pure-Python inverted index."""
+    import math
+    import random
+    from collections import Counter
+
+    import numpy as np
+
+    from .keywords import normalize
+    from .rank import BulletIndex
+
+    rng = random.Random(0)
+    words = [f"term{i}" for i in range(5000)]
+    weights = [1 / (i + 1) for i in range(len(words))]  # Zipf-like, as in real text
+
+    def text(length: int) -> str:
+        return " ".join(rng.choices(words, weights, k=length))
+
+    # Ten times the usual resume, so bullets number in the thousands
+    data = large_resume(args.entries * 10, args.bullets)
+    for entry in data.work:
+        entry.bullets = [text(rng.randint(15, 35)) for _ in entry.bullets]
+    jds = [text(400) for _ in range(args.jds)]
+    bullets = sum(len(entry.bullets) for entry in data.work + data.projects)
+
+    def python_bm25() -> list[list[int]]:
+        docs = [Counter(normalize(b).split()) for entry in data.work + data.projects for b in entry.bullets]
+        lengths = [sum(doc.values()) for doc in docs]
+        avg = sum(lengths) / len(docs)
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for i, doc in enumerate(docs):
+            for term, tf in doc.items():
+                postings.setdefault(term, []).append((i, tf))
+        rankings = []
+        for jd in jds:
+            scores = [0.0] * len(docs)
+            for term, qtf in Counter(normalize(jd).split()).items():
+                hits = postings.get(term, ())
+                idf = math.log(1 + (len(docs) - len(hits) + 0.5) / (len(hits) + 0.5))
+                for i, tf in hits:
+                    scores[i] += qtf * idf * tf * 2.2 / (tf + 1.2 * (0.25 + 0.75 * lengths[i] / avg))
+            rankings.append(sorted(range(len(docs)), key=scores.__getitem__, reverse=True))
+        return rankings
+
+    def matrix_bm25() -> np.ndarray:
+        index = BulletIndex.build(data)
+        return np.argsort(-index.scores(jds), axis=1, kind="stable")
+
+    index = BulletIndex.build(data)
+    print(f"Bullets: {bullets}, JDs: {len(jds)}, vocabulary: {len(index.vocab)}")
+    print(f"{'':<32} {'baseline':>12} {'optimized':>12} {'speedup':>8}")
+    _report("index + rank all JDs", _timeit(python_bm25, 1), _timeit(matrix_bm25, 1))
+    _report("rank all JDs (cached index)", _timeit(python_bm25, 1),
+            _timeit(lambda: np.argsort(-index.scores(jds), axis=1), 1))
+
+
+BENCHMARKS = {
+    "typst": bench_typst,
+    "estimate": bench_estimate,
+    "pipeline": bench_pipeline,
+    "runts": bench_runts,
+    "models": bench_models,
+    "personas": bench_personas,
+    "keywords": bench_keywords,
+    "rank": bench_rank,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backend micro-benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--entries", type=int, default=40, help="Work entries in the synthetic resume")
+    parser.add_argument("--bullets", type=int, default=8, help="Bullets per work entry")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per timing run")
+    parser.add_argument("--jds", type=int, default=200, help="Job descriptions to rank against")
+
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args)
+    sys.exit(0)
@@ -0,0 +1,471 @@
+"""
+Content-addressed on-disk caches.
+
+Entries are plain files named by their key (a SHA-256 hex digest) under a
+cache directory. Recency is tracked with the file mtime, which is bumped on
+every hit, so eviction is least-recently-used and survives restarts. Writes
+are atomic (temp file + rename), so several processes can share one cache.
+Hit, miss and eviction counts are totalled across processes in
+stats.json in the cache directory. Lookups only bump in-memory counters;
+each process adds its unflushed counts to the file (under a file lock)
+every STATS_FLUSH_EVERY lookups, when stats() is called and at exit.
+
+Two caches are provided:
+    - ExtractionCache: extracted resume text (backend.extractors)
+    - CompileCache: compiled PDFs and their page counts (backend.generator)
+
+Usage:
+    from backend.cache import get_extraction_cache
+
+    cache = get_extraction_cache()
+    print(cache.stats())
+    cache.clear()
+
+    python -m backend.cache stats
+    python -m backend.cache clear compile
+    python -m backend.cache prune
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from multiprocessing import util as mp_util
+from pathlib import Path
+from typing import Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: counters are still updated atomically, but racing updates may be lost
+    fcntl = None
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Override with MYRIAD_CACHE_DIR to share a cache between checkouts
+CACHE_ROOT = Path(os.environ.get("MYRIAD_CACHE_DIR", PROJECT_ROOT / ".cache"))
+
+DEFAULT_EXTRACTION_CACHE_BYTES = 256 * 1024 * 1024
+
+# Eviction policy for the compile cache; tune on shared build boxes
+COMPILE_CACHE_BYTES = int(os.environ.get("MYRIAD_COMPILE_CACHE_BYTES", 512 * 1024 * 1024))
+COMPILE_CACHE_MAX_AGE = float(os.environ.get("MYRIAD_COMPILE_CACHE_MAX_AGE", 7 * 24 * 3600))
+
+# Persistent counters, next to the entry subdirectories
+STATS_FILE = "stats.json"
+STATS_LOCK_FILE = ".stats.lock"
+_STAT_COUNTERS = ("hits", "misses", "evictions")
+
+# Lookups between flushes of a process's counters to stats.json
+STATS_FLUSH_EVERY = 256
+
+_IMPORT_RE = re.compile(r'#(?:import|include)\s+"([^"]+)"')
+
+
+def hash_bytes(*parts: Union[bytes, str]) -> str:
+    """SHA-256 hex digest over one or more byte/str parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def hash_file(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Every DiskCache in this process, for flushing counters at exit and fork
+_live_caches: "weakref.WeakSet[DiskCache]" = weakref.WeakSet()
+
+
+def _flush_all_stats() -> None:
+    for cache in list(_live_caches):
+        cache.flush_stats()
+
+
+def _forget_all_unflushed() -> None:
+    for cache in list(_live_caches):
+        cache._forget_unflushed()
+
+
+# multiprocessing runs its finalizers at interpreter exit and, unlike
+# atexit handlers, also when a pool worker process exits
+mp_util.Finalize(None, _flush_all_stats, exitpriority=0)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_all_unflushed)
+
+
+class DiskCache:
+    """
+    Size-bounded LRU cache of byte blobs stored as files.
+
+    Args:
+        directory: Cache directory (created on first write)
+        max_bytes: Total size cap; least-recently-used entries are evicted
+        max_age: Drop entries unused for this many seconds (None: never)
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int, max_age: Optional[float] = None):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        # Counts for this process; stats() reports the persisted totals
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._flushed = dict.fromkeys(_STAT_COUNTERS, 0)
+        self._next_flush = STATS_FLUSH_EVERY
+        self._size: Optional[int] = None
+        self._stats_lock = threading.Lock()
+        _live_caches.add(self)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """All entries as (mtime, size, path)."""
+        entries = []
+        if not self.directory.exists():
+            return entries
+        for path in self.directory.glob("??/*"):
+            if path.name.startswith("."):
+                continue  # In-flight temp file
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue  # Evicted by another process
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value, or None on a miss."""
+        path = self._path(key)
+        try:
+            if self.max_age is not None and time.time() - path.stat().st_mtime > self.max_age:
+                self.invalidate(key)
+                raise FileNotFoundError(path)
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            if self.misses + self.hits >= self._next_flush:
+                self.flush_stats()
+            return None
+
+        self.hits += 1
+        if self.misses + self.hits >= self._next_flush:
+            self.flush_stats()
+        try:
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            pass
+        return data
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store a value, evicting old entries if over the size cap."""
+        if len(value) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            replaced = path.stat().st_size  # Overwriting: that size is freed
+        except FileNotFoundError:
+            replaced = 0
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += len(value) - replaced
+
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> int:
+        """
+        Drop expired entries, then least-recently-used ones until under
+        the size cap. Returns the number removed.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        cutoff = time.time() - self.max_age if self.max_age is not None else None
+        removed = 0
+
+        for mtime, size, path in entries:
+            expired = cutoff is not None and mtime < cutoff
+            if not expired and total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        self.evictions += removed
+        self._size = total
+        return removed
+
+    def prune(self) -> int:
+        """Apply the eviction policy now. Returns the number of entries removed."""
+        return self._evict()
+
+    def invalidate(self, key: str) -> bool:
+        """Remove one entry. Returns True if it existed."""
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        if self._size is not None:
+            self._size -= size
+        return True
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number removed."""
+        removed = 0
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+            removed += 1
+        self._size = 0
+        return removed
+
+    def _read_counters(self) -> dict[str, int]:
+        counters = dict.fromkeys(_STAT_COUNTERS, 0)
+        try:
+            loaded = json.loads((self.directory / STATS_FILE).read_text())
+            counters.update({name: int(loaded.get(name, 0)) for name in _STAT_COUNTERS})
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass  # Missing or torn: start from zero
+        return counters
+
+    def __del__(self):
+        # Short-lived instances would otherwise drop their counts
+        self.flush_stats()
+
+    def _forget_unflushed(self) -> None:
+        """In a forked child: the parent flushes the counts inherited from it."""
+        self._flushed = {name: getattr(self, name) for name in _STAT_COUNTERS}
+        self._stats_lock = threading.Lock()
+
+    def flush_stats(self) -> None:
+        """Add this process's counts since the last flush to stats.json."""
+        with self._stats_lock:
+            current = {name: getattr(self, name) for name in _STAT_COUNTERS}
+            self._next_flush = current["hits"] + current["misses"] + STATS_FLUSH_EVERY
+            deltas = {name: current[name] - self._flushed[name] for name in _STAT_COUNTERS}
+            if not any(deltas.values()):
+                return
+            try:
+                self._write_counters(deltas)
+            except OSError:
+                return  # Statistics are best effort; keep the counts for the next flush
+            self._flushed = current
+
+    def _write_counters(self, deltas: dict[str, int]) -> None:
+        """Add to the persisted counters (read-modify-write under a file lock)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / STATS_LOCK_FILE, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            counters = self._read_counters()
+            for name, delta in deltas.items():
+                counters[name] += delta
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".stats-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(counters, f)
+                os.replace(tmp, self.directory / STATS_FILE)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+
+    def stats(self) -> dict:
+        """Hit/miss counters across all processes plus current disk usage."""
+        self.flush_stats()
+        entries = self._entries()
+        self._size = sum(size for _, size, _ in entries)
+        counters = self._read_counters()
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "directory": str(self.directory),
+            "entries": len(entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "max_age": self.max_age,
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "hit_rate": round(counters["hits"] / lookups, 3) if lookups else 0.0,
+            "evictions": counters["evictions"],
+        }
+
+
+class ExtractionCache(DiskCache):
+    """
+    Cache of extracted resume text keyed by file content and extractor version.
+
+    A repeat extraction of an unchanged file costs one hash and one read.
+    """
+
+    def key_for(self, file_path: Union[str, Path], version: str) -> str:
+        path = Path(file_path)
+        return hash_bytes(hash_file(path), path.suffix.lower(), version)
+
+    def get_text(self, key: str) -> Optional[str]:
+        data = self.get(key)
+        return data.decode("utf-8") if data is not None else None
+
+    def put_text(self, key: str, text: str) -> None:
+        self.put(key, text.encode("utf-8"))
+
+
+def _import_refs(text: str, base: Path, root: Path) -> list[Path]:
+    """Resolved local paths imported or included by Typst source text."""
+    refs = []
+    for ref in _IMPORT_RE.findall(text):
+        if ref.startswith("@"):
+            continue
+        dep = (root / ref.lstrip("/")) if ref.startswith("/") else (base / ref)
+        refs.append(dep.resolve())
+    return refs
+
+
+def typst_dependencies(
+    typst_path: Union[str, Path, None],
+    root: Union[str, Path] = PROJECT_ROOT,
+    source: Optional[str] = None,
+) -> list[Path]:
+    """
+    Files a .typ file imports or includes, recursively.
+
+    Relative paths resolve against the importing file; absolute ones
+    against the Typst root. Package imports (@preview/...) are skipped.
+    Pass `source` to scan in-memory text instead of typst_path; its
+    relative imports then resolve against typst_path's directory, or the
+    root if typst_path is None (as Typst does for stdin input).
+    """
+    root = Path(root).resolve()
+    seen: set[Path] = set()
+    deps = []
+    if source is None:
+        pending = [Path(typst_path).resolve()]
+    else:
+        base = Path(typst_path).resolve().parent if typst_path else root
+        pending = _import_refs(source, base, root)
+        seen.update(pending)
+        deps.extend(pending)
+
+    while pending:
+        current = pending.pop()
+        try:
+            text = current.read_text()
+        except (FileNotFoundError, UnicodeDecodeError):
+            continue
+        for dep in _import_refs(text, current.parent, root):
+            if dep not in seen:
+                seen.add(dep)
+                deps.append(dep)
+                pending.append(dep)
+
+    return sorted(deps)
+
+
+class CompileCache(DiskCache):
+    """
+    Cache of compiled PDFs keyed on Typst source, its imported templates
+    and the Typst version. Each entry stores the PDF plus its page count.
+    """
+
+    def key_for(self, typst_path: Union[str, Path], typst_version: str) -> str:
+        typst_path = Path(typst_path)
+        return self._key(typst_version, typst_path.read_bytes(), typst_dependencies(typst_path))
+
+    def key_for_source(self, source: str, typst_version: str) -> str:
+        """Key for in-memory source compiled from stdin (imports resolve against the root)."""
+        return self._key(typst_version, source.encode("utf-8"), typst_dependencies(None, source=source))
+
+    @staticmethod
+    def _key(typst_version: str, source: bytes, deps: list[Path]) -> str:
+        root = PROJECT_ROOT.resolve()
+        parts: list[Union[bytes, str]] = [typst_version, source]
+        for dep in deps:
+            # Root-relative names keep keys stable across checkouts
+            parts.append(str(dep.relative_to(root)) if dep.is_relative_to(root) else str(dep))
+            parts.append(dep.read_bytes() if dep.exists() else b"")
+        return hash_bytes(*parts)
+
+    def get_pdf(self, key: str) -> Optional[tuple[bytes, int]]:
+        """Return (pdf_bytes, page_count) on a hit."""
+        data = self.get(key)
+        if data is None:
+            return None
+        return data[4:], int.from_bytes(data[:4], "little")
+
+    def put_pdf(self, key: str, pdf: bytes, page_count: int) -> None:
+        self.put(key, page_count.to_bytes(4, "little") + pdf)
+
+
+_extraction_cache: Optional[ExtractionCache] = None
+_compile_cache: Optional[CompileCache] = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Process-wide extraction cache under CACHE_ROOT/extract."""
+    global _extraction_cache
+    if _extraction_cache is None:
+        _extraction_cache = ExtractionCache(
+            CACHE_ROOT / "extract", DEFAULT_EXTRACTION_CACHE_BYTES
+        )
+    return _extraction_cache
+
+
+def get_compile_cache() -> CompileCache:
+    """Process-wide compile cache under CACHE_ROOT/compile."""
+    global _compile_cache
+    if _compile_cache is None:
+        _compile_cache = CompileCache(
+            CACHE_ROOT / "compile", COMPILE_CACHE_BYTES, COMPILE_CACHE_MAX_AGE
+        )
+    return _compile_cache
+
+
+if __name__ == "__main__":
+    caches = {"extract": get_extraction_cache, "compile": get_compile_cache}
+    usage = "Usage: python -m backend.cache {stats|clear|prune} [extract|compile]"
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ("stats", "clear", "prune"):
+        print(usage)
+        sys.exit(1)
+
+    command = sys.argv[1]
+    names = sys.argv[2:] or list(caches)
+    if not set(names) <= caches.keys():
+        print(usage)
+        sys.exit(1)
+    for name in names:
+        cache = caches[name]()
+        if command == "stats":
+            print(json.dumps({name: cache.stats()}))
+        elif command == "clear":
+            print(f"{name}: cleared {cache.clear()} entries")
+        else:
+            print(f"{name}: pruned {cache.prune()} entries")
@@ -0,0 +1,172 @@
+"""
+Thin command-line client for the local job service (backend.service).
+
+Standard library only and free of package imports, so running it as a
+script costs interpreter startup and nothing else:
+
+    python backend/client.py compile_pdf typst_path=resume.typ output_path=resume.pdf
+    python backend/client.py check_page_count pdf_path=resume.pdf
+    python backend/client.py detect_runts pdf_path=resume.pdf max_ratio=0.25
+    python backend/client.py generate_typst json_path=resume.json output_path=resume.typ
+    python backend/client.py health
+
+Parameters are key=value pairs; values that parse as JSON (numbers,
+objects, true/false) are sent as such, anything else as a string. Use
+key=@file.json to send a file's JSON content. Relative file parameters
+(json_path, typst_path, pdf_path, output_path) are resolved against the
+current directory before sending.
+
+If the service is not running, the request is run in-process instead
+(paying the usual imports), unless --no-fallback is given. The result is
+printed as JSON. Exit codes: 0 on success, 1 if the job ran but failed
+(e.g. a compile error, or more pages than --max-pages), 2 if the request
+was rejected or its connection was lost.
+"""
+
+import http.client
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+
+# File parameters (as backend.service.PATH_PARAMS); the service needs them absolute
+PATH_PARAMS = ("json_path", "typst_path", "pdf_path", "output_path")
+
+DEFAULT_URL = os.environ.get(
+    "MYRIAD_SERVICE_URL", f"http://127.0.0.1:{os.environ.get('MYRIAD_SERVICE_PORT', '8765')}"
+)
+
+
+class ServiceError(RuntimeError):
+    """The service rejected a request; status is its HTTP status."""
+
+    def __init__(self, status: int, payload: dict):
+        self.status = status
+        self.payload = payload
+        super().__init__(payload.get("error", f"HTTP {status}"))
+
+
+def call(
+    method: str,
+    params: Optional[dict] = None,
+    priority: Optional[int] = None,
+    url: str = DEFAULT_URL,
+    timeout: float = 300.0,
+) -> dict:
+    """
+    Run one endpoint on the service and return its result.
+
+    Raises:
+        ServiceError: On a 4xx/5xx response (503: queue full, retry later)
+        urllib.error.URLError: If the service is unreachable
+        http.client.HTTPException, OSError: If the connection drops or
+            times out after the request was sent
+    """
+    payload = absolute_paths(params or {})
+    if priority is not None:
+        payload["priority"] = priority
+    if method == "health":
+        request = urllib.request.Request(f"{url}/health")
+    else:
+        request = urllib.request.Request(
+            f"{url}/{method}",
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        try:
+            body = json.loads(e.read())
+        except ValueError:
+            body = {"error": str(e)}
+        raise ServiceError(e.code, body) from None
+
+
+def call_local(method: str, params: Optional[dict] = None) -> dict:
+    """Run an endpoint in this process, as the service would."""
+    import asyncio
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from backend.models import ResumeValidationError
+    from backend.service import ENDPOINTS, RequestError
+
+    if method not in ENDPOINTS:
+        raise ServiceError(404, {"error": f"Unknown endpoint: /{method}", "endpoints": sorted(ENDPOINTS)})
+    try:
+        return asyncio.run(ENDPOINTS[method](absolute_paths(params or {})))
+    except ResumeValidationError as e:
+        raise ServiceError(400, {"error": "Invalid resume data", "errors": e.errors}) from None
+    except RequestError as e:
+        raise ServiceError(400, {"error": str(e)}) from None
+
+
+def absolute_paths(params: dict) -> dict:
+    """Copy of params with file parameters resolved against this process's cwd."""
+    return {
+        key: str(Path(value).resolve()) if key in PATH_PARAMS and isinstance(value, str) else value
+        for key, value in params.items()
+    }
+
+
+def parse_params(pairs: list[str]) -> dict:
+    """key=value arguments as a params dict."""
+    params = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"Expected key=value, got: {pair}")
+        if value.startswith("@"):
+            params[key] = json.loads(Path(value[1:]).read_text())
+            continue
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    return params
+
+
+def _failed(result: dict, max_pages: Optional[int]) -> bool:
+    if result.get("success") is False:
+        return True
+    return max_pages is not None and result.get("pages", 0) > max_pages
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Call the local job service (python -m backend.service)")
+    parser.add_argument("method", help="Endpoint, e.g. compile_pdf, check_page_count, detect_runts, health")
+    parser.add_argument("params", nargs="*", help="key=value parameters")
+    parser.add_argument("--priority", type=int, default=None, help="Lower runs first")
+    parser.add_argument("--url", default=DEFAULT_URL, help="Service URL")
+    parser.add_argument("--max-pages", type=int, default=None, help="Exit 1 if the result has more pages")
+    parser.add_argument("--no-fallback", action="store_true", help="Fail instead of running in-process")
+
+    args = parser.parse_args()
+    try:
+        params = parse_params(args.params)
+        try:
+            result = call(args.method, params, args.priority, args.url)
+        except urllib.error.URLError:
+            if args.no_fallback or args.method == "health":
+                raise ServiceError(503, {"error": f"Service not reachable at {args.url}"})
+            result = call_local(args.method, params)
+    except (http.client.HTTPException, OSError) as e:
+        # Reached the service but lost the response (reset, timeout)
+        print(json.dumps({"status": "error", "error": f"{type(e).__name__}: {e}"}, indent=2), file=sys.stderr)
+        sys.exit(2)
+    except ServiceError as e:
+        print(json.dumps({"status": "error", **e.payload}, indent=2), file=sys.stderr)
+        sys.exit(2)
+    except ValueError as e:
+        print(json.dumps({"status": "error", "error": str(e)}, indent=2), file=sys.stderr)
+        sys.exit(2)
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    sys.exit(1 if _failed(result, args.max_pages) else 0)
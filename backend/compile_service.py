@@ -0,0 +1,318 @@
+"""
+Warm Typst compile service.
+
+Each `typst compile` pays process startup, font discovery and template
+parsing. This service instead keeps long-lived `typst watch` workers, each
+watching its own scratch file, and dispatches compile jobs to them: a job
+atomically replaces the scratch file, waits for the worker's "compiled"
+status line and copies the PDF to the requested output path.
+
+Scratch files live next to the job's .typ file so relative template imports
+resolve exactly as they would for a one-shot compile. Workers are bound to
+a directory and recycled into another one when the pool is full.
+
+Usage:
+    from backend.compile_service import CompileService, set_compile_service
+
+    with CompileService(max_workers=4) as service:
+        set_compile_service(service)   # compile_pdf() now uses the pool
+        ...
+
+Setting MYRIAD_TYPST_WORKERS=N enables a process-wide service on first use.
+"""
+
+import atexit
+import os
+import queue
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+
+DEFAULT_TIMEOUT = 60.0
+
+# e.g. "[12:00:01] compiled successfully in 12.34ms" / "compiled with errors"
+_STATUS_RE = re.compile(r"compiled (successfully|with warnings|with errors)")
+
+# How long to keep collecting diagnostics after an error status line
+_DIAGNOSTIC_GRACE = 0.1
+
+
+class CompileQueueFull(RuntimeError):
+    """Raised when the service's bounded job queue is full."""
+
+
+class TypstWorker:
+    """
+    One `typst watch` process compiling a scratch file in a fixed directory.
+
+    Not thread-safe: the service hands a worker to one job at a time.
+    """
+
+    def __init__(self, directory: Path, index: int, root: Path = PROJECT_ROOT):
+        self.directory = directory
+        self.root = root
+        self.source = directory / f".typst-worker-{os.getpid()}-{index}.typ"
+        self.output = self.source.with_suffix(".pdf")
+        self._job = 0
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self) -> None:
+        self._lines = queue.Queue()
+        self._proc = subprocess.Popen(
+            ["typst", "watch", "--root", str(self.root), str(self.source), str(self.output)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=self.root,
+        )
+        threading.Thread(target=self._read_stderr, args=(self._proc, self._lines), daemon=True).start()
+
+    @staticmethod
+    def _read_stderr(proc: subprocess.Popen, lines: "queue.Queue[Optional[str]]") -> None:
+        for line in proc.stderr:
+            lines.put(line.rstrip("\n"))
+        lines.put(None)  # EOF: the process exited
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                self._lines.get_nowait()
+            except queue.Empty:
+                return
+
+    def compile(self, content: str, output_path: Path, timeout: float) -> tuple[bool, str]:
+        """Compile Typst source to output_path. Returns (success, message)."""
+        self._job += 1
+        # A per-job marker guarantees the watcher sees a content change
+        payload = f"{content}\n// typst-worker job {self._job}\n"
+
+        if self.alive:
+            self._drain()  # Discard status lines from earlier jobs
+            self._write_source(payload)
+        else:
+            self._write_source(payload)
+            self._start()
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.stop()
+                return False, f"Compilation timed out after {timeout:.0f}s"
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if line is None:
+                self._proc = None
+                return False, "Compilation failed: typst watch exited unexpectedly"
+
+            status = _STATUS_RE.search(line)
+            if status is None:
+                continue
+            if status.group(1) != "with errors":
+                break
+            return False, f"Compilation failed: {self._collect_diagnostics()}"
+
+        shutil.copyfile(self.output, output_path)
+        return True, f"PDF generated: {output_path}"
+
+    def _write_source(self, payload: str) -> None:
+        # Replace rather than truncate, so the watcher never reads a
+        # half-written file and compiles it
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f"{self.source.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            os.replace(tmp, self.source)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _collect_diagnostics(self) -> str:
+        lines = []
+        while True:
+            try:
+                line = self._lines.get(timeout=_DIAGNOSTIC_GRACE)
+            except queue.Empty:
+                break
+            if line is None or _STATUS_RE.search(line):
+                break
+            lines.append(line)
+        return "\n".join(lines).strip() or "unknown error"
+
+    def stop(self) -> None:
+        """Terminate the watcher and remove its scratch files."""
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+        self.source.unlink(missing_ok=True)
+        self.output.unlink(missing_ok=True)
+
+
+class CompileService:
+    """
+    Pool of warm Typst workers with a bounded job queue.
+
+    Args:
+        max_workers: Concurrent compiles (and live `typst watch` processes)
+        max_queue: Jobs allowed to wait beyond those running; submit()
+            raises CompileQueueFull past that
+        timeout: Default per-job timeout in seconds
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 32, timeout: float = DEFAULT_TIMEOUT):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="typst-worker")
+        self._lock = threading.Lock()
+        self._idle: list[TypstWorker] = []
+        self._busy = 0
+        self._next_index = 0
+        self._closed = False
+        self.compiles = 0
+
+    def submit(
+        self,
+        typst_path: Union[str, Path],
+        output_path: Union[str, Path, None] = None,
+        timeout: Optional[float] = None,
+    ) -> "Future[tuple[bool, str]]":
+        """
+        Queue a compile job without blocking.
+
+        Raises:
+            CompileQueueFull: If max_workers + max_queue jobs are pending
+        """
+        if self._closed:
+            raise RuntimeError("CompileService is closed")
+        if not self._slots.acquire(blocking=False):
+            raise CompileQueueFull("Typst compile queue is full")
+
+        typst_path = Path(typst_path).resolve()
+        output_path = Path(output_path).resolve() if output_path else typst_path.with_suffix(".pdf")
+        future = self._executor.submit(self._run, typst_path, output_path, timeout or self.timeout)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def compile(
+        self,
+        typst_path: Union[str, Path],
+        output_path: Union[str, Path, None] = None,
+        timeout: Optional[float] = None,
+    ) -> tuple[bool, str]:
+        """Compile and wait. Same contract as generator.compile_pdf."""
+        return self.submit(typst_path, output_path, timeout).result()
+
+    def _acquire(self, directory: Path) -> TypstWorker:
+        with self._lock:
+            self._busy += 1
+            for i, worker in enumerate(self._idle):
+                if worker.directory == directory:
+                    return self._idle.pop(i)
+
+            # The executor caps running jobs at max_workers, so when the pool
+            # is full at least one worker is idle in another directory
+            if self._busy - 1 + len(self._idle) >= self.max_workers and self._idle:
+                self._idle.pop(0).stop()
+
+            self._next_index += 1
+            return TypstWorker(directory, self._next_index)
+
+    def _release(self, worker: TypstWorker) -> None:
+        with self._lock:
+            if self._closed or not worker.alive:
+                worker.stop()
+            else:
+                self._idle.append(worker)
+
+    def _run(self, typst_path: Path, output_path: Path, timeout: float) -> tuple[bool, str]:
+        try:
+            content = typst_path.read_text()
+        except FileNotFoundError:
+            return False, f"Compilation failed: file not found: {typst_path}"
+
+        worker = self._acquire(typst_path.parent)
+        try:
+            success, message = worker.compile(content, output_path, timeout)
+        except FileNotFoundError:
+            worker.stop()
+            return False, "Typst not installed. Install with: brew install typst"
+        finally:
+            with self._lock:
+                self._busy -= 1
+            self._release(worker)
+
+        if success:
+            with self._lock:
+                self.compiles += 1
+        return success, message
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "busy": self._busy,
+                "idle": len(self._idle),
+                "compiles": self.compiles,
+            }
+
+    def close(self) -> None:
+        """Wait for running jobs, then stop every worker."""
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for worker in self._idle:
+                worker.stop()
+            self._idle.clear()
+
+    def __enter__(self) -> "CompileService":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_service: Optional[CompileService] = None
+_service_lock = threading.Lock()
+
+
+def set_compile_service(service: Optional[CompileService]) -> None:
+    """Route compile_pdf() through a service (None restores subprocess mode)."""
+    global _service
+    with _service_lock:
+        _service = service
+
+
+def get_compile_service() -> Optional[CompileService]:
+    """
+    The active compile service, if any.
+
+    If none was set and MYRIAD_TYPST_WORKERS is a positive integer, a
+    process-wide service with that many workers is created on first use.
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            workers = int(os.environ.get("MYRIAD_TYPST_WORKERS", "0") or 0)
+            if workers > 0:
+                _service = CompileService(max_workers=workers)
+                atexit.register(_service.close)
+        return _service
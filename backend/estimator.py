@@ -0,0 +1,226 @@
+"""
+Font-metric layout estimator.
+
+Predicts how a ResumeData will lay out in typst/templates/modern.typ without
+running Typst: each bullet is word-wrapped against its column width using
+font metrics, and the vertical stack of name, headings, entry headers and
+bullets is summed with the template's sizes, leading and spacing. This
+flags likely overflow and runts in milliseconds, so Typst only needs to run
+once the estimate says a resume fits.
+
+Myriad Pro is not shipped with the repo, so glyph widths come from the
+Helvetica metrics built into PyMuPDF scaled by WIDTH_SCALE. Accuracy against
+real compiles is measured by `python -m backend.bench estimate`.
+
+Usage:
+    from backend.estimator import estimate_layout
+
+    est = estimate_layout(data)
+    if est.overflow:
+        ...
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+
+import fitz  # PyMuPDF
+
+from .generator import LAYOUT_DEFAULTS
+from .models import ResumeData
+from .monitor import RUNT_RATIO
+
+
+# --- Template metrics (typst/templates/modern.typ) ---
+
+PAGE_WIDTH = 595.28   # A4, pt
+PAGE_HEIGHT = 841.89
+
+BODY_SIZE = 10.0
+NAME_SIZE = 20.0
+HEADING_SIZE = 14.0
+ENTRY_SIZE = 11.0
+
+NAME_STRETCH = 0.875
+ENTRY_STRETCH = 0.875
+
+MAIN_PAD_LEFT = 20.0
+MAIN_PAD_RIGHT = 15.0
+LIST_BODY_INDENT = 8.0
+LIST_MARKER_WIDTH = 0.35 * BODY_SIZE
+
+# Typst lines run from cap height to baseline; leading is added between
+CAP_HEIGHT = 0.66
+# Default spacing between blocks/paragraphs (Typst: 1.2em)
+BLOCK_SPACING = 1.2 * BODY_SIZE
+
+# Headings and entry headers sit taller than their cap height: top of the
+# block to baseline, as a fraction of font size
+HEADING_ASCENT = 1.0
+ENTRY_ASCENT = 0.76
+
+# Net spacing after the name, heading and entry header. The template's
+# v() adjustments (-0.75em, -0.5em, -0.25em) do not land where their em
+# values suggest; these are measured from compiled baselines.
+NAME_GAP = 4.5
+HEADING_GAP = -1.0
+ENTRY_GAP = -1.6
+
+# Myriad Pro is ~12% narrower than Helvetica on average
+WIDTH_SCALE = 0.88
+
+# (section, entry index, bullet index)
+BulletRef = tuple[str, int, int]
+
+
+@dataclass
+class Estimate:
+    pages: int
+    content_height: float
+    usable_height: float
+    fill_percent: float
+    bullet_lines: dict[BulletRef, int] = field(default_factory=dict)
+    runts: list[dict] = field(default_factory=list)
+
+    @property
+    def overflow(self) -> bool:
+        return self.pages > 1
+
+
+@lru_cache(maxsize=65536)
+def _word_width(word: str, size: float) -> float:
+    return fitz.get_text_length(word, fontname="helv", fontsize=size) * WIDTH_SCALE
+
+
+def text_width(text: str, size: float = BODY_SIZE) -> float:
+    """Estimated rendered width of a single line of text, in pt."""
+    words = text.split()
+    if not words:
+        return 0.0
+    space = _word_width(" ", size)
+    return sum(_word_width(w, size) for w in words) + space * (len(words) - 1)
+
+
+def wrap_widths(text: str, width: float, size: float = BODY_SIZE) -> list[float]:
+    """
+    Greedy word wrap; returns the width of each resulting line.
+
+    Markdown bold markers (*...*) are ignored, as the template strips them.
+    """
+    words = text.replace("*", "").split()
+    if not words:
+        return [0.0]
+
+    space = _word_width(" ", size)
+    lines: list[float] = []
+    current = -space
+    for word in words:
+        w = _word_width(word, size)
+        if current >= 0 and current + space + w > width:
+            lines.append(current)
+            current = w
+        else:
+            current += space + w
+    lines.append(current)
+    return lines
+
+
+def _layout(layout: Optional[dict]) -> dict:
+    return {**LAYOUT_DEFAULTS, **(layout or {})}
+
+
+def bullet_width(layout: Optional[dict] = None) -> float:
+    """Column width available to bullet text, in pt."""
+    lay = _layout(layout)
+    return (
+        PAGE_WIDTH - 2 * lay["margin-x"]
+        - MAIN_PAD_LEFT - MAIN_PAD_RIGHT
+        - LIST_MARKER_WIDTH - LIST_BODY_INDENT
+    )
+
+
+def line_pitch(layout: Optional[dict] = None) -> float:
+    """Baseline-to-baseline distance of body text, in pt."""
+    return CAP_HEIGHT * BODY_SIZE + _layout(layout)["leading"] * BODY_SIZE
+
+
+def bullet_lines(text: str, layout: Optional[dict] = None) -> int:
+    """Predicted number of wrapped lines for one bullet."""
+    return len(wrap_widths(text, bullet_width(layout)))
+
+
+def _paragraph_height(lines: int, leading: float, size: float = BODY_SIZE) -> float:
+    return lines * CAP_HEIGHT * size + max(lines - 1, 0) * leading * BODY_SIZE
+
+
+def estimate_layout(data: ResumeData, layout: Optional[dict] = None) -> Estimate:
+    """
+    Predict page count, fill and runts for a resume.
+
+    Args:
+        data: Resume to estimate
+        layout: Spacing overrides as passed to generate_typst
+
+    Returns:
+        Estimate with page count, content height, per-bullet line counts
+        and predicted runts
+    """
+    lay = _layout(layout)
+    leading = lay["leading"]
+    item_gap = lay["list-spacing"] * BODY_SIZE
+    usable = PAGE_HEIGHT - 2 * lay["margin-y"]
+    main_width = PAGE_WIDTH - 2 * lay["margin-x"] - MAIN_PAD_LEFT - MAIN_PAD_RIGHT
+    column = bullet_width(layout)
+
+    est = Estimate(pages=1, content_height=0.0, usable_height=usable, fill_percent=0.0)
+    # (spacing before, height) of each unbreakable piece, top to bottom
+    blocks: list[tuple[float, float]] = []
+
+    # Header: name, contact line, summary
+    blocks.append((0.0, CAP_HEIGHT * NAME_SIZE + NAME_GAP))
+    header_lines = 1 + (len(wrap_widths(data.summary, main_width)) if data.summary else 0)
+    blocks.append((BLOCK_SPACING, _paragraph_height(header_lines, leading)))
+
+    def add_bullets(section: str, e: int, bullets: list[str]) -> None:
+        for b, text in enumerate(bullets):
+            widths = wrap_widths(text, column)
+            est.bullet_lines[(section, e, b)] = len(widths)
+            if len(widths) > 1 and widths[-1] / column < RUNT_RATIO:
+                est.runts.append({
+                    "section": section,
+                    "entry": e,
+                    "bullet": b,
+                    "text": text,
+                    "width_ratio": round(widths[-1] / column, 3),
+                })
+            gap = item_gap if b else BLOCK_SPACING
+            blocks.append((gap, _paragraph_height(len(widths), leading)))
+
+    for section, entries in (("work", data.work), ("projects", data.projects), ("education", data.education)):
+        if not entries:
+            continue
+        blocks.append((BLOCK_SPACING, HEADING_ASCENT * HEADING_SIZE + HEADING_GAP))
+        for e, entry in enumerate(entries):
+            blocks.append((BLOCK_SPACING, ENTRY_ASCENT * ENTRY_SIZE + ENTRY_GAP))
+            add_bullets(section, e, entry.bullets)
+
+    if data.skills:
+        blocks.append((BLOCK_SPACING, HEADING_ASCENT * HEADING_SIZE + HEADING_GAP))
+        for i, (category, items) in enumerate(data.skills.items()):
+            lines = len(wrap_widths(f"{category}: {', '.join(items)}", column))
+            blocks.append((item_gap if i else BLOCK_SPACING, _paragraph_height(lines, leading)))
+
+    # Stack pieces, starting a new page where one would overflow
+    y = first_page = 0.0
+    for gap, height in blocks:
+        if y + gap + height > usable and y > 0:
+            est.pages += 1
+            y = height
+        else:
+            y += gap + height
+        if est.pages == 1:
+            first_page = y
+        est.content_height += gap + height
+
+    est.fill_percent = round(first_page / PAGE_HEIGHT * 100, 1)
+    return est
@@ -5,16 +5,82 @@ Usage:
     from backend.extractors import extract_text
     
     text = extract_text("resume.pdf")  # Works with .pdf, .docx, .md
+
+Batch mode (process pool, results in completion order):
+    from backend.extractors import extract_text_batch
+    
+    for result in extract_text_batch(["resumes/"], workers=8):
+        print(result["path"], result["ok"])
+
+    python -m backend.extractors --batch resumes/ --workers 8
+
+Extracted text is cached on disk by file content (see backend.cache), so
+re-extracting an unchanged upload is a hash and a read. Bump
+EXTRACTOR_VERSION whenever extractor output changes.
 """
 
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Iterator, Optional, Union
 
-import fitz  # PyMuPDF
 from docx import Document
 
+from .cache import get_extraction_cache
+from .layout import iter_page_layouts
+from .segmenter import HEADER, segment_text
+
+
+# Part of the cache key: bump when any extractor's output changes
+EXTRACTOR_VERSION = "2"
+
 
-def extract_from_pdf(file_path: Union[str, Path]) -> str:
+def iter_pdf_pages(
+    file_path: Union[str, Path],
+    max_pages: Optional[int] = None,
+) -> Iterator[list[str]]:
+    """
+    Stream a PDF page by page.
+    
+    Each page is parsed into a structured layout (backend.layout), its text
+    blocks sorted by vertical then horizontal position, and yielded before
+    the next page is touched, so memory stays flat and callers can start
+    work on page one immediately.
+    
+    Args:
+        file_path: Path to the PDF file
+        max_pages: Stop after this many pages (e.g. 2 for previews)
+        
+    Yields:
+        Sorted, stripped text blocks of one page
+    """
+    for layout in iter_page_layouts(file_path, max_pages):
+        yield [
+            layout.block_text(b).strip()
+            for b in layout.sorted_text_blocks(0)
+        ]
+
+
+def iter_text_blocks(
+    file_path: Union[str, Path],
+    max_pages: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Stream the text blocks of a PDF in reading order.
+    
+    Flattened view of iter_pdf_pages(); see there for arguments.
+    """
+    for blocks in iter_pdf_pages(file_path, max_pages):
+        yield from blocks
+
+
+def extract_from_pdf(
+    file_path: Union[str, Path],
+    max_pages: Optional[int] = None,
+) -> str:
     """
     Extract text from a PDF file using PyMuPDF.
     
@@ -22,26 +88,12 @@ def extract_from_pdf(file_path: Union[str, Path]) -> str:
     
     Args:
         file_path: Path to the PDF file
+        max_pages: Only extract the first N pages
         
     Returns:
         Extracted text content
     """
-    text_blocks = []
-    
-    with fitz.open(file_path) as doc:
-        for page in doc:
-            # Get text blocks with position info
-            blocks = page.get_text("blocks")
-            
-            # Sort by vertical position, then horizontal
-            blocks.sort(key=lambda b: (b[1], b[0]))
-            
-            for block in blocks:
-                # block[4] is the text content
-                if block[6] == 0:  # Text block (not image)
-                    text_blocks.append(block[4].strip())
-    
-    return "\n".join(text_blocks)
+    return "\n".join(iter_text_blocks(file_path, max_pages))
 
 
 def extract_from_docx(file_path: Union[str, Path]) -> str:
@@ -92,7 +144,15 @@ def extract_from_md(file_path: Union[str, Path]) -> str:
         return f.read()
 
 
-def extract_text(file_path: Union[str, Path]) -> str:
+EXTRACTORS = {
+    ".pdf": extract_from_pdf,
+    ".docx": extract_from_docx,
+    ".md": extract_from_md,
+    ".markdown": extract_from_md,
+}
+
+
+def extract_text(file_path: Union[str, Path], use_cache: bool = True) -> str:
     """
     Extract text from a resume file (PDF, DOCX, or MD).
     
@@ -100,6 +160,7 @@ def extract_text(file_path: Union[str, Path]) -> str:
     
     Args:
         file_path: Path to the resume file
+        use_cache: Serve/store results in the on-disk extraction cache
         
     Returns:
         Extracted text content
@@ -115,55 +176,211 @@ def extract_text(file_path: Union[str, Path]) -> str:
     
     suffix = path.suffix.lower()
     
-    extractors = {
-        ".pdf": extract_from_pdf,
-        ".docx": extract_from_docx,
-        ".md": extract_from_md,
-        ".markdown": extract_from_md,
+    if suffix not in EXTRACTORS:
+        supported = ", ".join(EXTRACTORS.keys())
+        raise ValueError(f"Unsupported format: {suffix}. Supported: {supported}")
+    
+    if not use_cache:
+        return EXTRACTORS[suffix](path)
+    
+    cache = get_extraction_cache()
+    key = cache.key_for(path, EXTRACTOR_VERSION)
+    text = cache.get_text(key)
+    if text is None:
+        text = EXTRACTORS[suffix](path)
+        cache.put_text(key, text)
+    return text
+
+
+def iter_resume_files(paths: Iterable[Union[str, Path]]) -> Iterator[Path]:
+    """
+    Expand files and directories into the resume files they contain.
+    
+    Directories are searched recursively for supported extensions;
+    explicit file paths are yielded as-is so unsupported ones still
+    surface as per-file errors in a batch.
+    """
+    for entry in paths:
+        path = Path(entry)
+        if path.is_dir():
+            for child in sorted(path.rglob("*")):
+                if child.is_file() and child.suffix.lower() in EXTRACTORS:
+                    yield child
+        else:
+            yield path
+
+
+def _extract_one(path: Path, use_cache: bool = True) -> dict:
+    """Process-pool worker: extract one file and never raise."""
+    start = time.perf_counter()
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = 0
+    
+    # Hit/miss is read off this process's counters; the parent cannot see them
+    cache = get_extraction_cache() if use_cache else None
+    hits = cache.hits if cache else 0
+    try:
+        text = extract_text(path, use_cache=use_cache)
+        error = None
+    except Exception as e:
+        text = None
+        error = f"{type(e).__name__}: {e}"
+    
+    return {
+        "path": str(path),
+        "ok": error is None,
+        "text": text,
+        "error": error,
+        "bytes": size,
+        "cached": cache.hits > hits if cache and error is None else None,
+        "seconds": time.perf_counter() - start,
     }
+
+
+def extract_text_batch(
+    paths: Iterable[Union[str, Path]],
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> Iterator[dict]:
+    """
+    Extract text from many resume files across a process pool.
     
-    if suffix not in extractors:
-        supported = ", ".join(extractors.keys())
-        raise ValueError(f"Unsupported format: {suffix}. Supported: {supported}")
+    Results are yielded in completion order, one dict per file:
+    ``{"path", "ok", "text", "error", "bytes", "cached", "seconds"}``, where
+    cached says whether the text came from the extraction cache (None if
+    the cache was bypassed or extraction failed). A file that fails to
+    extract is reported with ``ok=False`` and the batch continues.
     
-    return extractors[suffix](path)
+    Args:
+        paths: Files and/or directories (searched recursively)
+        workers: Number of worker processes (default: CPU count)
+        use_cache: Serve/store results in the on-disk extraction cache
+        
+    Yields:
+        Per-file result dictionaries
+    """
+    files = list(iter_resume_files(paths))
+    if not files:
+        return
+    
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(files) == 1:
+        # Skip pool startup for trivial batches
+        for path in files:
+            yield _extract_one(path, use_cache)
+        return
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+        futures = [pool.submit(_extract_one, path, use_cache) for path in files]
+        for future in as_completed(futures):
+            yield future.result()
 
 
 def parse_resume_preview(text: str) -> dict:
     """
     Quick preview of detected sections without full parsing.
     
-    Returns summary of what was detected.
+    Returns summary of what was detected: canonical section names in
+    document order plus their line spans (see backend.segmenter).
     """
-    lines = text.strip().split("\n")
+    seg = segment_text(text)
+    sections = [s for s in seg.sections if s.name != HEADER]
+    
+    detected = []
+    for span in sections:
+        if span.name not in detected:
+            detected.append(span.name)
     
-    # Simple heuristics for preview
-    preview = {
-        "total_lines": len(lines),
-        "detected_sections": [],
+    return {
+        "total_lines": len(seg.lines),
+        "detected_sections": detected,
+        "sections": [
+            {"name": s.name, "heading": s.heading, "start": s.start, "end": s.end}
+            for s in sections
+        ],
         "sample_content": text[:500] + "..." if len(text) > 500 else text,
     }
+
+
+def _run_batch(
+    paths: list[str],
+    workers: Optional[int],
+    show_text: bool,
+    use_cache: bool = True,
+    cache_stats: bool = False,
+) -> int:
+    """CLI batch mode: one line per file, then throughput numbers."""
+    start = time.perf_counter()
+    total_files = failed = total_bytes = 0
+    cache_hits = cache_misses = 0
     
-    # Detect common section headers
-    section_keywords = ["work", "experience", "education", "skill", "project", "summary"]
-    for line in lines:
-        lower = line.lower().strip()
-        for keyword in section_keywords:
-            if keyword in lower and len(lower) < 30:
-                if keyword not in preview["detected_sections"]:
-                    preview["detected_sections"].append(keyword)
+    for result in extract_text_batch(paths, workers=workers, use_cache=use_cache):
+        total_files += 1
+        total_bytes += result["bytes"]
+        if not result["ok"]:
+            failed += 1
+        cache_hits += result["cached"] is True
+        cache_misses += result["cached"] is False
+        
+        record = {
+            "path": result["path"],
+            "ok": result["ok"],
+            "chars": len(result["text"]) if result["text"] is not None else 0,
+            "seconds": round(result["seconds"], 4),
+        }
+        if result["error"]:
+            record["error"] = result["error"]
+        if show_text and result["text"] is not None:
+            record["text"] = result["text"]
+        print(json.dumps(record, ensure_ascii=False), flush=True)
     
-    return preview
+    elapsed = time.perf_counter() - start
+    rate = total_files / elapsed if elapsed else 0.0
+    mb_rate = total_bytes / (1024 * 1024) / elapsed if elapsed else 0.0
+    print(
+        f"Extracted {total_files - failed}/{total_files} files in {elapsed:.2f}s "
+        f"({rate:.1f} files/s, {mb_rate:.2f} MB/s), {failed} failed",
+        file=sys.stderr,
+    )
+    if cache_stats:
+        batch = {"hits": cache_hits, "misses": cache_misses}
+        print(json.dumps({**get_extraction_cache().stats(), "batch": batch}), file=sys.stderr)
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    # Quick test
-    import sys
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Resume text extraction")
+    parser.add_argument("paths", nargs="*", help="Resume files or directories")
+    parser.add_argument("--batch", action="store_true", help="Extract many files in a process pool")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--text", action="store_true", help="Include extracted text in batch output")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the extraction cache")
+    parser.add_argument("--clear-cache", action="store_true", help="Invalidate the extraction cache")
+    parser.add_argument("--cache-stats", action="store_true", help="Print extraction cache statistics")
+    
+    args = parser.parse_args()
+    use_cache = not args.no_cache
+    
+    if args.clear_cache:
+        removed = get_extraction_cache().clear()
+        print(f"Cleared {removed} cached extractions", file=sys.stderr)
     
-    if len(sys.argv) > 1:
-        text = extract_text(sys.argv[1])
+    if args.batch and args.paths:
+        rc = _run_batch(args.paths, args.workers, args.text, use_cache, args.cache_stats)
+        sys.exit(rc)
+    elif args.paths:
+        text = extract_text(args.paths[0], use_cache=use_cache)
         print(f"Extracted {len(text)} characters:")
         print("-" * 40)
         print(text[:500])
-    else:
-        print("Usage: python extractors.py <file_path>")
+        if args.cache_stats:
+            print(json.dumps(get_extraction_cache().stats()), file=sys.stderr)
+    elif args.cache_stats:
+        print(json.dumps(get_extraction_cache().stats(), indent=2))
+    elif not args.clear_cache:
+        print("Usage: python -m backend.extractors <file_path>")
+        print("       python -m backend.extractors --batch <file_or_dir>... [--workers N]")
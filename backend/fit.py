@@ -0,0 +1,306 @@
+"""
+Fit-to-one-page optimizer.
+
+Instead of an edit → compile → count loop, the allowed knobs are expanded
+into a ladder of candidates ordered from least to most aggressive (tighter
+spacing, then fewer skills, then fewer low-priority bullets). Each rung
+includes every change of the rungs before it, so page count only decreases
+going down the ladder. The least aggressive rung that fits on one page is
+found by bisection, using O(log n) Typst compiles.
+
+The font-metric estimator (backend.estimator) bisects the same ladder
+first, without Typst, and compiles start from its guess: when the estimate
+is right, two compiles confirm the boundary; when it is off, the search
+gallops outwards from the guess before bisecting.
+
+Usage:
+    from backend.fit import fit_to_one_page
+
+    result = fit_to_one_page(data, "output/alex/resumes", name="alex_pm_stripe")
+    print(result.fits, result.compiles, result.fill)
+
+    python -m backend.fit --json resume.json --out output/alex/resumes --name alex_pm
+"""
+
+import copy
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+from .estimator import estimate_layout
+from .generator import LAYOUT_DEFAULTS, compile_source, generate_typst, render_resume
+from .models import ResumeData
+
+
+KNOBS = ("layout", "skills", "bullets")
+
+# Progressively tighter spacing; each step overrides LAYOUT_DEFAULTS
+LAYOUT_STEPS = [
+    {"leading": 0.8, "list-spacing": 0.85},
+    {"leading": 0.75, "list-spacing": 0.7, "margin-y": 20.0},
+    {"leading": 0.7, "list-spacing": 0.6, "margin-y": 18.0, "margin-x": 42.0},
+]
+
+# (section, entry index, bullet index) — section is "work" or "projects"
+BulletRef = tuple[str, int, int]
+
+
+@dataclass
+class FitResult:
+    data: ResumeData
+    layout: dict
+    fits: bool
+    pages: int
+    compiles: int
+    steps: list[str] = field(default_factory=list)
+    fill: Optional[dict] = None
+    estimated_rung: Optional[int] = None
+    typst_path: Optional[Path] = None
+    pdf_path: Optional[Path] = None
+
+
+# A ladder step mutates (data, layout) in place and describes itself
+Step = tuple[str, Callable[[ResumeData, dict], None]]
+
+
+def _layout_steps() -> list[Step]:
+    return [
+        (f"layout: {overrides}", lambda _, layout, o=overrides: layout.update(o))
+        for overrides in LAYOUT_STEPS
+    ]
+
+
+def _skill_steps(data: ResumeData, min_skills: int) -> list[Step]:
+    """Drop the last item of the currently longest skill category, repeatedly."""
+    counts = {category: len(items) for category, items in data.skills.items()}
+    steps: list[Step] = []
+
+    def drop(d: ResumeData, _layout: dict, category: str) -> None:
+        d.skills[category].pop()
+
+    while counts:
+        category = max(counts, key=counts.get)
+        if counts[category] <= min_skills:
+            break
+        counts[category] -= 1
+        item = data.skills[category][counts[category]]
+        steps.append((f"skills: drop '{item}' from {category}", lambda d, l, c=category: drop(d, l, c)))
+    return steps
+
+
+def _default_priorities(data: ResumeData) -> dict[BulletRef, float]:
+    """Earlier entries and earlier bullets matter more; projects after work."""
+    priorities: dict[BulletRef, float] = {}
+    for offset, section in ((0, "work"), (1000, "projects")):
+        for e, entry in enumerate(getattr(data, section)):
+            for b in range(len(entry.bullets)):
+                priorities[(section, e, b)] = -(offset + e * 100 + b)
+    return priorities
+
+
+def _bullet_steps(
+    data: ResumeData,
+    priorities: dict[BulletRef, float],
+    min_bullets: int,
+) -> list[Step]:
+    """Remove bullets lowest priority first, keeping min_bullets per entry."""
+    remaining = {
+        (section, e): len(entry.bullets)
+        for section in ("work", "projects")
+        for e, entry in enumerate(getattr(data, section))
+    }
+    refs = sorted(_default_priorities(data), key=lambda ref: priorities.get(ref, float("-inf")))
+
+    # Bullets are blanked (None) rather than popped so later refs stay valid
+    def drop(d: ResumeData, _layout: dict, ref: BulletRef) -> None:
+        section, e, b = ref
+        getattr(d, section)[e].bullets[b] = None
+
+    steps: list[Step] = []
+    for ref in refs:
+        section, e, b = ref
+        if remaining[(section, e)] <= min_bullets:
+            continue
+        remaining[(section, e)] -= 1
+        text = getattr(data, section)[e].bullets[b]
+        steps.append((f"bullets: drop {section}[{e}] '{text[:40]}'", lambda d, l, r=ref: drop(d, l, r)))
+    return steps
+
+
+def build_ladder(
+    data: ResumeData,
+    knobs: Iterable[str] = KNOBS,
+    priorities: Optional[dict[BulletRef, float]] = None,
+    min_bullets: int = 1,
+    min_skills: int = 3,
+) -> list[Step]:
+    """Candidate steps, least aggressive first, for the allowed knobs."""
+    knobs = list(knobs)
+    unknown = set(knobs) - set(KNOBS)
+    if unknown:
+        raise ValueError(f"Unknown knobs: {sorted(unknown)}. Available: {list(KNOBS)}")
+
+    steps: list[Step] = []
+    for knob in KNOBS:
+        if knob not in knobs:
+            continue
+        if knob == "layout":
+            steps += _layout_steps()
+        elif knob == "skills":
+            steps += _skill_steps(data, min_skills)
+        elif knob == "bullets":
+            steps += _bullet_steps(data, priorities or _default_priorities(data), min_bullets)
+    return steps
+
+
+def materialize(data: ResumeData, steps: list[Step], rung: int) -> tuple[ResumeData, dict]:
+    """Apply the first `rung` steps to a copy of data."""
+    candidate = copy.deepcopy(data)
+    layout: dict = {}
+    for _, apply in steps[:rung]:
+        apply(candidate, layout)
+    for section in (candidate.work, candidate.projects):
+        for entry in section:
+            entry.bullets = [b for b in entry.bullets if b is not None]
+    return candidate, layout
+
+
+def first_fit(pages: Callable[[int], int], lo: int, hi: int) -> int:
+    """
+    Bisect for the first rung in [lo, hi] that fits on one page.
+
+    Assumes page count never increases going down the ladder. Returns hi
+    if no rung in the range fits.
+    """
+    if pages(lo) <= 1:
+        return lo
+    if pages(hi) > 1:
+        return hi
+    # Invariant: lo never fits, hi always does
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if pages(mid) <= 1:
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
+def fit_to_one_page(
+    data: ResumeData,
+    output_dir: Union[str, Path],
+    name: str = "fit",
+    template: str = "modern",
+    knobs: Iterable[str] = KNOBS,
+    priorities: Optional[dict[BulletRef, float]] = None,
+    min_bullets: int = 1,
+    min_skills: int = 3,
+) -> FitResult:
+    """
+    Find the least aggressive combination of knobs that fits one page.
+
+    Args:
+        data: Resume to fit (not modified)
+        output_dir: Directory for the .typ/.pdf (two levels below the
+            project root, like personas/{name}/ or output/{name}/, so the
+            template import resolves)
+        name: Output file stem
+        template: Template name
+        knobs: Allowed knobs, any of "layout", "skills", "bullets"
+        priorities: Bullet priority per (section, entry, bullet); lowest
+            is dropped first. Defaults to document order.
+        min_bullets: Bullets to keep per work/project entry
+        min_skills: Items to keep per skill category
+
+    Returns:
+        FitResult with the chosen ResumeData/layout, compiles used and the
+        final page fill
+    """
+    output_dir = Path(output_dir)
+
+    steps = build_ladder(data, knobs, priorities, min_bullets, min_skills)
+    pages_at: dict[int, int] = {}
+
+    def pages(rung: int) -> int:
+        if rung not in pages_at:
+            candidate, layout = materialize(data, steps, rung)
+            # Candidates are compiled in memory; only the winner is written
+            source = generate_typst(candidate, template, layout=layout)
+            success, message, _, count = compile_source(source, output_dir)
+            if not success:
+                raise RuntimeError(message)
+            pages_at[rung] = count
+        return pages_at[rung]
+
+    def estimated_pages(rung: int) -> int:
+        return estimate_layout(*materialize(data, steps, rung)).pages
+
+    guess = first_fit(estimated_pages, 0, len(steps))
+
+    # Gallop outwards from the guess until the fit boundary is bracketed
+    if pages(guess) <= 1:
+        lo, hi, stride = guess, guess, 1
+        while lo > 0:
+            lo = max(hi - stride, 0)
+            if pages(lo) > 1:
+                break
+            hi, stride = lo, stride * 2
+        best = first_fit(pages, lo, hi)
+    else:
+        lo, hi, stride = guess, guess, 1
+        while hi < len(steps):
+            hi = min(lo + stride, len(steps))
+            if pages(hi) <= 1:
+                break
+            lo, stride = hi, stride * 2
+        best = first_fit(pages, lo, hi)
+
+    # Persist the winner; its PDF comes straight from the compile cache
+    candidate, layout = materialize(data, steps, best)
+    rendered = render_resume(candidate, template, layout, output_dir, name)
+    if not rendered["success"]:
+        raise RuntimeError(rendered["message"])
+
+    return FitResult(
+        data=candidate,
+        layout={**LAYOUT_DEFAULTS, **layout},
+        fits=rendered["pages"] <= 1,
+        pages=rendered["pages"],
+        compiles=len(pages_at),
+        estimated_rung=guess,
+        steps=[description for description, _ in steps[:best]],
+        fill=rendered["fill"],
+        typst_path=Path(rendered["typst_file"]),
+        pdf_path=Path(rendered["pdf_file"]),
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+
+    parser = argparse.ArgumentParser(description="Fit a resume to one page")
+    parser.add_argument("--json", required=True, help="Path to JSON resume data")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--name", default="fit", help="Output file stem")
+    parser.add_argument("--template", default="modern", help="Resume template")
+    parser.add_argument("--knobs", default=",".join(KNOBS), help="Comma-separated knobs")
+    parser.add_argument("--min-bullets", type=int, default=1, help="Bullets to keep per entry")
+
+    args = parser.parse_args()
+    data = ResumeData.from_dict(json.loads(Path(args.json).read_text()))
+    result = fit_to_one_page(
+        data, args.out, args.name, args.template,
+        knobs=args.knobs.split(","), min_bullets=args.min_bullets,
+    )
+    print(json.dumps({
+        "fits": result.fits,
+        "pages": result.pages,
+        "compiles": result.compiles,
+        "steps": result.steps,
+        "layout": result.layout,
+        "fill": result.fill,
+        "pdf_file": str(result.pdf_path),
+    }, indent=2))
+    sys.exit(0 if result.fits else 1)
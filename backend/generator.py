@@ -4,116 +4,204 @@ Convert parsed resume data to Typst format.
 Generates a complete Typst file from ResumeData that can be compiled to PDF.
 """
 
+import asyncio
+import os
+import re
 import subprocess
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from .models import ResumeData, Contact, WorkEntry, ProjectEntry, EducationEntry
+from .cache import get_compile_cache
+from .compile_service import CompileQueueFull, get_compile_service
+from .layout import open_pdf
+from .monitor import analyze_pdf
 
 
-# Template directory
+# Project root (Typst --root) and template directory
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 TEMPLATE_DIR = Path(__file__).parent.parent / "typst" / "templates"
 
 AVAILABLE_TEMPLATES = ["modern"]
 
+# Spacing knobs the templates read from data.layout, with their defaults
+# (as in typst/templates/modern.typ) and Typst units
+LAYOUT_DEFAULTS = {
+    "margin-x": 50.0,
+    "margin-y": 25.0,
+    "leading": 0.875,
+    "list-spacing": 1.0,
+}
+LAYOUT_UNITS = {
+    "margin-x": "pt",
+    "margin-y": "pt",
+    "leading": "em",
+    "list-spacing": "em",
+}
+
+
+# Rendered fragments are memoized by content, so re-generating a resume
+# after a small edit only re-renders the entries that changed
+FRAGMENT_CACHE_SIZE = 4096
+
 
 def _escape_typst(text: str) -> str:
-    """Escape special Typst characters."""
+    """
+    Escape text for a Typst string literal.
+    
+    Inside "..." only the backslash and the quote are special; markup
+    characters such as # or @ are literal there, and escaping them would
+    leave a visible backslash in the PDF. Clean strings are returned as-is.
+    """
     if not text:
         return ""
-    # Escape characters that have special meaning in Typst
-    replacements = [
-        ("\\", "\\\\"),
-        ("#", "\\#"),
-        ("$", "\\$"),
-        ("@", "\\@"),
-        ("<", "\\<"),
-        (">", "\\>"),
-    ]
-    for old, new in replacements:
-        text = text.replace(old, new)
+    if "\\" in text:
+        text = text.replace("\\", "\\\\")
+    if '"' in text:
+        text = text.replace('"', '\\"')
     return text
 
 
+def _str(text: Optional[str]) -> str:
+    """Typst string literal, or none for missing values."""
+    return f'"{_escape_typst(text)}"' if text else "none"
+
+
+def _array(items: tuple[str, ...]) -> str:
+    """Typst array of strings; a single item needs a trailing comma."""
+    body = ", ".join(f'"{_escape_typst(i)}"' for i in items)
+    return f"({body},)" if len(items) == 1 else f"({body})"
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def _render_contact(
+    name: str,
+    email: str,
+    phone: str,
+    location: str,
+    preferred_name: Optional[str],
+    linkedin: Optional[str],
+    website: Optional[str],
+) -> str:
+    lines = [
+        f'    name: "{_escape_typst(name)}",',
+        f'    email: "{_escape_typst(email)}",',
+    ]
+    if preferred_name:
+        lines.append(f'    preferred_name: "{_escape_typst(preferred_name)}",')
+    if phone:
+        lines.append(f'    phone: "{_escape_typst(phone)}",')
+    if location:
+        lines.append(f'    location: "{_escape_typst(location)}",')
+    if linkedin:
+        lines.append(f'    linkedin: "{_escape_typst(linkedin)}",')
+    if website:
+        lines.append(f'    website: "{_escape_typst(website)}",')
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def _render_work_entry(
+    title: str,
+    company: str,
+    url: Optional[str],
+    description: Optional[str],
+    dates: str,
+    bullets: tuple[str, ...],
+) -> str:
+    return f'''    (
+      title: "{_escape_typst(title)}",
+      company: "{_escape_typst(company)}",
+      url: {_str(url)},
+      description: {_str(description)},
+      dates: "{_escape_typst(dates)}",
+      bullets: {_array(bullets)},
+    )'''
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def _render_project_entry(
+    title: str,
+    url: Optional[str],
+    description: Optional[str],
+    dates: str,
+    bullets: tuple[str, ...],
+) -> str:
+    return f'''    (
+      title: "{_escape_typst(title)}",
+      url: {_str(url)},
+      description: {_str(description)},
+      dates: "{_escape_typst(dates)}",
+      bullets: {_array(bullets)},
+    )'''
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def _render_education_entry(
+    degree: str,
+    institution: str,
+    url: Optional[str],
+    dates: str,
+    bullets: tuple[str, ...],
+) -> str:
+    return f'''    (
+      degree: "{_escape_typst(degree)}",
+      institution: "{_escape_typst(institution)}",
+      url: {_str(url)},
+      dates: "{_escape_typst(dates)}",
+      bullets: {_array(bullets)},
+    )'''
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def _render_skill_category(category: str, items: tuple[str, ...]) -> str:
+    return f'    "{_escape_typst(category)}": {_array(items)}'
+
+
+def _section(name: str, entries: list[str]) -> str:
+    if not entries:
+        return f"  {name}: (),"
+    return f"  {name}: (\n" + ",\n".join(entries) + ",\n  ),"
+
+
 def _format_contact(contact: Contact) -> str:
     """Generate Typst content for contact section."""
-    lines = []
-    lines.append(f'    name: "{_escape_typst(contact.name)}",')
-    lines.append(f'    email: "{_escape_typst(contact.email)}",')
-    
-    if contact.preferred_name:
-        lines.append(f'    preferred_name: "{_escape_typst(contact.preferred_name)}",')
-    if contact.phone:
-        lines.append(f'    phone: "{_escape_typst(contact.phone)}",')
-    if contact.location:
-        lines.append(f'    location: "{_escape_typst(contact.location)}",')
-    if contact.linkedin:
-        lines.append(f'    linkedin: "{_escape_typst(contact.linkedin)}",')
-    if contact.website:
-        lines.append(f'    website: "{_escape_typst(contact.website)}",')
-    
-    return "\n".join(lines)
+    return _render_contact(
+        contact.name, contact.email, contact.phone, contact.location,
+        contact.preferred_name, contact.linkedin, contact.website,
+    )
 
 
 def _format_work(work: list[WorkEntry]) -> str:
     """Generate Typst content for work section."""
-    if not work:
-        return "  work: (),"
-    
-    entries = []
-    for job in work:
-        bullets = ", ".join(f'"{_escape_typst(b)}"' for b in job.bullets)
-        entry = f'''    (
-      title: "{_escape_typst(job.title)}",
-      company: "{_escape_typst(job.company)}",
-      url: {f'"{job.url}"' if job.url else 'none'},
-      description: {f'"{_escape_typst(job.description)}"' if job.description else 'none'},
-      dates: "{_escape_typst(job.dates)}",
-      bullets: ({bullets}),
-    )'''
-        entries.append(entry)
-    
-    return "  work: (\n" + ",\n".join(entries) + ",\n  ),"
+    return _section("work", [
+        _render_work_entry(
+            job.title, job.company, job.url, job.description, job.dates, tuple(job.bullets),
+        )
+        for job in work
+    ])
 
 
 def _format_projects(projects: list[ProjectEntry]) -> str:
     """Generate Typst content for projects section."""
-    if not projects:
-        return "  projects: (),"
-    
-    entries = []
-    for proj in projects:
-        bullets = ", ".join(f'"{_escape_typst(b)}"' for b in proj.bullets)
-        entry = f'''    (
-      title: "{_escape_typst(proj.title)}",
-      url: {f'"{proj.url}"' if proj.url else 'none'},
-      description: {f'"{_escape_typst(proj.description)}"' if proj.description else 'none'},
-      dates: "{_escape_typst(proj.dates)}",
-      bullets: ({bullets}),
-    )'''
-        entries.append(entry)
-    
-    return "  projects: (\n" + ",\n".join(entries) + ",\n  ),"
+    return _section("projects", [
+        _render_project_entry(
+            proj.title, proj.url, proj.description, proj.dates, tuple(proj.bullets),
+        )
+        for proj in projects
+    ])
 
 
 def _format_education(education: list[EducationEntry]) -> str:
     """Generate Typst content for education section."""
-    if not education:
-        return "  education: (),"
-    
-    entries = []
-    for edu in education:
-        bullets = ", ".join(f'"{_escape_typst(b)}"' for b in edu.bullets)
-        entry = f'''    (
-      degree: "{_escape_typst(edu.degree)}",
-      institution: "{_escape_typst(edu.institution)}",
-      url: {f'"{edu.url}"' if edu.url else 'none'},
-      dates: "{_escape_typst(edu.dates)}",
-      bullets: ({bullets}),
-    )'''
-        entries.append(entry)
-    
-    return "  education: (\n" + ",\n".join(entries) + ",\n  ),"
+    return _section("education", [
+        _render_education_entry(
+            edu.degree, edu.institution, edu.url, edu.dates, tuple(edu.bullets),
+        )
+        for edu in education
+    ])
 
 
 def _format_skills(skills: dict[str, list[str]]) -> str:
@@ -121,26 +209,52 @@ def _format_skills(skills: dict[str, list[str]]) -> str:
     if not skills:
         return "  skills: (:),"
     
-    entries = []
-    for category, items in skills.items():
-        item_str = ", ".join(f'"{_escape_typst(i)}"' for i in items)
-        entries.append(f'    "{_escape_typst(category)}": ({item_str})')
-    
+    entries = [_render_skill_category(c, tuple(items)) for c, items in skills.items()]
     return "  skills: (\n" + ",\n".join(entries) + "\n  ),"
 
 
+def _format_layout(layout: Optional[dict]) -> str:
+    """Generate the optional layout overrides entry."""
+    if not layout:
+        return ""
+    
+    unknown = set(layout) - set(LAYOUT_UNITS)
+    if unknown:
+        raise ValueError(f"Unknown layout keys: {sorted(unknown)}. Available: {list(LAYOUT_UNITS)}")
+    
+    items = ", ".join(f"{k}: {v:g}{LAYOUT_UNITS[k]}" for k, v in layout.items())
+    return f"  layout: ({items}),\n"
+
+
+def clear_fragment_cache() -> None:
+    """Drop all memoized Typst fragments."""
+    for render in (
+        _render_contact,
+        _render_work_entry,
+        _render_project_entry,
+        _render_education_entry,
+        _render_skill_category,
+    ):
+        render.cache_clear()
+
+
 def generate_typst(
     data: ResumeData,
     template: str = "modern",
     output_path: Union[str, Path, None] = None,
+    layout: Optional[dict] = None,
 ) -> str:
     """
     Generate Typst file content from ResumeData.
     
+    Section entries are rendered through a content-keyed fragment cache,
+    so only entries that changed since a previous call are re-rendered.
+    
     Args:
         data: Parsed resume data
         template: Template name (modern, classic, minimal)
         output_path: Optional path to write the file
+        layout: Optional spacing overrides (see LAYOUT_DEFAULTS), in pt/em
         
     Returns:
         Generated Typst content as string
@@ -149,24 +263,26 @@ def generate_typst(
         raise ValueError(f"Unknown template: {template}. Available: {AVAILABLE_TEMPLATES}")
     
     # Build data dictionary for template
-    typst_content = f'''// Generated Resume - {template.title()} Template
-// Edit personal information in the data dictionary below
-
-#import "../../typst/templates/{template}.typ": render
-
-#let data = (
-  contact: (
-{_format_contact(data.contact)}
-  ),
-  summary: {f'"{_escape_typst(data.summary)}"' if data.summary else 'none'},
-{_format_work(data.work)}
-{_format_projects(data.projects)}
-{_format_education(data.education)}
-{_format_skills(data.skills)}
-)
-
-#render(data)
-'''
+    typst_content = "".join((
+        f"// Generated Resume - {template.title()} Template\n",
+        "// Edit personal information in the data dictionary below\n",
+        "\n",
+        f'#import "../../typst/templates/{template}.typ": render\n',
+        "\n",
+        "#let data = (\n",
+        "  contact: (\n",
+        _format_contact(data.contact), "\n",
+        "  ),\n",
+        f"  summary: {_str(data.summary)},\n",
+        _format_work(data.work), "\n",
+        _format_projects(data.projects), "\n",
+        _format_education(data.education), "\n",
+        _format_skills(data.skills), "\n",
+        _format_layout(layout),
+        ")\n",
+        "\n",
+        "#render(data)\n",
+    ))
     
     if output_path:
         Path(output_path).write_text(typst_content)
@@ -213,19 +329,66 @@ def generate_letter_typst(
     return typst_content
 
 
-def compile_pdf(
+@lru_cache(maxsize=1)
+def typst_version() -> Optional[str]:
+    """Installed Typst version string, or None if Typst is missing."""
+    try:
+        result = subprocess.run(["typst", "--version"], capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _typst_command(typst_path: Path, output_path: Path) -> list[str]:
+    """`typst compile` argv; root is the project so templates resolve."""
+    return ["typst", "compile", "--root", str(PROJECT_ROOT), str(typst_path), str(output_path)]
+
+
+def _compile_uncached(typst_path: Path, output_path: Path) -> tuple[bool, str]:
+    """Compile with the warm worker pool if active, else one-shot Typst."""
+    service = get_compile_service()
+    if service is not None:
+        try:
+            return service.compile(typst_path, output_path)
+        except CompileQueueFull:
+            return False, "Typst compile queue is full"
+    
+    try:
+        result = subprocess.run(
+            _typst_command(typst_path, output_path),
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,  # Run from root to avoid confusion, since we pass absolute paths
+        )
+        
+        if result.returncode == 0:
+            return True, f"PDF generated: {output_path}"
+        else:
+            return False, f"Compilation failed: {result.stderr}"
+            
+    except FileNotFoundError:
+        return False, "Typst not installed. Install with: brew install typst"
+
+
+def compile_and_count(
     typst_path: Union[str, Path],
     output_path: Union[str, Path, None] = None,
-) -> tuple[bool, str]:
+    use_cache: bool = True,
+) -> tuple[bool, str, int]:
     """
-    Compile Typst file to PDF.
+    Compile Typst file to PDF and count its pages.
+    
+    Results are served from the compile cache (backend.cache) when the
+    .typ source, its imported templates and the Typst version are all
+    unchanged, skipping both the compile and the page count.
     
     Args:
         typst_path: Path to the .typ file
         output_path: Optional custom output path for PDF
+        use_cache: Serve/store results in the compile cache
         
     Returns:
-        Tuple of (success, message)
+        Tuple of (success, message, page_count); page_count is 0 on failure
     """
     typst_path = Path(typst_path).resolve()
     
@@ -234,36 +397,59 @@ def compile_pdf(
     else:
         output_path = Path(output_path).resolve()
     
-    try:
-        # Determine project root
-        project_root = Path(__file__).parent.parent.resolve()
-        
-        # When running typst, we set root to project_root
-        result = subprocess.run(
-            ["typst", "compile", "--root", str(project_root), str(typst_path), str(output_path)],
-            capture_output=True,
-            text=True,
-            cwd=project_root,  # Run from root to avoid confusion, since we pass absolute paths
-        )
+    version = typst_version() if use_cache else None
+    if version is None:
+        success, message = _compile_uncached(typst_path, output_path)
+        return success, message, check_page_count(output_path) if success else 0
+    
+    cache = get_compile_cache()
+    key = cache.key_for(typst_path, version)
+    hit = cache.get_pdf(key)
+    if hit is not None:
+        pdf, pages = hit
+        output_path.write_bytes(pdf)
+        return True, f"PDF generated (cached): {output_path}", pages
+    
+    success, message = _compile_uncached(typst_path, output_path)
+    if not success:
+        return False, message, 0
+    
+    pages = check_page_count(output_path)
+    cache.put_pdf(key, output_path.read_bytes(), pages)
+    return True, message, pages
+
+
+def compile_pdf(
+    typst_path: Union[str, Path],
+    output_path: Union[str, Path, None] = None,
+    use_cache: bool = True,
+) -> tuple[bool, str]:
+    """
+    Compile Typst file to PDF.
+    
+    Uses the warm worker pool when a compile service is active (see
+    backend.compile_service), otherwise a one-shot `typst compile`.
+    Unchanged sources are served from the compile cache.
+    
+    Args:
+        typst_path: Path to the .typ file
+        output_path: Optional custom output path for PDF
+        use_cache: Serve/store results in the compile cache
         
-        if result.returncode == 0:
-            return True, f"PDF generated: {output_path}"
-        else:
-            return False, f"Compilation failed: {result.stderr}"
-            
-    except FileNotFoundError:
-        return False, "Typst not installed. Install with: brew install typst"
+    Returns:
+        Tuple of (success, message)
+    """
+    success, message, _ = compile_and_count(typst_path, output_path, use_cache)
+    return success, message
 
 
-def check_page_count(pdf_path: Union[str, Path]) -> int:
+def check_page_count(pdf_path: Union[str, Path, bytes]) -> int:
     """
-    Check the number of pages in a PDF.
+    Check the number of pages in a PDF (a path or the PDF bytes).
     
     Uses PyMuPDF for counting.
     """
-    import fitz  # PyMuPDF
-    
-    with fitz.open(pdf_path) as doc:
+    with open_pdf(pdf_path) as doc:
         return len(doc)
 
 
@@ -297,18 +483,316 @@ def generate_and_compile(
     # Generate Typst
     typst_content = generate_typst(data, template, typst_path)
     
-    # Compile to PDF
-    success, message = compile_pdf(typst_path, pdf_path)
+    # Compile to PDF (page count comes from the compile cache on a hit)
+    success, message, pages = compile_and_count(typst_path, pdf_path)
     
     if success:
         # Check page count
-        pages = check_page_count(pdf_path)
         if pages > 1:
             return False, f"Resume is {pages} pages. One-page limit exceeded.", pdf_path
     
     return success, message, pdf_path
 
 
+# --- In-memory pipeline ---
+
+# Generated sources import templates relative to their file, which sits two
+# levels below the root (personas/{name}/, output/{name}/). Typst resolves
+# stdin imports against the root instead, so relative imports are rewritten
+# root-absolute as if the source lived here.
+DEFAULT_SOURCE_DIR = PROJECT_ROOT / "output" / "memory"
+
+_RELATIVE_IMPORT_RE = re.compile(r'(#(?:import|include)\s+")([^"/@][^"]*)"')
+
+
+def anchor_imports(source: str, base_dir: Path) -> str:
+    """
+    Rewrite relative imports as root-absolute ones, resolved from base_dir,
+    so the source compiles from stdin or from any directory under the root.
+    """
+    def anchor(match: re.Match) -> str:
+        target = (base_dir / match.group(2)).resolve()
+        if not target.is_relative_to(PROJECT_ROOT):
+            return match.group(0)
+        return f'{match.group(1)}/{target.relative_to(PROJECT_ROOT).as_posix()}"'
+    return _RELATIVE_IMPORT_RE.sub(anchor, source)
+
+
+def compile_source(
+    source: str,
+    base_dir: Union[str, Path, None] = None,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+) -> tuple[bool, str, bytes, int]:
+    """
+    Compile Typst source to PDF bytes without touching the filesystem.
+    
+    The source is piped to `typst compile` on stdin and the PDF read back
+    from stdout. Results are shared with the on-disk compile cache.
+    
+    Args:
+        source: Typst source, e.g. from generate_typst()
+        base_dir: Directory the source's relative imports are written for
+            (default: two levels below the project root)
+        timeout: Seconds before Typst is killed (None: no limit)
+        use_cache: Serve/store results in the compile cache
+        
+    Returns:
+        Tuple of (success, message, pdf_bytes, page_count); pdf_bytes is
+        empty and page_count 0 on failure
+    """
+    base_dir = Path(base_dir).resolve() if base_dir else DEFAULT_SOURCE_DIR
+    source = anchor_imports(source, base_dir)
+    
+    version = typst_version() if use_cache else None
+    cache = get_compile_cache() if version else None
+    key = cache.key_for_source(source, version) if cache else None
+    
+    if cache is not None:
+        hit = cache.get_pdf(key)
+        if hit is not None:
+            pdf, pages = hit
+            return True, "PDF generated in memory (cached)", pdf, pages
+    
+    try:
+        result = subprocess.run(
+            ["typst", "compile", "--root", str(PROJECT_ROOT), "--format", "pdf", "-", "-"],
+            input=source.encode("utf-8"),
+            capture_output=True,
+            cwd=PROJECT_ROOT,
+            timeout=timeout,
+        )
+    except FileNotFoundError:
+        return False, "Typst not installed. Install with: brew install typst", b"", 0
+    except subprocess.TimeoutExpired:
+        return False, f"Compilation timed out after {timeout:g}s", b"", 0
+    
+    if result.returncode != 0:
+        return False, f"Compilation failed: {result.stderr.decode(errors='replace')}", b"", 0
+    
+    pdf = result.stdout
+    pages = check_page_count(pdf)
+    if cache is not None:
+        cache.put_pdf(key, pdf, pages)
+    return True, "PDF generated in memory", pdf, pages
+
+
+def render_resume(
+    data: ResumeData,
+    template: str = "modern",
+    layout: Optional[dict] = None,
+    output_dir: Union[str, Path, None] = None,
+    name: str = "resume",
+    use_cache: bool = True,
+) -> dict:
+    """
+    Generate, compile and check a resume in memory.
+    
+    The PDF is parsed once (backend.monitor.analyze_pdf) for the runt and
+    fill checks. Nothing is written unless output_dir is given.
+    
+    Args:
+        data: Parsed resume data
+        template: Template name
+        layout: Optional spacing overrides (see LAYOUT_DEFAULTS)
+        output_dir: Persist {name}.typ and {name}.pdf here (two levels
+            below the project root, so the template import resolves)
+        name: File stem used when persisting
+        use_cache: Serve/store results in the compile cache
+        
+    Returns:
+        dict with success, message, pages, pdf (bytes), runts, fill and,
+        when persisted, typst_file/pdf_file
+    """
+    source = generate_typst(data, template, layout=layout)
+    success, message, pdf, pages = compile_source(source, output_dir, use_cache=use_cache)
+    
+    result = {
+        "success": success,
+        "message": message,
+        "pages": pages,
+        "pdf": pdf,
+        "runts": [],
+        "fill": None,
+        "typst_file": None,
+        "pdf_file": None,
+    }
+    if not success:
+        return result
+    
+    analysis = analyze_pdf(pdf)
+    result["runts"] = analysis.runts
+    result["fill"] = analysis.fill
+    
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        typst_path = output_dir / f"{name}.typ"
+        pdf_path = output_dir / f"{name}.pdf"
+        typst_path.write_text(source)
+        pdf_path.write_bytes(pdf)
+        result["typst_file"] = str(typst_path)
+        result["pdf_file"] = str(pdf_path)
+    
+    return result
+
+
+# --- Async API ---
+
+# Global cap on concurrent Typst processes started by the async API
+ASYNC_COMPILE_LIMIT = int(os.environ.get("MYRIAD_TYPST_CONCURRENCY", os.cpu_count() or 4))
+
+# asyncio primitives bind to one event loop, so keep a semaphore per loop
+_async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def set_async_compile_limit(limit: int) -> None:
+    """Change the concurrent-Typst cap (applies to loops created afterwards)."""
+    global ASYNC_COMPILE_LIMIT
+    ASYNC_COMPILE_LIMIT = limit
+    _async_semaphores.clear()
+
+
+def _async_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _async_semaphores[loop] = asyncio.Semaphore(ASYNC_COMPILE_LIMIT)
+    return semaphore
+
+
+async def _compile_uncached_async(
+    typst_path: Path,
+    output_path: Path,
+    timeout: Optional[float],
+) -> tuple[bool, str]:
+    """Run `typst compile` as an asyncio subprocess under the global limit."""
+    async with _async_semaphore():
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *_typst_command(typst_path, output_path),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=PROJECT_ROOT,
+            )
+        except FileNotFoundError:
+            return False, "Typst not installed. Install with: brew install typst"
+        
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            # Never leave an orphaned Typst process behind
+            proc.kill()
+            await proc.wait()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return False, f"Compilation timed out after {timeout:g}s"
+    
+    if proc.returncode == 0:
+        return True, f"PDF generated: {output_path}"
+    return False, f"Compilation failed: {stderr.decode(errors='replace')}"
+
+
+async def compile_and_count_async(
+    typst_path: Union[str, Path],
+    output_path: Union[str, Path, None] = None,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+) -> tuple[bool, str, int]:
+    """
+    Async version of compile_and_count().
+    
+    At most ASYNC_COMPILE_LIMIT Typst processes run at once across all
+    coroutines on the loop. Cancelling the coroutine kills its Typst
+    process. When it returns successfully the PDF is fully written.
+    
+    Args:
+        typst_path: Path to the .typ file
+        output_path: Optional custom output path for PDF
+        timeout: Per-job timeout in seconds (None: no limit)
+        use_cache: Serve/store results in the compile cache
+        
+    Returns:
+        Tuple of (success, message, page_count); page_count is 0 on failure
+    """
+    typst_path = Path(typst_path).resolve()
+    
+    if output_path is None:
+        output_path = typst_path.with_suffix(".pdf")
+    else:
+        output_path = Path(output_path).resolve()
+    
+    # Cache lookups hash files and read/write whole PDFs: keep them off the loop
+    version = await asyncio.to_thread(typst_version) if use_cache else None
+    cache = get_compile_cache() if version else None
+    key = await asyncio.to_thread(cache.key_for, typst_path, version) if cache else None
+    
+    if cache is not None:
+        hit = await asyncio.to_thread(cache.get_pdf, key)
+        if hit is not None:
+            pdf, pages = hit
+            await asyncio.to_thread(output_path.write_bytes, pdf)
+            return True, f"PDF generated (cached): {output_path}", pages
+    
+    success, message = await _compile_uncached_async(typst_path, output_path, timeout)
+    if not success:
+        return False, message, 0
+    
+    pages = await asyncio.to_thread(check_page_count, output_path)
+    if cache is not None:
+        pdf = await asyncio.to_thread(output_path.read_bytes)
+        await asyncio.to_thread(cache.put_pdf, key, pdf, pages)
+    return True, message, pages
+
+
+async def compile_pdf_async(
+    typst_path: Union[str, Path],
+    output_path: Union[str, Path, None] = None,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+) -> tuple[bool, str]:
+    """
+    Async version of compile_pdf(); see compile_and_count_async().
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    success, message, _ = await compile_and_count_async(typst_path, output_path, timeout, use_cache)
+    return success, message
+
+
+async def generate_and_compile_async(
+    data: ResumeData,
+    output_dir: Union[str, Path],
+    persona: str,
+    role: str,
+    template: str = "modern",
+    timeout: Optional[float] = None,
+) -> tuple[bool, str, Path]:
+    """
+    Async version of generate_and_compile().
+    
+    Returns:
+        Tuple of (success, message, pdf_path)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    filename = f"{persona}_{role}_master_resume"
+    typst_path = output_dir / f"{filename}.typ"
+    pdf_path = output_dir / f"{filename}.pdf"
+    
+    generate_typst(data, template, typst_path)
+    success, message, pages = await compile_and_count_async(typst_path, pdf_path, timeout)
+    
+    if success and pages > 1:
+        return False, f"Resume is {pages} pages. One-page limit exceeded.", pdf_path
+    
+    return success, message, pdf_path
+
+
 if __name__ == "__main__":
     # Quick test with sample data
     sample = ResumeData(
@@ -3,47 +3,187 @@ Resume ingestion utilities.
 
 Provides persona management functions. The ingestion pipeline itself
 is now handled by the AI agent directly.
+
+Usage:
+    python -m backend.ingest --json resume.json --persona alex --role pm
+    python -m backend.ingest --bulk team.csv --workers 8 --compile-limit 4
 """
 
+import csv
+import hashlib
 import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Union
+from typing import Callable, Optional, Union
 import yaml
 import json
 import argparse
 import sys
 from .models import ResumeData
-from .generator import generate_typst, compile_pdf, check_page_count
+from .cache import hash_bytes, hash_file, typst_dependencies
+from .generator import generate_typst, compile_and_count, typst_version
+from .monitor import analyze_pdf
+from .search import connect, index_resume
 
 
 # Project root
 PROJECT_ROOT = Path(__file__).parent.parent
 PERSONAS_DIR = PROJECT_ROOT / "personas"
+CURRENT_PERSONA_FILE = PROJECT_ROOT / ".current_persona"
+
+# Persisted list_personas() entries, refreshed from directory mtimes
+INDEX_FILE = ".index.json"
+INDEX_VERSION = 1
+
+# Per-persona record of each ingest stage's inputs and outputs, used to
+# skip stages that are up to date
+MANIFEST_FILE = ".ingest.json"
+MANIFEST_VERSION = 1
+GENERATOR_FILE = Path(__file__).parent / "generator.py"
+
+# libyaml's loader is several times faster when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 
 def update_current_persona(persona: str, role: str) -> None:
-    """Update .current_persona file."""
-    current_file = PROJECT_ROOT / ".current_persona"
-    current_file.write_text(f"{persona} {role}\n")
+    """
+    Update .current_persona file.
+    
+    The file is replaced atomically, so concurrent ingests leave one
+    complete "persona role" line rather than an interleaving of both.
+    """
+    global _current
+    with _current_lock:
+        _write_atomic(CURRENT_PERSONA_FILE, f"{persona} {role}\n")
+        try:
+            _current = (CURRENT_PERSONA_FILE.stat().st_mtime_ns, (persona, role))
+        except FileNotFoundError:
+            _current = None
+
+
+# (mtime_ns, (persona, role)) of the last .current_persona read
+_current: Optional[tuple[int, tuple[str, str]]] = None
+_current_lock = threading.Lock()
 
 
 def get_current_persona() -> tuple[str, str]:
-    """Get current persona and role from .current_persona file."""
-    current_file = PROJECT_ROOT / ".current_persona"
-    if not current_file.exists():
+    """
+    Get current persona and role from .current_persona file.
+    
+    The file is only re-read when its mtime changes.
+    """
+    global _current
+    try:
+        mtime = CURRENT_PERSONA_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
         return "davy", "pm"  # Default
+    if _current is not None and _current[0] == mtime:
+        return _current[1]
     
-    parts = current_file.read_text().strip().split()
+    parts = CURRENT_PERSONA_FILE.read_text().strip().split()
     if len(parts) >= 2:
-        return parts[0], parts[1]
-    return parts[0] if parts else "davy", "pm"
+        current = parts[0], parts[1]
+    else:
+        current = parts[0] if parts else "davy", "pm"
+    _current = (mtime, current)
+    return current
+
+
+def _file_hash(path: Path) -> Optional[str]:
+    try:
+        return hash_file(path)
+    except FileNotFoundError:
+        return None
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write via a temp file and rename, so readers never see a torn file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.stem + "-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+# Serializes read-modify-write of manifests between ingest threads
+_manifest_lock = threading.Lock()
+
+
+def load_manifest(persona_dir: Union[str, Path]) -> dict:
+    """
+    A persona's ingest manifest: per role, the input hashes and output
+    hashes of each stage of the last successful ingest.
+    
+    Returns:
+        {"version": MANIFEST_VERSION, "roles": {role: record}}; empty if the
+        manifest is missing, unreadable or from another version
+    """
+    manifest = {"version": MANIFEST_VERSION, "roles": {}}
+    try:
+        loaded = json.loads((Path(persona_dir) / MANIFEST_FILE).read_text())
+        if loaded.get("version") == MANIFEST_VERSION:
+            manifest = loaded
+    except (OSError, ValueError):
+        pass  # Missing or torn manifest: every stage rebuilds
+    return manifest
+
+
+def _save_manifest_record(persona_dir: Path, role: str, record: dict) -> None:
+    with _manifest_lock:
+        manifest = load_manifest(persona_dir)
+        manifest["roles"][role] = record
+        manifest["roles"] = dict(sorted(manifest["roles"].items()))
+        _write_atomic(persona_dir / MANIFEST_FILE, json.dumps(manifest))
+
+
+def _stage_reason(
+    previous: Optional[dict],
+    inputs: str,
+    output: Optional[str],
+    force: bool,
+) -> Optional[str]:
+    """Why a stage must run, or None if its last result is still valid."""
+    if force:
+        return "forced"
+    if previous is None:
+        return "not built yet"
+    if previous["inputs"] != inputs:
+        return "inputs changed"
+    if output is None:
+        return "output missing"
+    if previous.get("output", output) != output:
+        return "output modified"
+    return None
+
+
+def _template_hash(typ_path: Path, source: str) -> str:
+    """Hash of the templates a .typ source imports, by name and content."""
+    return hash_bytes(*(
+        f"{dep.name}:{hash_file(dep)}"
+        for dep in sorted(typst_dependencies(typ_path, source=source))
+    ))
 
 
 def ingest_resume_from_json(
     json_path: Union[str, Path],
     persona_name: str,
     role: str,
-    template: str = "modern"
+    template: str = "modern",
+    force: bool = False,
+    dry_run: bool = False,
+    update_current: bool = True,
+    compile_slots: Optional[threading.Semaphore] = None,
 ) -> dict:
     """
     Ingest resume from a JSON file (agent-driven).
@@ -51,34 +191,94 @@ def ingest_resume_from_json(
     1. Validates JSON against ResumeData schema
     2. Enforces existing persona constraints (optional)
     3. Generates Typst source
-    4. Compiles PDF
+    4. Compiles PDF and adds the resume to the search index
     5. Updates current persona
     
+    Stages whose inputs are unchanged since the last ingest are skipped,
+    using the manifest in personas/{persona}/.ingest.json:
+    
+    - generate: input JSON, template name and generator version
+    - compile: .typ content, imported template files and Typst version
+    - analyze: PDF content
+    
+    A stage also reruns if its output file is missing or was modified.
+    
     Args:
         json_path: Path to the JSON file containing parsed resume data
         persona_name: Name of the persona (e.g. "davy")
         role: Role identifier (e.g. "pm")
         template: Template to use
+        force: Rerun every stage regardless of the manifest
+        dry_run: Only report which stages would run and why; nothing is
+            written
+        update_current: Make this persona/role the current one
+        compile_slots: Held around the Typst compile, to bound concurrent
+            compiles when ingesting from several threads
         
     Returns:
-        Result dictionary with paths and status
+        Result dictionary with paths and status, "stages" mapping each
+        stage to "ran" or "skipped", and "warnings" (e.g. the search index
+        could not be updated; the resume itself was built). For a dry run, {"status": "dry-run",
+        "plan": {stage: {"action": "run" | "skip", "reason": ...}}}
     """
     json_path = Path(json_path)
     if not json_path.exists():
         raise FileNotFoundError(f"JSON file not found: {json_path}")
         
     # 1. Load and Validate Data
+    raw = json_path.read_bytes()
     try:
-        data_dict = json.loads(json_path.read_text())
-        resume_data = ResumeData.from_dict(data_dict)
-    except Exception as e:
+        data_dict = json.loads(raw)
+    except json.JSONDecodeError as e:
         raise ValueError(f"Invalid resume JSON: {e}")
+    # Raises ResumeValidationError (a ValueError) listing every bad field
+    resume_data = ResumeData.from_dict(data_dict)
+    
+    persona_dir = PERSONAS_DIR / persona_name
+    typ_filename = f"{persona_name}_{role}_master_resume.typ"
+    typ_path = persona_dir / typ_filename
+    pdf_path = typ_path.with_suffix(".pdf")
+    previous = load_manifest(persona_dir)["roles"].get(role, {}).get("stages", {})
+    plan: dict[str, Optional[str]] = {}
+    
+    # Stage keys chain: each stage's inputs include the previous stage's
+    # output hash, so an unchanged .typ skips the compile even if the JSON
+    # changed in ways the template does not render
+    generate_inputs = hash_bytes(hash_bytes(raw), template, hash_file(GENERATOR_FILE))
+    plan["generate"] = _stage_reason(previous.get("generate"), generate_inputs, _file_hash(typ_path), force)
+    if plan["generate"]:
+        typ_content = generate_typst(resume_data, template)
+    else:
+        typ_content = typ_path.read_text()
+    typ_bytes = typ_content.encode("utf-8")
+    typ_hash = hashlib.sha256(typ_bytes).hexdigest()
+    
+    template_hash = _template_hash(typ_path, typ_content)
+    compile_inputs = hash_bytes(typ_hash, template_hash, typst_version() or "")
+    plan["compile"] = _stage_reason(previous.get("compile"), compile_inputs, _file_hash(pdf_path), force)
+    
+    if plan["compile"]:
+        plan["analyze"] = "PDF rebuilt" if not force else "forced"
+    else:
+        pdf_hash = previous["compile"]["output"]
+        plan["analyze"] = _stage_reason(previous.get("analyze"), pdf_hash, pdf_hash, force)
+    
+    if dry_run:
+        return {
+            "status": "dry-run",
+            "persona": persona_name,
+            "role": role,
+            "plan": {
+                stage: {"action": "run", "reason": reason} if reason else {"action": "skip", "reason": "unchanged"}
+                for stage, reason in plan.items()
+            },
+        }
         
     # 2. Setup Persona Directory
-    persona_dir = PERSONAS_DIR / persona_name
     persona_dir.mkdir(parents=True, exist_ok=True)
     
-    # Ensure config exists
+    # Ensure config exists (exclusive create: when several roles of a new
+    # persona are ingested at once, the first one writes it)
     config_path = persona_dir / "config.yaml"
     if not config_path.exists():
         config = {
@@ -87,24 +287,56 @@ def ingest_resume_from_json(
             "default_role": role,
             "has_career_profile": False
         }
-        with open(config_path, "w") as f:
-            yaml.dump(config, f)
+        try:
+            with open(config_path, "x") as f:
+                yaml.dump(config, f)
+        except FileExistsError:
+            pass
             
-    # 3. Generate Typst
-    typ_filename = f"{persona_name}_{role}_master_resume.typ"
-    typ_path = persona_dir / typ_filename
+    # 3. Generate Typst (left untouched when the content is identical, so
+    # its mtime-keyed indexes stay valid)
+    if plan["generate"] and _file_hash(typ_path) != typ_hash:
+        typ_path.write_bytes(typ_bytes)
     
-    typ_content = generate_typst(resume_data, template)
-    typ_path.write_text(typ_content)
+    # 4. Compile PDF and 5. Check Pages (served from the compile cache if unchanged)
+    if plan["compile"]:
+        with compile_slots or nullcontext():
+            success, message, page_count = compile_and_count(typ_path, pdf_path)
+        if not success:
+            raise RuntimeError(message)
+        pdf_hash = hash_file(pdf_path)
+    else:
+        page_count = previous["compile"]["page_count"]
     
-    # 4. Compile PDF
-    pdf_path = compile_pdf(typ_path)
+    if plan["analyze"]:
+        analysis = analyze_pdf(pdf_path)
+        fill_percent, runts = analysis.fill["fill_percent"], analysis.runts
+    else:
+        fill_percent, runts = previous["analyze"]["fill_percent"], previous["analyze"]["runts"]
+    warnings = []
+    try:
+        index_resume(resume_data, typ_path, persona_name, role, kind="master")
+    except sqlite3.Error as e:
+        # e.g. still locked after search.BUSY_TIMEOUT; the next search (or
+        # `python -m backend.search --update`) picks the .typ file up
+        warnings.append(f"Search index not updated: {e}")
     
-    # 5. Check Pages
-    page_count = check_page_count(pdf_path)
+    if any(plan.values()):
+        _save_manifest_record(persona_dir, role, {
+            "json_path": str(json_path.resolve()),
+            "template": template,
+            "input_hash": hashlib.sha256(raw).hexdigest(),
+            "template_hash": template_hash,
+            "stages": {
+                "generate": {"inputs": generate_inputs, "output": typ_hash},
+                "compile": {"inputs": compile_inputs, "output": pdf_hash, "page_count": page_count},
+                "analyze": {"inputs": pdf_hash, "fill_percent": fill_percent, "runts": runts},
+            },
+        })
     
     # 6. Update Current
-    update_current_persona(persona_name, role)
+    if update_current:
+        update_current_persona(persona_name, role)
     
     return {
         "status": "success",
@@ -112,47 +344,293 @@ def ingest_resume_from_json(
         "role": role,
         "typ_file": str(typ_path),
         "pdf_file": str(pdf_path),
-        "page_count": page_count
+        "page_count": page_count,
+        "fill_percent": fill_percent,
+        "runts": runts,
+        "stages": {stage: "ran" if reason else "skipped" for stage, reason in plan.items()},
+        "warnings": warnings,
     }
-def list_personas() -> list[dict]:
-    """List all available personas and their roles."""
-    personas = []
+
+
+def read_bulk_manifest(manifest_path: Union[str, Path]) -> list[dict]:
+    """
+    Items of a bulk ingest manifest.
     
-    if not PERSONAS_DIR.exists():
-        return personas
+    A .csv file with a header row, or a .jsonl file with one object per
+    line, each with json_path, persona, role and optionally template
+    (default "modern"). Relative json_paths resolve against the
+    manifest's directory.
+    
+    Returns:
+        One dict per item with line (1-based, the header being line 1 of
+        a CSV), json_path, persona, role and template
+    
+    Raises:
+        ValueError: Listing every malformed line
+    """
+    manifest_path = Path(manifest_path)
+    suffix = manifest_path.suffix.lower()
+    with open(manifest_path, newline="") as f:
+        if suffix == ".csv":
+            rows = [(line, row) for line, row in enumerate(csv.DictReader(f), start=2)]
+        elif suffix in (".jsonl", ".ndjson"):
+            rows = []
+            for line, text in enumerate(f, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    rows.append((line, json.loads(text)))
+                except json.JSONDecodeError as e:
+                    rows.append((line, f"invalid JSON: {e}"))
+        else:
+            raise ValueError(f"Unsupported manifest format: {manifest_path.name} (expected .csv or .jsonl)")
     
-    for persona_dir in PERSONAS_DIR.iterdir():
-        if not persona_dir.is_dir():
+    items, errors = [], []
+    for line, row in rows:
+        if isinstance(row, str) or not isinstance(row, dict):
+            errors.append(f"line {line}: {row if isinstance(row, str) else 'expected an object'}")
             continue
-        
-        persona_name = persona_dir.name
-        roles = []
-        
-        # Find all role-specific resumes
-        for typ_file in persona_dir.glob("*_master_resume.typ"):
-            # Extract role from filename: {persona}_{role}_master_resume.typ
-            parts = typ_file.stem.replace("_master_resume", "").split("_")
-            if len(parts) >= 2:
-                role = parts[-1]  # Last part before _master_resume
-                roles.append(role)
-        
-        # Load config
-        config_path = persona_dir / "config.yaml"
-        config = {}
-        if config_path.exists():
-            with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
-        
-        personas.append({
-            "name": persona_name,
-            "display_name": config.get("name", persona_name.title()),
-            "preferred_name": config.get("preferred_name", persona_name.title()),
-            "roles": roles,
-            "default_role": config.get("default_role", roles[0] if roles else None),
-            "has_career_profile": config.get("has_career_profile", False),
+        missing = [key for key in ("json_path", "persona", "role") if not row.get(key)]
+        if missing:
+            errors.append(f"line {line}: missing {', '.join(missing)}")
+            continue
+        items.append({
+            "line": line,
+            "json_path": str(manifest_path.parent / row["json_path"]),
+            "persona": row["persona"],
+            "role": row["role"],
+            "template": row.get("template") or "modern",
         })
+    if errors:
+        raise ValueError(f"{len(errors)} error(s) in {manifest_path}:\n" + "\n".join(f"  {e}" for e in errors))
+    return items
+
+
+def _unchanged(result: dict) -> bool:
+    """Whether an ingest (or dry-run) result skipped every stage."""
+    if "plan" in result:
+        return all(step["action"] == "skip" for step in result["plan"].values())
+    return "ran" not in result["stages"].values()
+
+
+def bulk_ingest(
+    items: list[dict],
+    workers: Optional[int] = None,
+    compile_limit: Optional[int] = None,
+    force: bool = False,
+    update_current: bool = True,
+    on_result: Optional[Callable[[dict], None]] = None,
+    dry_run: bool = False,
+) -> dict:
+    """
+    Ingest many resumes in parallel.
+    
+    Validation, generation and analysis run on `workers` threads, with at
+    most `compile_limit` Typst compiles at a time. Items for the same
+    persona and role run one after another in manifest order, so the last
+    one wins as it would in a sequential run. .current_persona is written
+    once at the end, for the last item in the manifest that succeeded.
+    
+    Args:
+        items: As returned by read_bulk_manifest
+        workers: Concurrent ingests (default: CPU count)
+        compile_limit: Concurrent Typst compiles (default: half of workers)
+        force: Rerun every stage of every item
+        update_current: Set the current persona when done
+        on_result: Called with each item's result as it finishes, from a
+            worker thread (calls are serialized)
+        dry_run: Only report each item's plan (see ingest_resume_from_json);
+            nothing is written, .current_persona included. Every row is
+            planned against the files as they are now, so a later row for
+            the same persona and role does not see an earlier one's output
+    
+    Returns:
+        dict with total, ok, errors, unchanged (every stage skipped),
+        current and seconds
+    """
+    workers = workers or os.cpu_count() or 4
+    compile_slots = threading.Semaphore(compile_limit or max(workers // 2, 1))
+    emit_lock = threading.Lock()
+    results: dict[int, dict] = {}
+    start = time.perf_counter()
+    
+    # Create the search index up front rather than racing to from every thread
+    if not dry_run:
+        connect().close()
+    
+    groups: dict[tuple[str, str], list[dict]] = {}
+    for item in items:
+        groups.setdefault((item["persona"], item["role"]), []).append(item)
+    
+    def run_group(group: list[dict]) -> None:
+        for item in group:
+            started = time.perf_counter()
+            try:
+                result = ingest_resume_from_json(
+                    item["json_path"], item["persona"], item["role"], item["template"],
+                    force=force, dry_run=dry_run, update_current=False, compile_slots=compile_slots,
+                )
+            except Exception as e:
+                result = {"status": "error", "persona": item["persona"], "role": item["role"], "message": str(e)}
+            result = {"line": item["line"], "json_path": item["json_path"], **result}
+            result["seconds"] = round(time.perf_counter() - started, 3)
+            with emit_lock:
+                results[item["line"]] = result
+                if on_result is not None:
+                    on_result(result)
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as pool:
+        for future in [pool.submit(run_group, group) for group in groups.values()]:
+            future.result()
+    
+    succeeded = [results[item["line"]] for item in items if results[item["line"]]["status"] != "error"]
+    current = None
+    if update_current and succeeded and not dry_run:
+        current = f"{succeeded[-1]['persona']} {succeeded[-1]['role']}"
+        update_current_persona(succeeded[-1]["persona"], succeeded[-1]["role"])
+    
+    return {
+        "total": len(items),
+        "ok": len(succeeded),
+        "errors": len(items) - len(succeeded),
+        "unchanged": sum(1 for r in succeeded if _unchanged(r)),
+        "current": current,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _scan_persona(persona_dir: Path) -> dict:
+    """Build one list_personas() entry from a persona directory."""
+    persona_name = persona_dir.name
+    roles = []
+    
+    # Find all role-specific resumes
+    for typ_file in sorted(persona_dir.glob("*_master_resume.typ")):
+        # Extract role from filename: {persona}_{role}_master_resume.typ
+        parts = typ_file.stem.replace("_master_resume", "").split("_")
+        if len(parts) >= 2:
+            role = parts[-1]  # Last part before _master_resume
+            roles.append(role)
+    
+    # Load config
+    config_path = persona_dir / "config.yaml"
+    config = {}
+    if config_path.exists():
+        with open(config_path) as f:
+            config = yaml.load(f, Loader=YamlLoader) or {}
+    
+    return {
+        "name": persona_name,
+        "display_name": config.get("name", persona_name.title()),
+        "preferred_name": config.get("preferred_name", persona_name.title()),
+        "roles": roles,
+        "default_role": config.get("default_role", roles[0] if roles else None),
+        "has_career_profile": config.get("has_career_profile", False),
+    }
+
+
+# In-process copy of the index: (index file mtime_ns, index data)
+_index_cache: dict[Path, tuple[Optional[int], dict]] = {}
+
+
+def _load_index(index_path: Path) -> dict:
+    mtime = _mtime_ns(index_path)
+    cached = _index_cache.get(index_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    index = {"version": INDEX_VERSION, "personas": {}}
+    if mtime is not None:
+        try:
+            loaded = json.loads(index_path.read_text())
+            if loaded.get("version") == INDEX_VERSION:
+                index = loaded
+        except (OSError, ValueError):
+            pass  # Missing or torn index: rebuild
+    _index_cache[index_path] = (mtime, index)
+    return index
+
+
+def _save_index(index_path: Path, index: dict) -> None:
+    _write_atomic(index_path, json.dumps(index))
+    _index_cache[index_path] = (_mtime_ns(index_path), index)
+
+
+def load_persona_index(personas_dir: Union[str, Path] = PERSONAS_DIR) -> dict[str, dict]:
+    """
+    Persona entries by name, from the persisted index in personas/.index.json.
+    
+    Each persona is re-scanned only when its directory or config.yaml
+    mtime differs from the one recorded in the index (adding a resume or
+    config changes the directory mtime); unchanged personas cost two
+    stat() calls. Personas that disappeared are dropped. The index file is
+    rewritten only if something changed.
     
-    return personas
+    Returns:
+        Dict of persona name -> list_personas() entry
+    """
+    personas_dir = Path(personas_dir)
+    if not personas_dir.is_dir():
+        return {}
+    
+    index_path = personas_dir / INDEX_FILE
+    index = _load_index(index_path)
+    records = index["personas"]
+    fresh: dict[str, dict] = {}
+    changed = False
+    
+    with os.scandir(personas_dir) as it:
+        for item in it:
+            if item.name.startswith(".") or not item.is_dir():
+                continue
+            persona_dir = Path(item.path)
+            stamp = [item.stat().st_mtime_ns, _mtime_ns(persona_dir / "config.yaml")]
+            record = records.get(item.name)
+            if record is None or record["stamp"] != stamp:
+                record = {"stamp": stamp, "entry": _scan_persona(persona_dir)}
+                changed = True
+            fresh[item.name] = record
+    
+    if changed or fresh.keys() != records.keys():
+        index = {"version": INDEX_VERSION, "personas": dict(sorted(fresh.items()))}
+        _save_index(index_path, index)
+    
+    return {name: record["entry"] for name, record in index["personas"].items()}
+
+
+def list_personas(personas_dir: Union[str, Path] = PERSONAS_DIR) -> list[dict]:
+    """List all available personas and their roles, sorted by name."""
+    return list(load_persona_index(personas_dir).values())
+
+
+def get_persona(name: str, personas_dir: Union[str, Path] = PERSONAS_DIR) -> Optional[dict]:
+    """
+    One persona's list_personas() entry, or None if it does not exist.
+    
+    O(1): only this persona's stamps are checked against the index.
+    """
+    personas_dir = Path(personas_dir)
+    persona_dir = personas_dir / name
+    dir_mtime = _mtime_ns(persona_dir)
+    if dir_mtime is None or name.startswith(".") or not persona_dir.is_dir():
+        return None
+    
+    index_path = personas_dir / INDEX_FILE
+    index = _load_index(index_path)
+    stamp = [dir_mtime, _mtime_ns(persona_dir / "config.yaml")]
+    record = index["personas"].get(name)
+    if record is None or record["stamp"] != stamp:
+        record = {"stamp": stamp, "entry": _scan_persona(persona_dir)}
+        personas = {**index["personas"], name: record}
+        _save_index(index_path, {"version": INDEX_VERSION, "personas": dict(sorted(personas.items()))})
+    return record["entry"]
 
 
 if __name__ == "__main__":
@@ -161,13 +639,39 @@ if __name__ == "__main__":
     parser.add_argument("--persona", help="Persona name")
     parser.add_argument("--role", help="Role identifier")
     parser.add_argument("--template", default="modern", help="Resume template")
+    parser.add_argument("--force", action="store_true", help="Rerun every stage, ignoring the manifest")
+    parser.add_argument("--dry-run", action="store_true", help="Report which stages would run, without writing")
+    parser.add_argument("--bulk", help="CSV or JSONL manifest of json_path, persona, role[, template] to ingest")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent ingests in bulk mode")
+    parser.add_argument("--compile-limit", type=int, default=None, help="Concurrent Typst compiles in bulk mode")
+    parser.add_argument(
+        "--no-update-current", action="store_true",
+        help="Leave .current_persona unchanged",
+    )
     
     args = parser.parse_args()
     
-    if args.json and args.persona and args.role:
+    if args.bulk:
+        # Bulk mode: one JSON line per item on stdout, summary on stderr
+        try:
+            items = read_bulk_manifest(args.bulk)
+        except (OSError, ValueError) as e:
+            print(json.dumps({"status": "error", "message": str(e)}), file=sys.stderr)
+            sys.exit(1)
+        summary = bulk_ingest(
+            items, args.workers, args.compile_limit, force=args.force,
+            update_current=not args.no_update_current, dry_run=args.dry_run,
+            on_result=lambda result: print(json.dumps(result), flush=True),
+        )
+        print(json.dumps(summary), file=sys.stderr)
+        sys.exit(0 if summary["errors"] == 0 else 1)
+    elif args.json and args.persona and args.role:
         # Ingestion mode
         try:
-            result = ingest_resume_from_json(args.json, args.persona, args.role, args.template)
+            result = ingest_resume_from_json(
+                args.json, args.persona, args.role, args.template,
+                force=args.force, dry_run=args.dry_run, update_current=not args.no_update_current,
+            )
             print(json.dumps(result, indent=2))
         except Exception as e:
             print(json.dumps({"status": "error", "message": str(e)}, indent=2))
@@ -0,0 +1,402 @@
+"""
+Deterministic keyword matching and alignment scoring.
+
+Implements the formula in docs/scoring_rules.md:
+
+    score = (High×3 + Med×2 + Low×1 matched) / (High×3 + Med×2 + Low×1 total) × 100
+
+Keywords and resume text are normalized the same way (lowercased, split
+into tokens, light suffix stemming), so "managed", "managing" and
+"management" match each other, and "cross-functional" matches "cross
+functional". Each keyword also matches its synonyms plus the built-in
+SYNONYMS (spelled-out acronyms and common variants).
+
+A KeywordMatcher compiles every form of every keyword into one regex,
+built as a token trie so shared prefixes are tested once. That regex scans
+the whole resume in a single pass. score_batch() scores one resume against
+many keyword lists by compiling their union and scanning once.
+
+Usage:
+    from backend.keywords import parse_keywords, score_alignment
+
+    keywords = parse_keywords({"high": ["product roadmap", "SQL"], "med": ["Jira"], "low": []})
+    result = score_alignment(data, keywords)
+    print(result.score, result.missing["high"])
+
+    python -m backend.keywords personas/alex/alex_pm_master_resume.typ stripe_keywords.json
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from .models import ResumeData
+
+
+TIERS = ("high", "med", "low")
+TIER_WEIGHTS = {"high": 3, "med": 2, "low": 1}
+_TIER_ALIASES = {"medium": "med", "🔴": "high", "🟠": "med", "🟢": "low"}
+
+# (minimum score, emoji, rating), best first
+RATINGS = (
+    (85.0, "✅", "Excellent"),
+    (70.0, "🎯", "Good"),
+    (50.0, "⚠️", "Fair"),
+    (0.0, "❌", "Poor"),
+)
+
+# Interchangeable spellings; a keyword matching any form matches all.
+# Only true equivalents (acronyms, spelling variants) belong here, not
+# the looser translations allowed by Rule 0.
+SYNONYMS = (
+    ("a/b testing", "ab testing", "split testing"),
+    ("ai", "artificial intelligence"),
+    ("ml", "machine learning"),
+    ("llm", "large language model"),
+    ("nlp", "natural language processing"),
+    ("okr", "objectives and key results"),
+    ("kpi", "key performance indicator"),
+    ("prd", "product requirements document"),
+    ("gtm", "go-to-market"),
+    ("npi", "new product introduction"),
+    ("voc", "voice of customer", "voice of the customer"),
+    ("ux", "user experience"),
+    ("ui", "user interface"),
+    ("saas", "software as a service"),
+    ("b2b", "business-to-business"),
+    ("b2c", "business-to-consumer"),
+    ("e-commerce", "ecommerce"),
+    ("sql", "structured query language"),
+    ("api", "application programming interface"),
+    ("ci/cd", "continuous integration"),
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+# Longest first; (suffix, replacement)
+_SUFFIXES = (
+    ("ations", "ate"), ("ation", "ate"), ("ments", ""), ("ment", ""),
+    ("ings", ""), ("ing", ""), ("ies", "y"), ("ied", "y"),
+    ("ers", ""), ("er", ""), ("ed", ""), ("es", ""), ("s", ""),
+)
+
+
+@lru_cache(maxsize=65536)
+def stem(token: str) -> str:
+    """
+    Light suffix-stripping stemmer for lowercase tokens.
+
+    Not linguistically exact, but deterministic: what matters is that a
+    keyword and the resume text reduce to the same stem.
+    """
+    if len(token) < 4 or not token.isalpha():
+        return token
+    if token.endswith(("ss", "us")) or (token.endswith("is") and len(token) > 4):
+        return token  # business, status, analysis
+    for suffix, replacement in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[: -len(suffix)] + replacement
+            break
+    if len(token) > 3 and token[-1] == token[-2] and token[-1] not in "aeiouls":
+        token = token[:-1]  # planned -> plann -> plan
+    if len(token) > 3 and token.endswith("e"):
+        token = token[:-1]  # manage / management -> manag
+    return token
+
+
+def normalize(text: str) -> str:
+    """Text as space-separated stems, the form keywords are matched in."""
+    return " ".join(map(stem, _TOKEN_RE.findall(text.lower())))
+
+
+@dataclass(frozen=True, slots=True)
+class Keyword:
+    term: str
+    priority: str = "med"
+    category: Optional[str] = None
+    synonyms: tuple[str, ...] = ()
+
+    def forms(self) -> set[str]:
+        """Normalized spellings that count as a match."""
+        forms = {normalize(self.term), *(normalize(s) for s in self.synonyms)}
+        for group in _synonym_groups():
+            if forms & group:
+                forms |= group
+        forms.discard("")
+        return forms
+
+
+@lru_cache(maxsize=1)
+def _synonym_groups() -> tuple[frozenset[str], ...]:
+    return tuple(frozenset(normalize(s) for s in group) for group in SYNONYMS)
+
+
+def _tier(priority: str) -> str:
+    tier = _TIER_ALIASES.get(priority.strip().lower(), priority.strip().lower())
+    if tier not in TIER_WEIGHTS:
+        raise ValueError(f"Unknown priority: {priority!r}. Use one of {list(TIERS)}")
+    return tier
+
+
+def parse_keywords(spec: Union[dict, list]) -> list[Keyword]:
+    """
+    Keywords from a JSON-style spec.
+
+    Accepts either tiers mapping to keywords,
+        {"high": ["SQL", {"term": "A/B testing", "category": "Methodology"}], "med": [...]}
+    or a flat list of objects with a priority,
+        [{"term": "SQL", "priority": "high", "synonyms": ["PostgreSQL"]}, ...]
+
+    A keyword listed twice (after normalization) keeps its highest priority.
+    """
+    if isinstance(spec, dict):
+        items = [
+            ({"term": item} if isinstance(item, str) else {**item}) | {"priority": priority}
+            for priority, terms in spec.items()
+            for item in terms
+        ]
+    elif isinstance(spec, list):
+        items = [{"term": item} if isinstance(item, str) else item for item in spec]
+    else:
+        raise ValueError(f"Expected object or array of keywords, got {type(spec).__name__}")
+
+    keywords: dict[str, Keyword] = {}
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("term"), str):
+            raise ValueError(f"Keyword must be a string or an object with a 'term': {item!r}")
+        keyword = Keyword(
+            term=item["term"],
+            priority=_tier(item.get("priority", "med")),
+            category=item.get("category"),
+            synonyms=tuple(item.get("synonyms", ())),
+        )
+        key = normalize(keyword.term)
+        if not key:
+            continue
+        existing = keywords.get(key)
+        if existing is None or TIER_WEIGHTS[keyword.priority] > TIER_WEIGHTS[existing.priority]:
+            keywords[key] = keyword
+    return list(keywords.values())
+
+
+@dataclass
+class AlignmentScore:
+    score: float
+    earned: int
+    possible: int
+    matched: dict[str, list[str]] = field(default_factory=dict)
+    missing: dict[str, list[str]] = field(default_factory=dict)
+    # Matched keyword -> where it appears, e.g. ["Stripe #2", "Skills"]
+    locations: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def rating(self) -> str:
+        return next(rating for floor, _, rating in RATINGS if self.score >= floor)
+
+    def battery(self, edits: Optional[int] = None) -> str:
+        """Battery-style line from docs/scoring_rules.md, e.g. "🎯 ████████░░ **75%** Good"."""
+        emoji = next(emoji for floor, emoji, _ in RATINGS if self.score >= floor)
+        # Truncated, so the shown percentage never crosses a rating boundary
+        percent = int(self.score)
+        line = f"{emoji} {'█' * (percent // 10)}{'░' * (10 - percent // 10)} **{percent}%** {self.rating}"
+        if edits is not None:
+            line += f" ({edits} edit{'s' if edits != 1 else ''})"
+        return line
+
+    def to_dict(self) -> dict:
+        return {
+            "score": self.score,
+            "rating": self.rating,
+            "battery": self.battery(),
+            "earned": self.earned,
+            "possible": self.possible,
+            "matched": self.matched,
+            "missing": self.missing,
+            "locations": self.locations,
+        }
+
+
+def _segments(data: Union[ResumeData, str]) -> Iterable[tuple[str, str]]:
+    """(location label, text) for every scored piece of a resume."""
+    if isinstance(data, str):
+        yield "text", data
+        return
+    if data.summary:
+        yield "Summary", data.summary
+    for entry in data.work:
+        yield entry.company, " \n ".join(filter(None, (entry.title, entry.description)))
+        for b, bullet in enumerate(entry.bullets):
+            yield f"{entry.company} #{b + 1}", bullet
+    for entry in data.projects:
+        yield entry.title, " \n ".join(filter(None, (entry.title, entry.description)))
+        for b, bullet in enumerate(entry.bullets):
+            yield f"{entry.title} #{b + 1}", bullet
+    for entry in data.education:
+        yield entry.institution, entry.degree
+        for b, bullet in enumerate(entry.bullets):
+            yield f"{entry.institution} #{b + 1}", bullet
+    for category, items in data.skills.items():
+        yield "Skills", category
+        for item in items:
+            yield "Skills", item
+
+
+def _trie_pattern(forms: Iterable[str]) -> str:
+    """Regex alternation of token sequences, sharing common prefixes."""
+    trie: dict = {}
+    for form in forms:
+        node = trie
+        for token in form.split(" "):
+            node = node.setdefault(token, {})
+        node[""] = {}  # End of a form
+
+    def alternation(node: dict, separator: str) -> str:
+        branches = [
+            separator + re.escape(token) + alternation(child, " ")
+            for token, child in sorted(node.items())
+            if token
+        ]
+        if not branches:
+            return ""
+        # Greedy "?" tries the longer form first; the caller backtracks
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+    return alternation(trie, "")
+
+
+class KeywordMatcher:
+    """
+    Compiled matcher for a list of keywords.
+
+    Building is the expensive part (normalizing every form and compiling
+    the regex); reuse one matcher to score many resumes.
+    """
+
+    def __init__(self, keywords: Iterable[Keyword]):
+        self.keywords = list(keywords)
+        owners: dict[str, set[int]] = {}
+        for i, keyword in enumerate(self.keywords):
+            for form in keyword.forms():
+                owners.setdefault(form, set()).add(i)
+
+        # A match of "product roadmap" also counts for "roadmap" and
+        # "product": the regex reports only the longest form at a position
+        padded = {form: f" {form} " for form in owners}
+        self._credits: dict[str, frozenset[int]] = {
+            form: frozenset(
+                i for sub, sub_padded in padded.items() if sub_padded in padded[form]
+                for i in owners[sub]
+            )
+            for form in owners
+        }
+        self._regex = (
+            re.compile(r"(?<!\S)(?=(" + _trie_pattern(owners) + r")(?!\S))")
+            if owners else None
+        )
+
+    def scan(self, data: Union[ResumeData, str]) -> dict[int, list[str]]:
+        """
+        Find keywords in a resume (or plain text) in one pass.
+
+        Returns:
+            Index into self.keywords -> labels of where it appears, in
+            document order
+        """
+        if self._regex is None:
+            return {}
+        findall = self._regex.findall
+        credits = self._credits
+        found: dict[int, dict[str, None]] = {}
+        for label, text in _segments(data):
+            # Repeats of a form within one segment collapse before crediting
+            for form in set(findall(normalize(text))):
+                for i in credits[form]:
+                    found.setdefault(i, {})[label] = None
+        return {i: list(where) for i, where in found.items()}
+
+    def score(self, data: Union[ResumeData, str]) -> AlignmentScore:
+        """Alignment score of a resume against these keywords."""
+        return _score(self.keywords, range(len(self.keywords)), self.scan(data))
+
+
+def _score(keywords: list[Keyword], indexes: Iterable[int], found: dict[int, list[str]]) -> AlignmentScore:
+    result = AlignmentScore(
+        score=0.0,
+        earned=0,
+        possible=0,
+        matched={tier: [] for tier in TIERS},
+        missing={tier: [] for tier in TIERS},
+    )
+    for i in indexes:
+        keyword = keywords[i]
+        weight = TIER_WEIGHTS[keyword.priority]
+        result.possible += weight
+        if i in found:
+            result.earned += weight
+            result.matched[keyword.priority].append(keyword.term)
+            result.locations[keyword.term] = found[i]
+        else:
+            result.missing[keyword.priority].append(keyword.term)
+    if result.possible:
+        result.score = round(result.earned / result.possible * 100, 1)
+    return result
+
+
+def score_alignment(data: Union[ResumeData, str], keywords: Iterable[Keyword]) -> AlignmentScore:
+    """Alignment score of one resume against one keyword list."""
+    return KeywordMatcher(keywords).score(data)
+
+
+def score_batch(
+    data: Union[ResumeData, str],
+    keyword_lists: Iterable[Iterable[Keyword]],
+) -> list[AlignmentScore]:
+    """
+    Score one resume against many keyword lists (e.g. one per JD).
+
+    The lists are compiled into a single matcher, so the resume is
+    normalized and scanned once however many lists there are.
+    """
+    keywords: list[Keyword] = []
+    ranges: list[range] = []
+    for keyword_list in keyword_lists:
+        start = len(keywords)
+        keywords.extend(keyword_list)
+        ranges.append(range(start, len(keywords)))
+
+    found = KeywordMatcher(keywords).scan(data)
+    return [_score(keywords, indexes, found) for indexes in ranges]
+
+
+def load_resume(path: Union[str, Path]) -> ResumeData:
+    """ResumeData from a resume JSON file or a generated .typ file."""
+    path = Path(path)
+    if path.suffix == ".typ":
+        from .search import parse_typst_data
+
+        return ResumeData.from_dict(parse_typst_data(path.read_text()))
+    return ResumeData.from_dict(json.loads(path.read_text()))
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Score a resume against prioritized keyword lists")
+    parser.add_argument("resume", help="Resume JSON or generated .typ file")
+    parser.add_argument("keywords", nargs="+", help="Keyword list JSON file(s), e.g. {\"high\": [...], \"med\": [...], \"low\": [...]}")
+    parser.add_argument("--battery", action="store_true", help="Print only the battery line per list")
+
+    args = parser.parse_args()
+    data = load_resume(args.resume)
+    lists = [parse_keywords(json.loads(Path(p).read_text())) for p in args.keywords]
+
+    for path, result in zip(args.keywords, score_batch(data, lists)):
+        if args.battery:
+            print(f"{result.battery()}  {path}")
+        else:
+            print(json.dumps({"keywords_file": path, **result.to_dict()}, ensure_ascii=False))
+    sys.exit(0)
@@ -0,0 +1,290 @@
+"""
+Bullet selection under a one-page line budget.
+
+Choosing which bullets to keep is a knapsack problem: each work/project
+bullet has a relevance score (e.g. from backend.rank) and a cost in lines
+(from the font-metric estimator), and the page has room for a fixed number
+of bullet lines once the name, headings, entry headers, education and
+skills are laid out. select_bullets() finds the highest-scoring subset that
+fits, while keeping at least N bullets per entry.
+
+Because of the per-entry minimums, this is a grouped knapsack. Each entry
+is solved on its own (best score for exactly j of its bullets at each
+cost), and the entries are then combined with a max-plus convolution over
+the budget. Costs are tracked in 1/STEPS_PER_LINE lines, so the spacing
+between bullets is accounted for exactly. Typical resumes solve in a
+millisecond or two.
+
+Usage:
+    from backend.knapsack import select_bullets
+    from backend.rank import relevance
+
+    selection = select_bullets(data, relevance(data, jd_text), min_bullets=2)
+    source = generate_typst(selection.data)
+
+    python -m backend.knapsack --json resume.json --jd stripe.txt --min-bullets 2 --out tailored.json
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+import numpy as np
+
+from .estimator import BLOCK_SPACING, BODY_SIZE, bullet_lines, estimate_layout, line_pitch
+from .generator import LAYOUT_DEFAULTS
+from .models import ResumeData
+
+
+# Budget resolution: costs are rounded up to this fraction of a line
+STEPS_PER_LINE = 4
+
+# Lines held back from the estimated budget: bullets occasionally wrap
+# one line more than the estimator predicts, and a selection filled to
+# the last line then spills onto page two
+BUDGET_MARGIN = 2.0
+
+# Added per bullet, larger for earlier bullets: among equal scores the
+# solver keeps more bullets, and earlier ones
+TIE_BREAK = 1e-6
+
+# (section, entry index, bullet index) — section is "work" or "projects"
+BulletRef = tuple[str, int, int]
+EntryRef = tuple[str, int]
+
+
+@dataclass
+class Selection:
+    data: ResumeData
+    kept: list[BulletRef]
+    dropped: list[BulletRef]
+    score: float
+    lines: int
+    budget: float
+    costs: dict[BulletRef, int] = field(default_factory=dict)
+
+
+def _entries(data: ResumeData) -> list[tuple[EntryRef, list[str]]]:
+    return [
+        ((section, e), entry.bullets)
+        for section in ("work", "projects")
+        for e, entry in enumerate(getattr(data, section))
+    ]
+
+
+def bullet_spacing(layout: Optional[dict] = None) -> float:
+    """
+    Lines each bullet costs beyond its wrapped line count.
+
+    The estimator stacks a bullet as lines × pitch minus one leading, plus
+    the list spacing before it; this is the difference, in lines.
+    """
+    lay = {**LAYOUT_DEFAULTS, **(layout or {})}
+    return (lay["list-spacing"] - lay["leading"]) * BODY_SIZE / line_pitch(layout)
+
+
+def line_budget(data: ResumeData, layout: Optional[dict] = None) -> float:
+    """
+    Bullet lines that fit on one page alongside everything else.
+
+    Measured with the estimator: the page height left once the resume
+    without any work/project bullets is laid out, less the block spacing
+    before each entry's first bullet, in units of line pitch.
+    """
+    lay = {**LAYOUT_DEFAULTS, **(layout or {})}
+    bare = ResumeData.from_dict(data.to_dict())
+    for _, bullets in _entries(bare):
+        bullets.clear()
+    estimate = estimate_layout(bare, layout)
+
+    # Bullets are costed with list spacing before them; the first in an
+    # entry gets block spacing instead
+    entries = sum(1 for _, bullets in _entries(data) if bullets)
+    first_bullet_extra = BLOCK_SPACING - lay["list-spacing"] * BODY_SIZE
+    free = estimate.usable_height - estimate.content_height - entries * first_bullet_extra
+    return free / line_pitch(layout)
+
+
+def _group_table(
+    values: list[float],
+    weights: list[int],
+    capacity: int,
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    """
+    0/1 knapsack over one entry's bullets, by number of bullets kept.
+
+    Returns:
+        (table, took) where table[j, w] is the best score keeping exactly
+        j bullets at total cost w, and took[i] records whether bullet i was
+        taken on the way to each state
+    """
+    n = len(values)
+    table = np.full((n + 1, capacity + 1), -np.inf)
+    table[0, 0] = 0.0
+    took: list[np.ndarray] = []
+    for value, weight in zip(values, weights):
+        candidate = np.full_like(table, -np.inf)
+        if weight <= capacity:
+            candidate[1:, weight:] = table[:-1, : capacity + 1 - weight] + value
+        take = candidate > table
+        table = np.where(take, candidate, table)
+        took.append(take)
+    return table, took
+
+
+def select_bullets(
+    data: ResumeData,
+    scores: dict[BulletRef, float],
+    min_bullets: Union[int, dict[EntryRef, int]] = 1,
+    costs: Optional[dict[BulletRef, int]] = None,
+    budget: Optional[float] = None,
+    layout: Optional[dict] = None,
+    margin: float = BUDGET_MARGIN,
+) -> Selection:
+    """
+    Keep the highest-scoring bullets that fit a one-page line budget.
+
+    Args:
+        data: Resume to select from (not modified)
+        scores: Relevance per (section, entry, bullet); missing bullets
+            score 0
+        min_bullets: Bullets to keep per work/project entry, either one
+            number for all or per (section, entry) (default 1)
+        costs: Lines per bullet; defaults to the estimator's wrapped line
+            count
+        budget: Bullet lines available; defaults to line_budget() less
+            margin
+        layout: Spacing overrides as passed to generate_typst
+        margin: Lines to keep free when the budget is estimated
+
+    Returns:
+        Selection with a new ResumeData (bullets in their original order),
+        the kept and dropped refs, total score and lines used
+
+    Raises:
+        ValueError: If the per-entry minimums alone exceed the budget
+    """
+    entries = _entries(data)
+    if budget is None:
+        budget = line_budget(data, layout) - margin
+    per_bullet = bullet_spacing(layout)
+    capacity = max(math.floor(budget * STEPS_PER_LINE + 1e-9), 0)
+
+    line_costs: dict[BulletRef, int] = {}
+    groups = []
+    position = sum(len(bullets) for _, bullets in entries)
+    for (section, e), bullets in entries:
+        refs = [(section, e, b) for b in range(len(bullets))]
+        for ref, text in zip(refs, bullets):
+            line_costs[ref] = costs[ref] if costs and ref in costs else bullet_lines(text, layout)
+        weights = [math.ceil((line_costs[ref] + per_bullet) * STEPS_PER_LINE - 1e-9) for ref in refs]
+        values = []
+        for ref in refs:
+            values.append(scores.get(ref, 0.0) + TIE_BREAK * position)
+            position -= 1
+        minimum = min_bullets.get((section, e), 1) if isinstance(min_bullets, dict) else min_bullets
+        table, took = _group_table(values, weights, capacity)
+        # Best over "at least minimum" bullets, per cost
+        allowed = table[min(minimum, len(refs)):]
+        counts = allowed.argmax(axis=0) + min(minimum, len(refs))
+        groups.append((refs, weights, took, allowed.max(axis=0), counts))
+
+    # Combine entries: best[c] is the top score of entries so far at cost c
+    best = np.full(capacity + 1, -np.inf)
+    best[0] = 0.0
+    spent = np.arange(capacity + 1)[:, None] - np.arange(capacity + 1)[None, :]
+    choices = []
+    for refs, weights, took, group_best, counts in groups:
+        combined = np.where(spent >= 0, best[np.clip(spent, 0, None)] + group_best[None, :], -np.inf)
+        choice = combined.argmax(axis=1)
+        best = combined[np.arange(capacity + 1), choice]
+        choices.append(choice)
+
+    if not np.isfinite(best).any():
+        raise ValueError(
+            f"Per-entry minimums do not fit the budget of {budget:.1f} bullet lines; "
+            "lower min_bullets or tighten the layout"
+        )
+
+    # Walk back through entries, then through each entry's bullets
+    cost = int(best.argmax())
+    kept: set[BulletRef] = set()
+    for (refs, weights, took, group_best, counts), choice in zip(reversed(groups), reversed(choices)):
+        w = int(choice[cost])
+        cost -= w
+        j = int(counts[w])
+        for i in range(len(refs) - 1, -1, -1):
+            if j and took[i][j, w]:
+                kept.add(refs[i])
+                j -= 1
+                w -= weights[i]
+
+    selected = ResumeData.from_dict(data.to_dict())
+    for (section, e), bullets in _entries(selected):
+        bullets[:] = [text for b, text in enumerate(bullets) if (section, e, b) in kept]
+
+    ordered = [ref for (section, e), bullets in entries for ref in ((section, e, b) for b in range(len(bullets)))]
+    return Selection(
+        data=selected,
+        kept=[ref for ref in ordered if ref in kept],
+        dropped=[ref for ref in ordered if ref not in kept],
+        score=round(sum(scores.get(ref, 0.0) for ref in kept), 4),
+        lines=sum(line_costs[ref] for ref in kept),
+        budget=round(budget, 2),
+        costs=line_costs,
+    )
+
+
+def tailor_to_page(master: ResumeData, jd_text: str) -> ResumeData:
+    """
+    Tailor for backend.batch: keep the bullets most relevant to the JD that fit one page.
+
+    Falls back to the full master when even one bullet per entry cannot fit.
+    """
+    from .rank import relevance
+
+    try:
+        return select_bullets(master, relevance(master, jd_text)).data
+    except ValueError:
+        return ResumeData.from_dict(master.to_dict())
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+    import time
+    from pathlib import Path
+
+    from .keywords import load_resume
+    from .rank import relevance
+
+    parser = argparse.ArgumentParser(description="Select the most relevant bullets that fit one page")
+    parser.add_argument("--json", required=True, help="Resume JSON or generated .typ file")
+    parser.add_argument("--jd", required=True, help="Job description text file")
+    parser.add_argument("--min-bullets", type=int, default=1, help="Bullets to keep per entry")
+    parser.add_argument("--budget", type=float, default=None, help="Bullet lines available (default: estimated)")
+    parser.add_argument("--out", help="Write the selected resume JSON here")
+
+    args = parser.parse_args()
+    data = load_resume(args.json)
+    scores = relevance(data, Path(args.jd).read_text())
+    start = time.perf_counter()
+    selection = select_bullets(data, scores, args.min_bullets, budget=args.budget)
+    elapsed = time.perf_counter() - start
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(selection.data.to_dict(), indent=2, ensure_ascii=False))
+    print(json.dumps({
+        "kept": len(selection.kept),
+        "dropped": [
+            {"section": s, "entry": e, "bullet": b, "text": getattr(data, s)[e].bullets[b]}
+            for s, e, b in selection.dropped
+        ],
+        "score": selection.score,
+        "lines": selection.lines,
+        "budget": selection.budget,
+        "estimated_pages": estimate_layout(selection.data).pages,
+        "seconds": round(elapsed, 4),
+    }, indent=2, ensure_ascii=False))
+    sys.exit(0)
@@ -0,0 +1,241 @@
+"""
+Structured PDF layout extraction shared by the extractors and the monitor.
+
+A PDF is parsed once with PyMuPDF's ``get_text("dict")`` into a compact,
+array-backed PdfLayout: one flat array per attribute (bbox coordinates,
+font sizes, flags, owning block/page) across the whole document instead of
+nested dicts per span. Consumers index into the arrays; text is only joined
+on demand.
+
+Usage:
+    from backend.layout import extract_layout
+
+    layout = extract_layout("resume.pdf")
+    for b in layout.page_blocks(0):
+        print(layout.block_bbox(b), layout.block_text(b))
+"""
+
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import fitz  # PyMuPDF
+
+
+# PyMuPDF span flag bit for bold fonts
+FLAG_BOLD = 16
+
+PdfSource = Union[str, Path, bytes, "fitz.Document"]
+
+
+@contextmanager
+def open_pdf(source: PdfSource) -> Iterator["fitz.Document"]:
+    """
+    Open a PDF from a path, raw bytes, or an already-open document.
+
+    Documents opened here are closed on exit; a caller-supplied document
+    is left open for the caller.
+    """
+    if isinstance(source, fitz.Document):
+        yield source
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        doc = fitz.open(stream=bytes(source), filetype="pdf")
+    else:
+        doc = fitz.open(source)
+    with doc:
+        yield doc
+
+
+class PdfLayout:
+    """
+    Array-backed layout of a PDF: pages → blocks → lines → spans.
+
+    Every level is stored as parallel flat arrays indexed by a global id.
+    Children of item ``i`` occupy ``[start[i], start[i + 1])`` in the next
+    level, so ranges are O(1) slices.
+    """
+
+    def __init__(self):
+        # Pages
+        self.page_width = array("d")
+        self.page_height = array("d")
+        self.page_block_start = array("i", [0])
+
+        # Blocks (text and image; image blocks own no lines)
+        self.block_x0 = array("d")
+        self.block_y0 = array("d")
+        self.block_x1 = array("d")
+        self.block_y1 = array("d")
+        self.block_is_text = array("b")
+        self.block_page = array("i")
+        self.block_line_start = array("i", [0])
+
+        # Lines
+        self.line_x0 = array("d")
+        self.line_y0 = array("d")
+        self.line_x1 = array("d")
+        self.line_y1 = array("d")
+        self.line_block = array("i")
+        self.line_span_start = array("i", [0])
+
+        # Spans
+        self.span_x0 = array("d")
+        self.span_y0 = array("d")
+        self.span_x1 = array("d")
+        self.span_y1 = array("d")
+        self.span_size = array("d")
+        self.span_flags = array("i")
+        self.span_line = array("i")
+        self.span_text: list[str] = []
+
+    # --- Building ---
+
+    def add_page(self, page: "fitz.Page") -> int:
+        """Append one page's layout. Returns its page index."""
+        page_index = len(self.page_width)
+        self.page_width.append(page.rect.width)
+        self.page_height.append(page.rect.height)
+
+        for block in page.get_text("dict")["blocks"]:
+            block_index = len(self.block_x0)
+            x0, y0, x1, y1 = block["bbox"]
+            self.block_x0.append(x0)
+            self.block_y0.append(y0)
+            self.block_x1.append(x1)
+            self.block_y1.append(y1)
+            self.block_page.append(page_index)
+            is_text = block.get("type", 0) == 0
+            self.block_is_text.append(is_text)
+
+            for line in block.get("lines", ()) if is_text else ():
+                line_index = len(self.line_x0)
+                x0, y0, x1, y1 = line["bbox"]
+                self.line_x0.append(x0)
+                self.line_y0.append(y0)
+                self.line_x1.append(x1)
+                self.line_y1.append(y1)
+                self.line_block.append(block_index)
+
+                for span in line["spans"]:
+                    x0, y0, x1, y1 = span["bbox"]
+                    self.span_x0.append(x0)
+                    self.span_y0.append(y0)
+                    self.span_x1.append(x1)
+                    self.span_y1.append(y1)
+                    self.span_size.append(span["size"])
+                    flags = span["flags"]
+                    if "bold" in span.get("font", "").lower():
+                        flags |= FLAG_BOLD
+                    self.span_flags.append(flags)
+                    self.span_line.append(line_index)
+                    self.span_text.append(span["text"])
+
+                self.line_span_start.append(len(self.span_size))
+
+            self.block_line_start.append(len(self.line_x0))
+
+        self.page_block_start.append(len(self.block_x0))
+        return page_index
+
+    # --- Sizes ---
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_width)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_x0)
+
+    # --- Ranges ---
+
+    def page_blocks(self, page: int) -> range:
+        return range(self.page_block_start[page], self.page_block_start[page + 1])
+
+    def block_lines(self, block: int) -> range:
+        return range(self.block_line_start[block], self.block_line_start[block + 1])
+
+    def line_spans(self, line: int) -> range:
+        return range(self.line_span_start[line], self.line_span_start[line + 1])
+
+    # --- Accessors ---
+
+    def block_bbox(self, block: int) -> tuple[float, float, float, float]:
+        return (
+            self.block_x0[block], self.block_y0[block],
+            self.block_x1[block], self.block_y1[block],
+        )
+
+    def line_bbox(self, line: int) -> tuple[float, float, float, float]:
+        return (
+            self.line_x0[line], self.line_y0[line],
+            self.line_x1[line], self.line_y1[line],
+        )
+
+    def line_text(self, line: int) -> str:
+        start, end = self.line_span_start[line], self.line_span_start[line + 1]
+        return "".join(self.span_text[start:end])
+
+    def line_size(self, line: int) -> float:
+        """Largest font size on a line."""
+        spans = self.line_spans(line)
+        return max((self.span_size[s] for s in spans), default=0.0)
+
+    def line_is_bold(self, line: int) -> bool:
+        """True if every non-blank span on the line is bold."""
+        spans = [s for s in self.line_spans(line) if self.span_text[s].strip()]
+        return bool(spans) and all(self.span_flags[s] & FLAG_BOLD for s in spans)
+
+    def block_text(self, block: int) -> str:
+        return "\n".join(self.line_text(i) for i in self.block_lines(block))
+
+    def sorted_text_blocks(self, page: int) -> list[int]:
+        """Text block ids of a page in reading order (top, then left)."""
+        blocks = [b for b in self.page_blocks(page) if self.block_is_text[b]]
+        blocks.sort(key=lambda b: (self.block_y0[b], self.block_x0[b]))
+        return blocks
+
+
+def iter_page_layouts(
+    source: PdfSource,
+    max_pages: Optional[int] = None,
+) -> Iterator[PdfLayout]:
+    """
+    Stream a PDF as one single-page PdfLayout per page.
+
+    Memory stays bounded by the largest page, for callers that only need
+    one page at a time.
+    """
+    with open_pdf(source) as doc:
+        for page_num, page in enumerate(doc):
+            if max_pages is not None and page_num >= max_pages:
+                break
+            layout = PdfLayout()
+            layout.add_page(page)
+            yield layout
+
+
+def extract_layout(
+    source: PdfSource,
+    max_pages: Optional[int] = None,
+) -> PdfLayout:
+    """
+    Parse a PDF into a PdfLayout in a single pass.
+
+    Args:
+        source: Path, PDF bytes, or an open fitz.Document
+        max_pages: Only parse the first N pages
+
+    Returns:
+        Layout of the whole document (or its first max_pages pages)
+    """
+    layout = PdfLayout()
+    with open_pdf(source) as doc:
+        for page_num, page in enumerate(doc):
+            if max_pages is not None and page_num >= max_pages:
+                break
+            layout.add_page(page)
+    return layout
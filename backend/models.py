@@ -1,14 +1,109 @@
 """
 Resume data models.
 
-Simple dataclasses for structured resume data. No external dependencies.
+Simple slotted dataclasses for structured resume data. No external
+dependencies.
+
+to_dict/from_dict are written out per field instead of using
+dataclasses.asdict and **kwargs: serialization avoids asdict's recursive
+deep copy, and from_dict type-checks every field and reports all problems,
+each with its JSON path, in a single ResumeValidationError.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+class ResumeValidationError(ValueError):
+    """
+    Resume JSON does not match the schema.
+
+    Attributes:
+        errors: One message per problem, prefixed with its JSON path
+            (e.g. "$.work[2].bullets[0]: expected string, got int")
+    """
+
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+        super().__init__(
+            f"{len(errors)} error(s) in resume data:\n" + "\n".join(f"  {e}" for e in errors)
+        )
+
+
+# --- Field readers: append to `errors` and return a usable default ---
+
+_STR_TYPE = {str}
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+def _object(data: Any, path: str, errors: list[str], fields: frozenset[str]) -> bool:
+    """Check data is a JSON object with only known keys."""
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected object, got {_type_name(data)}")
+        return False
+    if not data.keys() <= fields:
+        for key in data:
+            if key not in fields:
+                errors.append(f"{path}.{key}: unknown field")
+    return True
+
+
+def _str(data: dict, key: str, path: str, errors: list[str], default: Optional[str] = None) -> str:
+    """Required string if default is None, else optional with that default."""
+    value = data.get(key)
+    if type(value) is str:
+        return value
+    if value is None:
+        if default is None:
+            errors.append(f"{path}.{key}: missing required field")
+            return ""
+        return default
+    if not isinstance(value, str):
+        errors.append(f"{path}.{key}: expected string, got {_type_name(value)}")
+        return default or ""
+    return value
 
 
-@dataclass
+def _opt_str(data: dict, key: str, path: str, errors: list[str]) -> Optional[str]:
+    value = data.get(key)
+    if value is None or type(value) is str:
+        return value
+    if not isinstance(value, str):
+        errors.append(f"{path}.{key}: expected string or null, got {_type_name(value)}")
+        return None
+    return value
+
+
+def _str_list(value: Any, path: str, errors: list[str]) -> list[str]:
+    """List of strings at path (the list's own path, e.g. $.work[0].bullets)."""
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        errors.append(f"{path}: expected array, got {_type_name(value)}")
+        return []
+    if set(map(type, value)) <= _STR_TYPE:
+        return value[:]
+    for i, item in enumerate(value):
+        if not isinstance(item, str):
+            errors.append(f"{path}[{i}]: expected string, got {_type_name(item)}")
+    return [item for item in value if isinstance(item, str)]
+
+
+def _entries(data: dict, key: str, path: str, errors: list[str], parse) -> list:
+    value = data.get(key)
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        errors.append(f"{path}.{key}: expected array, got {_type_name(value)}")
+        return []
+    entries = (parse(item, f"{path}.{key}[{i}]", errors) for i, item in enumerate(value))
+    return [entry for entry in entries if entry is not None]
+
+
+@dataclass(slots=True)
 class Contact:
     name: str
     email: str
@@ -18,8 +113,35 @@ class Contact:
     linkedin: Optional[str] = None
     website: Optional[str] = None
 
+    _FIELDS = frozenset(("name", "email", "phone", "location", "preferred_name", "linkedin", "website"))
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "location": self.location,
+            "preferred_name": self.preferred_name,
+            "linkedin": self.linkedin,
+            "website": self.website,
+        }
+
+    @classmethod
+    def _parse(cls, data: Any, path: str, errors: list[str]) -> Optional["Contact"]:
+        if not _object(data, path, errors, cls._FIELDS):
+            return None
+        return cls(
+            name=_str(data, "name", path, errors),
+            email=_str(data, "email", path, errors),
+            phone=_str(data, "phone", path, errors, ""),
+            location=_str(data, "location", path, errors, ""),
+            preferred_name=_opt_str(data, "preferred_name", path, errors),
+            linkedin=_opt_str(data, "linkedin", path, errors),
+            website=_opt_str(data, "website", path, errors),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class WorkEntry:
     title: str
     company: str
@@ -28,8 +150,33 @@ class WorkEntry:
     url: Optional[str] = None
     description: Optional[str] = None
 
+    _FIELDS = frozenset(("title", "company", "dates", "bullets", "url", "description"))
 
-@dataclass
+    def to_dict(self) -> dict:
+        return {
+            "title": self.title,
+            "company": self.company,
+            "dates": self.dates,
+            "bullets": list(self.bullets),
+            "url": self.url,
+            "description": self.description,
+        }
+
+    @classmethod
+    def _parse(cls, data: Any, path: str, errors: list[str]) -> Optional["WorkEntry"]:
+        if not _object(data, path, errors, cls._FIELDS):
+            return None
+        return cls(
+            title=_str(data, "title", path, errors),
+            company=_str(data, "company", path, errors),
+            dates=_str(data, "dates", path, errors),
+            bullets=_str_list(data.get("bullets"), f"{path}.bullets", errors),
+            url=_opt_str(data, "url", path, errors),
+            description=_opt_str(data, "description", path, errors),
+        )
+
+
+@dataclass(slots=True)
 class ProjectEntry:
     title: str
     dates: str
@@ -37,8 +184,31 @@ class ProjectEntry:
     url: Optional[str] = None
     description: Optional[str] = None
 
+    _FIELDS = frozenset(("title", "dates", "bullets", "url", "description"))
+
+    def to_dict(self) -> dict:
+        return {
+            "title": self.title,
+            "dates": self.dates,
+            "bullets": list(self.bullets),
+            "url": self.url,
+            "description": self.description,
+        }
+
+    @classmethod
+    def _parse(cls, data: Any, path: str, errors: list[str]) -> Optional["ProjectEntry"]:
+        if not _object(data, path, errors, cls._FIELDS):
+            return None
+        return cls(
+            title=_str(data, "title", path, errors),
+            dates=_str(data, "dates", path, errors),
+            bullets=_str_list(data.get("bullets"), f"{path}.bullets", errors),
+            url=_opt_str(data, "url", path, errors),
+            description=_opt_str(data, "description", path, errors),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class EducationEntry:
     degree: str
     institution: str
@@ -46,8 +216,31 @@ class EducationEntry:
     bullets: list[str] = field(default_factory=list)
     url: Optional[str] = None
 
+    _FIELDS = frozenset(("degree", "institution", "dates", "bullets", "url"))
 
-@dataclass
+    def to_dict(self) -> dict:
+        return {
+            "degree": self.degree,
+            "institution": self.institution,
+            "dates": self.dates,
+            "bullets": list(self.bullets),
+            "url": self.url,
+        }
+
+    @classmethod
+    def _parse(cls, data: Any, path: str, errors: list[str]) -> Optional["EducationEntry"]:
+        if not _object(data, path, errors, cls._FIELDS):
+            return None
+        return cls(
+            degree=_str(data, "degree", path, errors),
+            institution=_str(data, "institution", path, errors),
+            dates=_str(data, "dates", path, errors),
+            bullets=_str_list(data.get("bullets"), f"{path}.bullets", errors),
+            url=_opt_str(data, "url", path, errors),
+        )
+
+
+@dataclass(slots=True)
 class ResumeData:
     contact: Contact
     work: list[WorkEntry] = field(default_factory=list)
@@ -56,18 +249,60 @@ class ResumeData:
     skills: dict[str, list[str]] = field(default_factory=dict)
     summary: Optional[str] = None
 
+    _FIELDS = frozenset(("contact", "work", "projects", "education", "skills", "summary"))
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            "contact": self.contact.to_dict(),
+            "work": [entry.to_dict() for entry in self.work],
+            "projects": [entry.to_dict() for entry in self.projects],
+            "education": [entry.to_dict() for entry in self.education],
+            "skills": {category: list(items) for category, items in self.skills.items()},
+            "summary": self.summary,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "ResumeData":
-        """Create ResumeData from dictionary."""
+        """
+        Create ResumeData from dictionary.
+
+        Raises:
+            ResumeValidationError: Listing every missing, unknown or
+                mistyped field with its JSON path
+        """
+        path = "$"
+        errors: list[str] = []
+        if not _object(data, path, errors, cls._FIELDS):
+            raise ResumeValidationError(errors)
+
+        contact = None
+        if "contact" not in data:
+            errors.append(f"{path}.contact: missing required field")
+        else:
+            contact = Contact._parse(data["contact"], f"{path}.contact", errors)
+        work = _entries(data, "work", path, errors, WorkEntry._parse)
+        projects = _entries(data, "projects", path, errors, ProjectEntry._parse)
+        education = _entries(data, "education", path, errors, EducationEntry._parse)
+
+        skills: dict[str, list[str]] = {}
+        raw_skills = data.get("skills")
+        if isinstance(raw_skills, dict):
+            for category, items in raw_skills.items():
+                # Categories are free text ("Cloud & DevOps"), so always quoted
+                skills[category] = _str_list(items, f"{path}.skills[{json.dumps(category)}]", errors)
+        elif raw_skills is not None:
+            errors.append(f"{path}.skills: expected object, got {_type_name(raw_skills)}")
+
+        summary = _opt_str(data, "summary", path, errors)
+
+        if errors:
+            raise ResumeValidationError(errors)
         return cls(
-            contact=Contact(**data.get("contact", {})),
-            work=[WorkEntry(**w) for w in data.get("work", [])],
-            projects=[ProjectEntry(**p) for p in data.get("projects", [])],
-            education=[EducationEntry(**e) for e in data.get("education", [])],
-            skills=data.get("skills", {}),
-            summary=data.get("summary"),
+            contact=contact,
+            work=work,
+            projects=projects,
+            education=education,
+            skills=skills,
+            summary=summary,
         )
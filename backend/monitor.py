@@ -1,109 +1,263 @@
 """
 Monitor for resume quality issues (runts/orphans, overflow).
+
+Both checks accept a path, the PDF bytes (e.g. from an in-memory compile)
+or an already-extracted PdfLayout, so a pipeline can parse the PDF once
+(backend.layout.extract_layout) and share it.
 """
 
-import fitz  # PyMuPDF
-import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from .layout import PdfLayout, extract_layout
+
+
+# A paragraph's last line narrower than this fraction of its column is a runt
+RUNT_RATIO = 0.2
+
+# Lines are aligned (same x, same row, same height) within this many pt
+ALIGN_TOLERANCE = 1.0
+
+# A line continues the paragraph above if the vertical gap between them is
+# under this fraction of the line height (list items are spaced wider)
+LINE_GAP_RATIO = 0.8
+
+# Glyphs narrower than this fraction of their line height are list markers
+MARKER_RATIO = 0.5
+
+
+def _as_layout(pdf: Union[str, Path, bytes, PdfLayout]) -> PdfLayout:
+    """Reuse a layout if given one, otherwise parse the PDF once."""
+    if isinstance(pdf, PdfLayout):
+        return pdf
+    return extract_layout(pdf)
+
+
+def _paragraphs(layout: PdfLayout) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Group the document's text lines into paragraphs, vectorized.
+
+    PDF blocks do not reliably follow paragraphs (Typst emits each wrapped
+    line as its own block), so paragraphs are rebuilt from line geometry:
+    a line continues the paragraph above it when it is on the same page,
+    starts at the same x, has the same height and sits within one line gap
+    below. A list marker on a line's row starts a new paragraph.
+
+    Returns:
+        (order, starts): text line ids in reading order, and the offsets
+        in `order` where each paragraph begins
+    """
+    x0 = np.frombuffer(layout.line_x0, dtype=np.float64)
+    y0 = np.frombuffer(layout.line_y0, dtype=np.float64)
+    x1 = np.frombuffer(layout.line_x1, dtype=np.float64)
+    y1 = np.frombuffer(layout.line_y1, dtype=np.float64)
+    block = np.frombuffer(layout.line_block, dtype=np.int32)
+    page = np.frombuffer(layout.block_page, dtype=np.int32)[block]
+    height = y1 - y0
+
+    # Bullet glyphs: a line much narrower than it is tall
+    is_marker = (x1 - x0) < MARKER_RATIO * height
 
-def detect_runts(pdf_path: str, threshold_chars: int = 15) -> list[dict]:
+    # Reading order: page, then top, then left
+    order = np.lexsort((x0, y0, page))
+    marker_before = np.zeros(len(order), dtype=bool)
+    marker_before[1:] = is_marker[order[:-1]] & (np.abs(y0[order[1:]] - y0[order[:-1]]) < ALIGN_TOLERANCE)
+    text = ~is_marker[order]
+    order, marker_before = order[text], marker_before[text]
+    if len(order) == 0:
+        return order, np.zeros(0, dtype=np.intp)
+
+    cur, prev = order[1:], order[:-1]
+    continues = (
+        (page[cur] == page[prev])
+        & (np.abs(x0[cur] - x0[prev]) < ALIGN_TOLERANCE)
+        & (np.abs(height[cur] - height[prev]) < ALIGN_TOLERANCE)
+        & (y0[cur] > y1[prev] - ALIGN_TOLERANCE)
+        & (y0[cur] - y1[prev] < LINE_GAP_RATIO * height[prev])
+        & ~marker_before[1:]
+    )
+    starts = np.flatnonzero(np.concatenate(([True], ~continues)))
+    return order, starts
+
+
+def detect_runts(pdf_path: Union[str, Path, bytes, PdfLayout], max_ratio: float = RUNT_RATIO) -> list[dict]:
     """
     Detect lines that are "runts" (orphans) - very short final lines of paragraphs.
     
+    Works on line bounding boxes rather than character counts: the last
+    line of every multi-line paragraph is compared with the paragraph's
+    column width (its widest line), across the whole document at once.
+    Single-line paragraphs such as dates, names and headings are never
+    runts.
+    
     Args:
-        pdf_path: Path to PDF
-        threshold_chars: Lines shorter than this are considered runts
+        pdf_path: Path to PDF, its bytes, or a PdfLayout already extracted from it
+        max_ratio: Last lines narrower than this fraction of the column
+            are runts
         
     Returns:
-        List of dicts identifying the page and content of runts
+        List of dicts with the page, text, context and width_ratio of each runt
     """
-    doc = fitz.open(pdf_path)
+    layout = _as_layout(pdf_path)
+    order, starts = _paragraphs(layout)
+    if len(starts) == 0:
+        return []
+    
+    x0 = np.frombuffer(layout.line_x0, dtype=np.float64)[order]
+    x1 = np.frombuffer(layout.line_x1, dtype=np.float64)[order]
+    ends = np.append(starts[1:], len(order))
+    last = ends - 1
+    
+    column = np.maximum.reduceat(x1, starts) - x0[starts]
+    ratio = (x1[last] - x0[last]) / np.maximum(column, 1e-6)
+    is_runt = ((ends - starts) >= 2) & (ratio < max_ratio)
+    
     runts = []
+    for p in np.flatnonzero(is_runt):
+        line = int(order[last[p]])
+        text = layout.line_text(line).strip()
+        context = layout.line_text(int(order[last[p] - 1])).strip()
+        runts.append({
+            "page": layout.block_page[layout.line_block[line]] + 1,
+            "text": text,
+            "context": context[-50:] + " " + text,
+            "width_ratio": round(float(ratio[p]), 3),
+        })
     
-    for page_num, page in enumerate(doc):
-        # proper extraction of text blocks relative to layout
-        blocks = page.get_text("blocks")
-        
-        for block in blocks:
-            text = block[4].strip()
-            # Split into lines (this assumes visual lines map roughly to \\n or block logic)
-            # PyMuPDF block text often groups paragraph content. 
-            # We need a better heuristic: check the length of the *last line* of the block.
-            
-            # Re-fetch as dict to get individual spans/lines if needed, 
-            # but simple newline splitting on text blocks works for most simple PDFs
-            lines = text.split('\n')
-            
-            if not lines:
-                continue
-                
-            last_line = lines[-1].strip()
-            
-            # Check if it's a runt:
-            # 1. It must be short
-            # 2. It shouldn't be a standalone bullet that is naturally short (like a skill or date)
-            #    We test this by checking if the PREVIOUS line was "full".
-            #    Actually, simpler heuristic: if it's < threshold and not a bullet point marker.
-            
-            if 0 < len(last_line) <= threshold_chars:
-                # Filter out obvious non-runts
-                if re.match(r'^[\u2022\-\*]\s*$', last_line): 
-                    continue # Just a bullet marker
-                if re.match(r'^\d{4}\s*[\u2013\-]\s*(Present|\d{4})$', last_line):
-                    continue # Date range
-                # Filter out section headings
-                if last_line in ['Work', 'Education', 'Skills', 'Projects', 'Experience', 'Summary']:
-                    continue
-                # Filter out names (title case, 2-3 words)
-                if re.match(r'^[A-Z][a-z]+(\s+[A-Z][a-z]+){0,2}$', last_line):
-                    continue
-                    
-                context = lines[-2] if len(lines) > 1 else ""
-                runts.append({
-                    "page": page_num + 1,
-                    "text": last_line,
-                    "context": context[-50:] + " " + last_line
-                })
-                
     return runts
 
 
-def check_page_fill(pdf_path: str) -> dict:
+def _content_bbox(layout: PdfLayout, page: int) -> Optional[tuple[float, float, float, float]]:
+    """Union of all block bboxes on a page, or None if it is empty."""
+    blocks = layout.page_blocks(page)
+    if not blocks:
+        return None
+    return (
+        min(layout.block_x0[b] for b in blocks),
+        min(layout.block_y0[b] for b in blocks),
+        max(layout.block_x1[b] for b in blocks),
+        max(layout.block_y1[b] for b in blocks),
+    )
+
+
+def _fill_result(fill_percent: float) -> dict:
+    result = {
+        "fill_percent": round(fill_percent, 1),
+        "warning": fill_percent < 60,
+        "suggestion": None
+    }
+    
+    if fill_percent < 40:
+        result["suggestion"] = "Resume is very sparse. Consider adding more content."
+    elif fill_percent < 60:
+        result["suggestion"] = "Resume has significant whitespace. Consider adding content or reducing margins."
+    
+    return result
+
+
+def check_page_fill(pdf_path: Union[str, Path, bytes, PdfLayout]) -> dict:
     """
     Check how much of the page is filled with content.
     
+    Args:
+        pdf_path: Path to PDF, its bytes, or a PdfLayout already extracted from it
+    
     Returns dict with:
         - fill_percent: Approximate percentage of page used
         - warning: True if <60% filled
         - suggestion: Recommendation if sparse
     """
-    doc = fitz.open(pdf_path)
-    if len(doc) == 0:
+    layout = _as_layout(pdf_path)
+    if layout.page_count == 0:
         return {"fill_percent": 0, "warning": True, "suggestion": "Empty document"}
     
-    page = doc[0]
-    page_height = page.rect.height
-    
     # Get bounding box of all content
-    blocks = page.get_text("blocks")
-    if not blocks:
+    bbox = _content_bbox(layout, 0)
+    if bbox is None:
         return {"fill_percent": 0, "warning": True, "suggestion": "No text content"}
     
-    # Find content bounds
-    max_y = max(block[3] for block in blocks)  # bottom
-    min_y = min(block[1] for block in blocks)  # top
-    
-    content_height = max_y - min_y
-    fill_percent = (content_height / page_height) * 100
+    content_height = bbox[3] - bbox[1]
+    return _fill_result(content_height / layout.page_height[0] * 100)
+
+
+@dataclass
+class PageAnalysis:
+    number: int  # 1-based
+    width: float
+    height: float
+    content_bbox: Optional[tuple[float, float, float, float]]
+    fill_percent: float
+
+
+@dataclass
+class PdfAnalysis:
+    page_count: int
+    runts: list[dict]
+    pages: list[PageAnalysis]
+    layout: PdfLayout = field(repr=False)
+
+    @property
+    def fill(self) -> dict:
+        """First-page fill, in the same shape as check_page_fill()."""
+        if not self.pages:
+            return {"fill_percent": 0, "warning": True, "suggestion": "Empty document"}
+        if self.pages[0].content_bbox is None:
+            return {"fill_percent": 0, "warning": True, "suggestion": "No text content"}
+        return _fill_result(self.pages[0].fill_percent)
+
+    def to_dict(self) -> dict:
+        return {
+            "page_count": self.page_count,
+            "runts": self.runts,
+            "fill": self.fill,
+            "pages": [
+                {
+                    "number": p.number,
+                    "width": p.width,
+                    "height": p.height,
+                    "content_bbox": list(p.content_bbox) if p.content_bbox else None,
+                    "fill_percent": p.fill_percent,
+                }
+                for p in self.pages
+            ],
+        }
+
+
+def analyze_pdf(pdf: Union[str, Path, bytes, PdfLayout], max_ratio: float = RUNT_RATIO) -> PdfAnalysis:
+    """
+    Run every check on one parse of the PDF.
     
-    result = {
-        "fill_percent": round(fill_percent, 1),
-        "warning": fill_percent < 60,
-        "suggestion": None
-    }
+    The document is opened and its text extracted once (and closed again);
+    page count, runts, and per-page content bounds and fill all come from
+    that single layout.
     
-    if fill_percent < 40:
-        result["suggestion"] = "Resume is very sparse. Consider adding more content."
-    elif fill_percent < 60:
-        result["suggestion"] = "Resume has significant whitespace. Consider adding content or reducing margins."
+    Args:
+        pdf: Path to PDF, its bytes, or a PdfLayout already extracted from it
+        max_ratio: Runt width threshold (see detect_runts)
+        
+    Returns:
+        PdfAnalysis with page_count, runts, pages and the shared layout
+    """
+    layout = _as_layout(pdf)
+    pages = []
+    for page in range(layout.page_count):
+        bbox = _content_bbox(layout, page)
+        height = layout.page_height[page]
+        fill = (bbox[3] - bbox[1]) / height * 100 if bbox else 0.0
+        pages.append(PageAnalysis(
+            number=page + 1,
+            width=layout.page_width[page],
+            height=height,
+            content_bbox=bbox,
+            fill_percent=round(fill, 1),
+        ))
     
-    return result
+    return PdfAnalysis(
+        page_count=layout.page_count,
+        runts=detect_runts(layout, max_ratio),
+        pages=pages,
+        layout=layout,
+    )
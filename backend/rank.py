@@ -0,0 +1,269 @@
+"""
+Vectorized relevance ranking of resume bullets against job descriptions.
+
+Every work/project bullet of a ResumeData is tokenized once (the same
+stemmed tokens as backend.keywords) into a sparse term-count matrix, kept
+as plain CSR arrays (indptr, indices, counts) to avoid a SciPy dependency.
+The index is cached per resume content, so ranking the same resume against
+new JDs never re-tokenizes it.
+
+Scoring one or many JDs is a single matrix product:
+
+    scores (JDs × bullets) = Q (JDs × V) @ Wᵀ (V × bullets)
+
+W holds per-bullet BM25 term weights (or L2-normalized TF-IDF for cosine
+similarity). Only the V terms shared by the bullets and the JDs are
+densified, which keeps the product small enough for one BLAS call.
+
+Usage:
+    from backend.rank import rank_bullets
+
+    for hit in rank_bullets(data, jd_text)[:10]:
+        print(hit["score"], hit["text"])
+
+    python -m backend.rank --json resume.json --jd stripe.txt --top 10
+"""
+
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain, repeat
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .cache import hash_bytes
+from .keywords import normalize
+from .models import ResumeData
+
+
+METHODS = ("bm25", "tfidf")
+
+# Standard BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Cached indexes, keyed by resume content
+INDEX_CACHE_SIZE = 32
+
+# (section, entry index, bullet index), as used by backend.fit
+BulletRef = tuple[str, int, int]
+
+
+@dataclass
+class BulletIndex:
+    """Term counts of every bullet, as a CSR matrix (bullets × vocabulary)."""
+
+    refs: list[BulletRef]
+    texts: list[str]
+    vocab: dict[str, int]
+    indptr: np.ndarray   # (bullets + 1,) row offsets into indices/counts
+    indices: np.ndarray  # (nnz,) term ids
+    counts: np.ndarray   # (nnz,) term frequencies
+    lengths: np.ndarray  # (bullets,) tokens per bullet
+    df: np.ndarray       # (vocab,) bullets containing each term
+
+    @classmethod
+    def build(cls, data: ResumeData) -> "BulletIndex":
+        refs: list[BulletRef] = []
+        texts: list[str] = []
+        for section in ("work", "projects"):
+            for e, entry in enumerate(getattr(data, section)):
+                for b, text in enumerate(entry.bullets):
+                    refs.append((section, e, b))
+                    texts.append(text)
+
+        vocab: dict[str, int] = {}
+        term_ids: list[int] = []
+        lengths = np.zeros(len(texts), dtype=np.int32)
+        for i, text in enumerate(texts):
+            tokens = normalize(text).split()
+            lengths[i] = len(tokens)
+            term_ids.extend(vocab.setdefault(token, len(vocab)) for token in tokens)
+
+        # Sort each row's term ids, then collapse repeats into counts
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        keys = np.unique(rows * max(len(vocab), 1) + np.asarray(term_ids, dtype=np.int64), return_counts=True)
+        row_of, indices = np.divmod(keys[0], max(len(vocab), 1))
+        indptr = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_of, minlength=len(texts)), out=indptr[1:])
+
+        return cls(
+            refs=refs,
+            texts=texts,
+            vocab=vocab,
+            indptr=indptr,
+            indices=indices.astype(np.int32),
+            counts=keys[1].astype(np.float32),
+            lengths=lengths,
+            df=np.bincount(indices, minlength=len(vocab)).astype(np.float32),
+        )
+
+    def _weights(self, method: str) -> np.ndarray:
+        """Per-nonzero term weights of the bullet matrix."""
+        n = len(self.refs)
+        rows = np.repeat(np.arange(n), np.diff(self.indptr))
+        tf = self.counts
+        if method == "bm25":
+            idf = np.log1p((n - self.df + 0.5) / (self.df + 0.5))
+            avg = self.lengths.mean() if n else 0.0
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths / max(avg, 1e-9))
+            return (idf[self.indices] * tf * (BM25_K1 + 1) / (tf + norm[rows])).astype(np.float32)
+
+        weights = (1 + np.log(tf)) * self.idf()[self.indices]
+        row_norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n))
+        return (weights / np.maximum(row_norms[rows], 1e-12)).astype(np.float32)
+
+    def idf(self) -> np.ndarray:
+        """Smoothed TF-IDF inverse document frequency per term."""
+        n = len(self.refs)
+        return (np.log((1 + n) / (1 + self.df)) + 1).astype(np.float32)
+
+    def scores(self, jd_texts: Sequence[str], method: str = "bm25") -> np.ndarray:
+        """
+        Relevance of every bullet to every JD.
+
+        Args:
+            jd_texts: Job description texts
+            method: "bm25" (query term frequency × BM25 weight) or "tfidf"
+                (cosine similarity of TF-IDF vectors)
+
+        Returns:
+            float32 array of shape (len(jd_texts), bullets)
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown method: {method}. Available: {list(METHODS)}")
+        n = len(self.refs)
+        if not jd_texts or not n:
+            return np.zeros((len(jd_texts), n), dtype=np.float32)
+
+        # Query term counts; JD terms that never occur in a bullet score 0
+        tokens = [normalize(text).split() for text in jd_texts]
+        jd_lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+        ids = np.fromiter(
+            map(self.vocab.get, chain.from_iterable(tokens), repeat(-1)),
+            dtype=np.int64,
+            count=int(jd_lengths.sum()),
+        )
+        jd_rows = np.repeat(np.arange(len(tokens)), jd_lengths)
+        known = ids >= 0
+        oov = np.bincount(jd_rows[~known], minlength=len(tokens)).astype(np.float32)
+        shared, columns = np.unique(ids[known], return_inverse=True)
+        query = np.bincount(
+            jd_rows[known] * len(shared) + columns,
+            minlength=len(tokens) * len(shared),
+        ).reshape(len(tokens), len(shared)).astype(np.float32)
+
+        if method == "tfidf":
+            nonzero = query > 0
+            query[nonzero] = 1 + np.log(query[nonzero])
+            query *= self.idf()[shared]
+            # Out-of-vocabulary JD terms still count towards the JD's norm;
+            # they weigh as terms that appear in no bullet
+            oov_weight = np.log(1 + n) + 1
+            query /= np.maximum(np.sqrt((query * query).sum(axis=1) + oov * oov_weight ** 2), 1e-12)[:, None]
+
+        # Densify the bullet matrix over the shared columns only
+        column_of = np.full(len(self.vocab), -1, dtype=np.int64)
+        column_of[shared] = np.arange(len(shared))
+        rows = np.repeat(np.arange(n), np.diff(self.indptr))
+        cols = column_of[self.indices]
+        keep = cols >= 0
+        bullets = np.zeros((n, len(shared)), dtype=np.float32)
+        bullets[rows[keep], cols[keep]] = self._weights(method)[keep]
+
+        return query @ bullets.T
+
+
+_index_cache: "OrderedDict[str, BulletIndex]" = OrderedDict()
+
+
+def bullet_index(data: ResumeData) -> BulletIndex:
+    """The (cached) BulletIndex for a resume; rebuilt only if its bullets change."""
+    key = hash_bytes(json.dumps([
+        [entry.bullets for entry in data.work],
+        [entry.bullets for entry in data.projects],
+    ]))
+    index = _index_cache.get(key)
+    if index is None:
+        index = _index_cache[key] = BulletIndex.build(data)
+        if len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    else:
+        _index_cache.move_to_end(key)
+    return index
+
+
+def score_bullets(
+    data: ResumeData,
+    jd_texts: Sequence[str],
+    method: str = "bm25",
+) -> tuple[list[BulletRef], np.ndarray]:
+    """
+    Relevance of every work/project bullet to each of many JDs.
+
+    Returns:
+        (bullet refs, scores) where scores[j, i] is the relevance of
+        bullet refs[i] to jd_texts[j]
+    """
+    index = bullet_index(data)
+    return index.refs, index.scores(jd_texts, method)
+
+
+def relevance(data: ResumeData, jd_text: str, method: str = "bm25") -> dict[BulletRef, float]:
+    """
+    Relevance per bullet for one JD.
+
+    The result can be passed as `priorities` to fit_to_one_page, which
+    drops the least relevant bullets first.
+    """
+    refs, scores = score_bullets(data, [jd_text], method)
+    return {ref: float(score) for ref, score in zip(refs, scores[0])}
+
+
+def rank_bullets(
+    data: ResumeData,
+    jd_text: str,
+    method: str = "bm25",
+    top: Optional[int] = None,
+) -> list[dict]:
+    """
+    Bullets ordered by relevance to a JD, most relevant first.
+
+    Returns:
+        List of dicts with section, entry, bullet, text and score; ties
+        keep document order
+    """
+    index = bullet_index(data)
+    scores = index.scores([jd_text], method)[0]
+    order = np.argsort(-scores, kind="stable")[:top]
+    return [
+        {
+            "section": index.refs[i][0],
+            "entry": index.refs[i][1],
+            "bullet": index.refs[i][2],
+            "text": index.texts[i],
+            "score": round(float(scores[i]), 4),
+        }
+        for i in order
+    ]
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from pathlib import Path
+
+    from .keywords import load_resume
+
+    parser = argparse.ArgumentParser(description="Rank resume bullets by relevance to a job description")
+    parser.add_argument("--json", required=True, help="Resume JSON or generated .typ file")
+    parser.add_argument("--jd", required=True, help="Job description text file")
+    parser.add_argument("--method", choices=METHODS, default="bm25", help="Scoring method")
+    parser.add_argument("--top", type=int, default=None, help="Only the N most relevant bullets")
+
+    args = parser.parse_args()
+    data = load_resume(args.json)
+    for hit in rank_bullets(data, Path(args.jd).read_text(), args.method, args.top):
+        print(json.dumps(hit, ensure_ascii=False))
+    sys.exit(0)
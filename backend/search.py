@@ -0,0 +1,428 @@
+"""
+Full-text search over every bullet, summary, skill and project.
+
+Resumes are indexed into a SQLite FTS5 table (porter stemming, so
+"managing" matches "management") under CACHE_ROOT/search.sqlite3:
+
+    - Master resumes are indexed from ResumeData during
+      ingest_resume_from_json().
+    - Any other generated .typ file under personas/ and output/ (tailored
+      resumes, batch runs) is picked up by update_index(), which parses the
+      data literal back out of the Typst source.
+
+Updates are incremental: files whose mtime and size are unchanged are
+skipped without being read, and re-ingesting identical data is a no-op.
+
+Usage:
+    from backend.search import search
+
+    for hit in search('kubernetes OR "stakeholder management"'):
+        print(hit["persona"], hit["text"])
+
+    python -m backend.search 'kubernetes OR "stakeholder management"' --persona alex
+    python -m backend.search --update
+"""
+
+import json
+import re
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from .cache import CACHE_ROOT, hash_bytes
+from .models import ResumeData
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+PERSONAS_DIR = PROJECT_ROOT / "personas"
+OUTPUT_DIR = PROJECT_ROOT / "output"
+
+INDEX_PATH = CACHE_ROOT / "search.sqlite3"
+
+# Seconds a connection waits for another writer before "database is locked"
+BUSY_TIMEOUT = 30.0
+
+# Bump when the schema or what gets indexed changes; forces a rebuild
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    source TEXT UNIQUE NOT NULL,
+    persona TEXT,
+    role TEXT,
+    kind TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS items USING fts5(
+    text,
+    section UNINDEXED,
+    title UNINDEXED,
+    doc_id UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+"""
+
+_MASTER_RE = re.compile(r"^(?P<persona>.+)_(?P<role>[^_]+)_master_resume$")
+
+
+def connect(index_path: Union[str, Path] = INDEX_PATH) -> sqlite3.Connection:
+    """Open (creating if needed) the search index."""
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(index_path, timeout=BUSY_TIMEOUT)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript("DROP TABLE IF EXISTS documents; DROP TABLE IF EXISTS items;")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    return conn
+
+
+# --- Reading ResumeData back out of generated Typst ---
+
+_TOKEN_RE = re.compile(r'\s+|//[^\n]*|"(?:[^"\\]|\\.)*"|[(),:]|[^\s(),:"]+', re.S)
+_ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|.)', re.S)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+
+def _unescape(literal: str) -> str:
+    def replace(match: re.Match) -> str:
+        escape = match.group(1)
+        if escape.startswith("u{"):
+            return chr(int(escape[2:-1], 16))
+        return _ESCAPES.get(escape, escape)
+    return _ESCAPE_RE.sub(replace, literal[1:-1])
+
+
+def _parse_value(tokens: list[str], pos: int) -> tuple[Any, int]:
+    token = tokens[pos]
+    if token.startswith('"'):
+        return _unescape(token), pos + 1
+    if token != "(":
+        return (None if token == "none" else token), pos + 1
+
+    # Group: (:) dict, () array, (k: v, ...) dict, (a, b, ...) array, (a) value
+    pos += 1
+    if tokens[pos] == ":" and tokens[pos + 1] == ")":
+        return {}, pos + 2
+    items: list = []
+    keys: list = []
+    trailing_comma = False
+    while tokens[pos] != ")":
+        value, pos = _parse_value(tokens, pos)
+        if tokens[pos] == ":":
+            keys.append(value)
+            value, pos = _parse_value(tokens, pos + 1)
+        items.append(value)
+        trailing_comma = tokens[pos] == ","
+        if trailing_comma:
+            pos += 1
+        elif tokens[pos] != ")":
+            raise ValueError(f"unexpected token {tokens[pos]!r}")
+    pos += 1
+    if keys:
+        return dict(zip(keys, items)), pos
+    if len(items) == 1 and not trailing_comma:
+        return items[0], pos
+    return items, pos
+
+
+def parse_typst_data(source: str) -> dict:
+    """
+    The `#let data = (...)` literal of a generated resume, as a dict.
+
+    Handles what generate_typst() emits: strings, none, nested
+    dictionaries and arrays. Raises ValueError if there is no data literal.
+    """
+    start = source.find("#let data =")
+    if start < 0:
+        raise ValueError("no `#let data = (...)` literal")
+    tokens = [
+        t for t in _TOKEN_RE.findall(source, start + len("#let data ="))
+        if not t.isspace() and not t.startswith("//")
+    ]
+    try:
+        data, _ = _parse_value(tokens, 0)
+    except IndexError:
+        raise ValueError("unterminated data literal") from None
+    if not isinstance(data, dict):
+        raise ValueError("data literal is not a dictionary")
+    data.pop("layout", None)
+    return data
+
+
+# --- Indexing ---
+
+def _rows(data: ResumeData) -> Iterable[tuple[str, str, str]]:
+    """(text, section, title) for every searchable piece of a resume."""
+    if data.summary:
+        yield data.summary, "summary", data.contact.name
+    for entry in data.work:
+        title = f"{entry.title}, {entry.company}"
+        for bullet in entry.bullets:
+            yield bullet, "work", title
+    for entry in data.projects:
+        yield entry.title + (f" ({entry.description})" if entry.description else ""), "project", entry.title
+        for bullet in entry.bullets:
+            yield bullet, "project", entry.title
+    for entry in data.education:
+        title = f"{entry.degree}, {entry.institution}"
+        for bullet in entry.bullets:
+            yield bullet, "education", title
+    for category, items in data.skills.items():
+        if items:
+            yield ", ".join(items), "skills", category
+
+
+def _describe(path: Path) -> tuple[Optional[str], Optional[str], str]:
+    """(persona, role, kind) from a resume's location in the tree."""
+    path = path.resolve()
+    match = _MASTER_RE.match(path.stem)
+    if match and path.parent.parent == PERSONAS_DIR:
+        return path.parent.name, match.group("role"), "master"
+    for root in (PERSONAS_DIR, OUTPUT_DIR):
+        if path.is_relative_to(root):
+            return path.relative_to(root).parts[0], None, "tailored"
+    return None, None, "tailored"
+
+
+def _source(path: Path) -> str:
+    path = path.resolve()
+    return str(path.relative_to(PROJECT_ROOT)) if path.is_relative_to(PROJECT_ROOT) else str(path)
+
+
+def _replace_document(
+    conn: sqlite3.Connection,
+    source: str,
+    data: ResumeData,
+    persona: Optional[str],
+    role: Optional[str],
+    kind: str,
+    content_hash: str,
+    stat: Optional[tuple[int, int]],
+) -> None:
+    mtime_ns, size = stat or (None, None)
+    row = conn.execute("SELECT id FROM documents WHERE source = ?", (source,)).fetchone()
+    if row is not None:
+        conn.execute("DELETE FROM items WHERE doc_id = ?", (row["id"],))
+        conn.execute(
+            "UPDATE documents SET persona = ?, role = ?, kind = ?, hash = ?, mtime_ns = ?, size = ? WHERE id = ?",
+            (persona, role, kind, content_hash, mtime_ns, size, row["id"]),
+        )
+        doc_id = row["id"]
+    else:
+        doc_id = conn.execute(
+            "INSERT INTO documents (source, persona, role, kind, hash, mtime_ns, size) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (source, persona, role, kind, content_hash, mtime_ns, size),
+        ).lastrowid
+    conn.executemany(
+        "INSERT INTO items (text, section, title, doc_id) VALUES (?, ?, ?, ?)",
+        ((text, section, title, doc_id) for text, section, title in _rows(data)),
+    )
+
+
+def index_resume(
+    data: ResumeData,
+    typst_path: Union[str, Path],
+    persona: Optional[str] = None,
+    role: Optional[str] = None,
+    kind: str = "master",
+    index_path: Union[str, Path] = INDEX_PATH,
+) -> bool:
+    """
+    Index a resume from its ResumeData (no Typst parsing needed).
+
+    The document is keyed by the .typ file it was rendered to; if that
+    file exists, its mtime, size and hash are recorded so update_index()
+    skips it later.
+
+    Returns:
+        True if the index changed, False if the content was already indexed
+    """
+    typst_path = Path(typst_path)
+    try:
+        content = typst_path.read_bytes()
+        st = typst_path.stat()
+        stat = (st.st_mtime_ns, st.st_size)
+        content_hash = hash_bytes(content)
+    except FileNotFoundError:
+        stat = None
+        content_hash = hash_bytes(json.dumps(data.to_dict(), sort_keys=True))
+
+    source = _source(typst_path)
+    with closing(connect(index_path)) as conn, conn:
+        row = conn.execute("SELECT hash FROM documents WHERE source = ?", (source,)).fetchone()
+        if row is not None and row["hash"] == content_hash:
+            return False
+        _replace_document(conn, source, data, persona, role, kind, content_hash, stat)
+    return True
+
+
+def update_index(
+    roots: Iterable[Union[str, Path]] = (PERSONAS_DIR, OUTPUT_DIR),
+    index_path: Union[str, Path] = INDEX_PATH,
+) -> dict:
+    """
+    Bring the index in line with the generated .typ files under roots.
+
+    Files with unchanged mtime and size are skipped unread; changed files
+    are re-read and only re-indexed if their content hash changed. Entries
+    whose file was deleted are dropped. Files that are not generated
+    resumes (no data literal) are counted as skipped.
+
+    Returns:
+        dict with scanned, indexed, unchanged, skipped, removed, seconds
+    """
+    start = time.perf_counter()
+    counts = {"scanned": 0, "indexed": 0, "unchanged": 0, "skipped": 0, "removed": 0}
+    seen: set[str] = set()
+
+    with closing(connect(index_path)) as conn, conn:
+        known = {
+            row["source"]: row
+            for row in conn.execute("SELECT id, source, hash, mtime_ns, size FROM documents")
+        }
+        for root in roots:
+            root = Path(root)
+            if not root.is_dir():
+                continue
+            for path in root.rglob("*.typ"):
+                if path.name.startswith("."):
+                    continue  # Compile-service scratch files
+                counts["scanned"] += 1
+                source = _source(path)
+                seen.add(source)
+                st = path.stat()
+                row = known.get(source)
+                if row is not None and (row["mtime_ns"], row["size"]) == (st.st_mtime_ns, st.st_size):
+                    counts["unchanged"] += 1
+                    continue
+
+                content = path.read_bytes()
+                content_hash = hash_bytes(content)
+                if row is not None and row["hash"] == content_hash:
+                    conn.execute(
+                        "UPDATE documents SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (st.st_mtime_ns, st.st_size, row["id"]),
+                    )
+                    counts["unchanged"] += 1
+                    continue
+
+                try:
+                    data = ResumeData.from_dict(parse_typst_data(content.decode("utf-8")))
+                except ValueError:
+                    counts["skipped"] += 1
+                    continue
+                persona, role, kind = _describe(path)
+                _replace_document(conn, source, data, persona, role, kind, content_hash, (st.st_mtime_ns, st.st_size))
+                counts["indexed"] += 1
+
+        for source, row in known.items():
+            if row["mtime_ns"] is not None and source not in seen and not (PROJECT_ROOT / source).exists():
+                conn.execute("DELETE FROM items WHERE doc_id = ?", (row["id"],))
+                conn.execute("DELETE FROM documents WHERE id = ?", (row["id"],))
+                counts["removed"] += 1
+
+    counts["seconds"] = round(time.perf_counter() - start, 4)
+    return counts
+
+
+# --- Querying ---
+
+def _quote_terms(query: str) -> str:
+    """Fallback for text that is not valid FTS5 syntax: AND of quoted words."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
+
+def search(
+    query: str,
+    persona: Optional[str] = None,
+    kind: Optional[str] = None,
+    section: Optional[str] = None,
+    limit: int = 20,
+    index_path: Union[str, Path] = INDEX_PATH,
+) -> list[dict]:
+    """
+    Ranked full-text search (BM25) over indexed resumes.
+
+    Args:
+        query: FTS5 query, e.g. 'kubernetes OR "stakeholder management"'
+            or 'lead*'; text that is not valid FTS5 syntax is searched as
+            plain words
+        persona: Only this persona
+        kind: "master" or "tailored"
+        section: "summary", "work", "project", "education" or "skills"
+        limit: Maximum hits
+
+    Returns:
+        Hits, best first: dicts with text, snippet, section, title,
+        persona, role, kind, source and score (lower is better)
+    """
+    filters = []
+    params: list[Any] = []
+    for column, value in (("d.persona", persona), ("d.kind", kind), ("i.section", section)):
+        if value is not None:
+            filters.append(f"{column} = ?")
+            params.append(value)
+    where = "".join(f" AND {f}" for f in filters)
+    sql = (
+        "SELECT i.text, snippet(items, 0, '[', ']', '…', 12) AS snippet, i.section, i.title,"
+        " d.persona, d.role, d.kind, d.source, bm25(items) AS score"
+        " FROM items i JOIN documents d ON d.id = i.doc_id"
+        f" WHERE items MATCH ?{where} ORDER BY score LIMIT ?"
+    )
+
+    with closing(connect(index_path)) as conn:
+        try:
+            rows = conn.execute(sql, [query, *params, limit]).fetchall()
+        except sqlite3.OperationalError:
+            rows = conn.execute(sql, [_quote_terms(query), *params, limit]).fetchall()
+    return [{**dict(row), "score": round(row["score"], 4)} for row in rows]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Search bullets across personas and tailored resumes")
+    parser.add_argument("query", nargs="?", help="FTS5 query, e.g. 'kubernetes OR \"stakeholder management\"'")
+    parser.add_argument("--persona", help="Only this persona")
+    parser.add_argument("--kind", choices=["master", "tailored"], help="Only master or tailored resumes")
+    parser.add_argument("--section", choices=["summary", "work", "project", "education", "skills"])
+    parser.add_argument("--limit", type=int, default=20, help="Maximum hits")
+    parser.add_argument("--json", action="store_true", help="One JSON line per hit")
+    parser.add_argument("--update", action="store_true", help="Only refresh the index from .typ files")
+    parser.add_argument("--no-update", action="store_true", help="Query without refreshing the index first")
+
+    args = parser.parse_args()
+
+    if args.update or not args.no_update:
+        stats = update_index()
+        if args.update or stats["indexed"] or stats["removed"]:
+            print(json.dumps(stats), file=sys.stderr)
+    if not args.query:
+        if not args.update:
+            parser.print_usage()
+            sys.exit(1)
+        sys.exit(0)
+
+    start = time.perf_counter()
+    hits = search(args.query, args.persona, args.kind, args.section, args.limit)
+    elapsed = time.perf_counter() - start
+
+    for hit in hits:
+        if args.json:
+            print(json.dumps(hit, ensure_ascii=False))
+        else:
+            where = f"{hit['persona'] or '?'}{'/' + hit['role'] if hit['role'] else ''} {hit['kind']}"
+            print(f"{hit['score']:>8.2f}  {where:<20} {hit['section']:<9} {hit['title']}")
+            print(f"          {hit['snippet']}")
+    print(f"{len(hits)} hits in {elapsed * 1000:.1f}ms", file=sys.stderr)
+    sys.exit(0)
@@ -0,0 +1,299 @@
+"""
+Deterministic resume section segmenter.
+
+Splits extracted resume text into section spans (summary, work, projects,
+education, skills) in a single pass over the lines, using precompiled
+heading patterns and, when a PdfLayout is available, font-size cues. The
+spans are then used to pre-fill a ResumeData skeleton so the agent only has
+to correct edge cases instead of parsing the whole resume.
+
+Usage:
+    from backend.segmenter import segment_text, prefill_resume
+
+    seg = segment_text(text)
+    for span in seg.sections:
+        print(span.name, span.start, span.end)
+    skeleton = prefill_resume(seg)
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+from .layout import PdfLayout
+from .models import ResumeData, Contact, WorkEntry, ProjectEntry, EducationEntry
+
+
+SECTION_NAMES = ("summary", "work", "projects", "education", "skills")
+
+# Pseudo-section for the lines above the first heading (name, contact info)
+HEADER = "header"
+
+# Headings longer than this are treated as body text
+MAX_HEADING_CHARS = 40
+
+_HEADING_RE = re.compile(
+    r"""^[\s#*_]*(?:
+        (?P<summary>(?:professional\s+|career\s+|executive\s+)?(?:summary|profile|objective)|about(?:\s+me)?)
+      | (?P<work>(?:(?:work|professional|relevant|employment|career)\s+)?(?:experience|history)|work|employment)
+      | (?P<projects>(?:selected\s+|personal\s+|side\s+|key\s+)?projects)
+      | (?P<education>education(?:al\s+background)?|academic\s+background)
+      | (?P<skills>(?:technical\s+|core\s+|key\s+)?(?:skills|competencies)(?:\s*(?:&|and)\s*\w+)?|technologies|tools)
+    )[\s*_]*:?\s*$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_BULLET_RE = re.compile(r"^\s*(?:[•●▪‣⁃◦\-\*–]|\d+[.)])\s+")
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+\d{{4}}|\d{{4}}(?:[./-]\d{{1,2}})?|\d{{1,2}}/\d{{4}})"
+_DATE_RANGE_RE = re.compile(
+    rf"{_DATE}\s*(?:[–—\-]|to)\s*(?:{_DATE}|present|current|now)|{_DATE}",
+    re.IGNORECASE,
+)
+
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE_RE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+_URL_RE = re.compile(r"(?:https?://)?(?:www\.)?[\w-]+(?:\.[\w-]+)+(?:/[\w./%-]*)?", re.IGNORECASE)
+_TITLE_SPLIT_RE = re.compile(r"\s*(?:,|\||–|—|\s-\s|\s+at\s+|@)\s*")
+_SKILL_SPLIT_RE = re.compile(r"\s*(?:,|;|\||•)\s*")
+
+
+@dataclass
+class SectionSpan:
+    """Lines ``[start, end)`` of a section; ``start`` is its heading line."""
+    name: str
+    heading: str
+    start: int
+    end: int
+
+
+@dataclass
+class Segmentation:
+    lines: list[str]
+    sections: list[SectionSpan] = field(default_factory=list)
+
+    def section(self, name: str) -> Optional[SectionSpan]:
+        """First span with this name, if any."""
+        return next((s for s in self.sections if s.name == name), None)
+
+    def body(self, span: SectionSpan) -> list[str]:
+        """Non-empty lines of a section, excluding its heading."""
+        first = span.start if span.name == HEADER else span.start + 1
+        return [line for line in self.lines[first:span.end] if line.strip()]
+
+
+def match_heading(line: str) -> Optional[str]:
+    """Canonical section name if the line is a section heading."""
+    stripped = line.strip()
+    if not stripped or len(stripped) > MAX_HEADING_CHARS:
+        return None
+    m = _HEADING_RE.match(stripped)
+    return m.lastgroup if m else None
+
+
+def _segment(lines: list[str], sizes: Optional[list[float]] = None) -> Segmentation:
+    """
+    Single pass over the lines, opening a span at every heading.
+
+    With font sizes, a heading must also be set larger than (or bold at)
+    the body size, which rejects "Skills" or "Education" appearing as plain
+    text inside a bullet list.
+    """
+    body_size = _body_size(sizes) if sizes else None
+    seg = Segmentation(lines=lines)
+    current = SectionSpan(HEADER, "", 0, 0)
+
+    for i, line in enumerate(lines):
+        name = match_heading(line)
+        if name is None:
+            continue
+        if body_size is not None and sizes[i] < body_size * 1.05:
+            continue
+
+        current.end = i
+        if current.end > current.start or current.name != HEADER:
+            seg.sections.append(current)
+        current = SectionSpan(name, line.strip(), i, i)
+
+    current.end = len(lines)
+    if current.end > current.start or current.name != HEADER:
+        seg.sections.append(current)
+    return seg
+
+
+def _body_size(sizes: list[float]) -> float:
+    """Most common font size, i.e. the body text size."""
+    counts: dict[float, int] = {}
+    for size in sizes:
+        key = round(size, 1)
+        counts[key] = counts.get(key, 0) + 1
+    return max(counts, key=counts.get)
+
+
+def segment_text(text: str) -> Segmentation:
+    """Segment plain extracted text (any format) into sections."""
+    return _segment(text.strip().split("\n"))
+
+
+def segment_layout(layout: PdfLayout) -> Segmentation:
+    """
+    Segment a PDF layout, using font sizes to confirm headings.
+
+    Lines are taken in the same reading order as extract_from_pdf.
+    """
+    lines: list[str] = []
+    sizes: list[float] = []
+    for page in range(layout.page_count):
+        for block in layout.sorted_text_blocks(page):
+            for line in layout.block_lines(block):
+                lines.append(layout.line_text(line).strip())
+                size = layout.line_size(line)
+                # Bold body-size headings count as slightly larger
+                sizes.append(size * 1.1 if layout.line_is_bold(line) else size)
+    return _segment(lines, sizes)
+
+
+# --- Pre-fill ---
+
+def _split_date(line: str) -> tuple[str, str]:
+    """Split an entry header into (text without dates, dates)."""
+    m = _DATE_RANGE_RE.search(line)
+    if not m:
+        return line.strip(), ""
+    rest = (line[:m.start()] + line[m.end():]).strip(" \t,|–—-")
+    return rest, m.group(0).strip()
+
+
+def _split_pair(text: str) -> tuple[str, str]:
+    """Split "Title, Company" style headers into two parts."""
+    parts = [p for p in _TITLE_SPLIT_RE.split(text, maxsplit=1) if p]
+    if len(parts) == 2:
+        return parts[0].strip(), parts[1].strip()
+    return text.strip(), ""
+
+
+def _entries(lines: list[str]) -> list[dict]:
+    """
+    Group section lines into entries.
+
+    A non-bullet line carrying a date starts a new entry; bullet lines add
+    bullets; other lines either continue the previous bullet (wrapped text)
+    or, before any bullet, fill in the entry's secondary header line. A
+    capitalised line after a finished bullet starts an undated entry whose
+    dates may follow on their own line.
+    """
+    entries: list[dict] = []
+    for line in lines:
+        bullet = _BULLET_RE.match(line)
+        if bullet:
+            if not entries:
+                entries.append({"header": "", "dates": "", "extra": [], "bullets": []})
+            entries[-1]["bullets"].append(line[bullet.end():].strip())
+            continue
+
+        header, dates = _split_date(line)
+        if dates and not header and entries and not entries[-1]["dates"] and not entries[-1]["bullets"]:
+            entries[-1]["dates"] = dates  # Dates on their own line under the header
+        elif dates or not entries:
+            entries.append({"header": header, "dates": dates, "extra": [], "bullets": []})
+        elif entries[-1]["bullets"]:
+            last = entries[-1]["bullets"][-1]
+            if last.endswith((".", "!", "?")) and line.strip()[:1].isupper():
+                entries.append({"header": header, "dates": "", "extra": [], "bullets": []})
+            else:
+                entries[-1]["bullets"][-1] = f"{last} {line.strip()}"
+        else:
+            entries[-1]["extra"].append(line.strip())
+    return entries
+
+
+def _prefill_contact(lines: list[str]) -> Contact:
+    name = next((l.strip() for l in lines if not _EMAIL_RE.search(l)), "")
+    email = phone = ""
+    linkedin = website = None
+
+    for line in lines:
+        if not email and (m := _EMAIL_RE.search(line)):
+            email = m.group(0)
+        if not phone and (m := _PHONE_RE.search(line)):
+            phone = m.group(0).strip()
+        for url in _URL_RE.findall(_EMAIL_RE.sub("", line)):
+            if "linkedin" in url.lower():
+                linkedin = linkedin or url
+            elif "/" in url or url.lower().startswith("www"):
+                website = website or url
+
+    return Contact(name=name, email=email, phone=phone, linkedin=linkedin, website=website)
+
+
+def _prefill_skills(lines: list[str]) -> dict[str, list[str]]:
+    skills: dict[str, list[str]] = {}
+    for line in lines:
+        line = _BULLET_RE.sub("", line).strip()
+        category, sep, items = line.partition(":")
+        if not sep:
+            category, items = "Skills", line
+        values = [v for v in _SKILL_SPLIT_RE.split(items.strip()) if v]
+        if values:
+            skills.setdefault(category.strip(), []).extend(values)
+    return skills
+
+
+def prefill_resume(source: Union[str, Segmentation]) -> ResumeData:
+    """
+    Build a best-effort ResumeData skeleton from segmented text.
+
+    Fields that cannot be inferred are left empty for the agent to fill.
+
+    Args:
+        source: Extracted text, or a Segmentation from segment_text/segment_layout
+
+    Returns:
+        Pre-filled ResumeData
+    """
+    seg = segment_text(source) if isinstance(source, str) else source
+    header = seg.section(HEADER)
+    data = ResumeData(contact=_prefill_contact(seg.body(header) if header else []))
+
+    for span in seg.sections:
+        lines = seg.body(span)
+        if span.name == "summary":
+            text = " ".join(l.strip() for l in lines)
+            data.summary = f"{data.summary} {text}" if data.summary else text
+        elif span.name == "skills":
+            for category, items in _prefill_skills(lines).items():
+                data.skills.setdefault(category, []).extend(items)
+        elif span.name == "work":
+            for e in _entries(lines):
+                title, company = _split_pair(e["header"])
+                if not company and e["extra"]:
+                    company = e["extra"].pop(0)
+                data.work.append(WorkEntry(
+                    title=title,
+                    company=company,
+                    dates=e["dates"],
+                    bullets=e["bullets"],
+                    description=" ".join(e["extra"]) or None,
+                ))
+        elif span.name == "projects":
+            for e in _entries(lines):
+                data.projects.append(ProjectEntry(
+                    title=e["header"],
+                    dates=e["dates"],
+                    bullets=e["bullets"],
+                    description=" ".join(e["extra"]) or None,
+                ))
+        elif span.name == "education":
+            for e in _entries(lines):
+                degree, institution = _split_pair(e["header"])
+                if not institution and e["extra"]:
+                    institution = e["extra"].pop(0)
+                data.education.append(EducationEntry(
+                    degree=degree,
+                    institution=institution,
+                    dates=e["dates"],
+                    bullets=e["bullets"] + e["extra"],
+                ))
+
+    return data
@@ -0,0 +1,394 @@
+"""
+Local HTTP job service for Typst generation, compilation and PDF checks.
+
+Every workflow step that shells out to `python -m backend...` pays
+interpreter startup plus the PyMuPDF and python-docx imports. This
+service loads them once and serves the common steps as JSON endpoints on
+localhost:
+
+    POST /generate_typst         {"data": {...} | "json_path": ..., "template", "layout", "output_path"}
+    POST /generate_letter_typst  {"data": {...} | "json_path": ..., "body", "recipient", "output_path"}
+    POST /compile_pdf            {"typst_path": ..., "output_path"}
+    POST /check_page_count       {"pdf_path": ...}
+    POST /detect_runts           {"pdf_path": ..., "max_ratio"}
+    GET  /health                 queue and job counters
+
+Requests become jobs on a priority queue served by a fixed number of
+worker tasks; an optional "priority" field in the body orders them (lower
+runs first, default DEFAULT_PRIORITY). When max_queue jobs are already
+waiting, new requests are rejected with 503 and Retry-After rather than
+buffered. Identical requests in flight at the same time (same endpoint,
+same parameters and same input file contents) share one job.
+
+File parameters (json_path, typst_path, pdf_path, output_path) must be
+absolute: the service's working directory is not the caller's. The
+client resolves them before sending. Any caller can read and write files
+with the service's permissions, so it only binds to loopback addresses.
+
+Typst compiles are additionally bounded by the generator's async compile
+limit (MYRIAD_TYPST_CONCURRENCY).
+
+Usage:
+    python -m backend.service --port 8765 --workers 4 --max-queue 64
+
+    python backend/client.py compile_pdf typst_path=resume.typ output_path=resume.pdf
+"""
+
+import asyncio
+import ipaddress
+import itertools
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from .cache import hash_bytes, hash_file
+from .generator import check_page_count, compile_and_count_async, generate_letter_typst, generate_typst
+from .models import ResumeData, ResumeValidationError
+from .monitor import RUNT_RATIO, detect_runts
+
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.environ.get("MYRIAD_SERVICE_PORT", "8765"))
+
+DEFAULT_PRIORITY = 10
+DEFAULT_MAX_QUEUE = 64
+
+# Largest request body accepted, in bytes
+MAX_BODY = 16 << 20
+
+# Parameters naming input files whose content identifies a request
+_INPUT_FILES = ("json_path", "typst_path", "pdf_path")
+
+# Parameters naming files; must be absolute paths
+PATH_PARAMS = (*_INPUT_FILES, "output_path")
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class RequestError(ValueError):
+    """A request the service cannot run as given (HTTP 400)."""
+
+
+class QueueFull(RuntimeError):
+    """Raised when max_queue jobs are already waiting (HTTP 503)."""
+
+
+# --- Endpoints: params dict in, JSON-serializable dict out ---
+
+def _param(params: dict, key: str, default: Any = None, required: bool = False) -> Any:
+    value = params.get(key, default)
+    if required and value is None:
+        raise RequestError(f"Missing parameter: {key}")
+    if key in PATH_PARAMS and value is not None and not (isinstance(value, str) and os.path.isabs(value)):
+        raise RequestError(f"{key} must be an absolute path, got: {value!r}")
+    return value
+
+
+def _resume_data(params: dict) -> ResumeData:
+    if "data" in params:
+        data = params["data"]
+    elif "json_path" in params:
+        try:
+            data = json.loads(Path(_param(params, "json_path")).read_text())
+        except (OSError, ValueError) as e:
+            raise RequestError(f"Cannot read resume JSON: {e}")
+    else:
+        raise RequestError("Missing parameter: data or json_path")
+    return ResumeData.from_dict(data)
+
+
+def _existing_file(params: dict, key: str) -> Path:
+    path = Path(_param(params, key, required=True))
+    if not path.is_file():
+        raise RequestError(f"File not found: {path}")
+    return path
+
+
+def _generate_typst(params: dict) -> dict:
+    source = generate_typst(
+        _resume_data(params),
+        _param(params, "template", "modern"),
+        _param(params, "output_path"),
+        _param(params, "layout"),
+    )
+    return {"source": source, "output_path": _param(params, "output_path")}
+
+
+def _generate_letter_typst(params: dict) -> dict:
+    source = generate_letter_typst(
+        _resume_data(params),
+        _param(params, "body", required=True),
+        _param(params, "output_path"),
+        _param(params, "recipient"),
+    )
+    return {"source": source, "output_path": _param(params, "output_path")}
+
+
+async def _compile_pdf(params: dict) -> dict:
+    typst_path = _existing_file(params, "typst_path")
+    success, message, pages = await compile_and_count_async(
+        typst_path, _param(params, "output_path"), _param(params, "timeout"),
+    )
+    output_path = Path(_param(params, "output_path") or typst_path.with_suffix(".pdf"))
+    return {"success": success, "message": message, "pages": pages, "pdf_path": str(output_path)}
+
+
+def _check_page_count(params: dict) -> dict:
+    return {"pages": check_page_count(_existing_file(params, "pdf_path"))}
+
+
+def _detect_runts(params: dict) -> dict:
+    runts = detect_runts(_existing_file(params, "pdf_path"), _param(params, "max_ratio", RUNT_RATIO))
+    return {"runts": runts, "count": len(runts)}
+
+
+def _threaded(handler: Callable[[dict], dict]) -> Callable[[dict], Awaitable[dict]]:
+    """Run a blocking endpoint off the event loop."""
+    async def run(params: dict) -> dict:
+        return await asyncio.to_thread(handler, params)
+    return run
+
+
+ENDPOINTS: dict[str, Callable[[dict], Awaitable[dict]]] = {
+    "generate_typst": _threaded(_generate_typst),
+    "generate_letter_typst": _threaded(_generate_letter_typst),
+    "compile_pdf": _compile_pdf,
+    "check_page_count": _threaded(_check_page_count),
+    "detect_runts": _threaded(_detect_runts),
+}
+
+
+def request_key(method: str, params: dict) -> str:
+    """
+    Content hash identifying a request: endpoint, parameters and the
+    content of any input file they name. Two requests with the same key
+    produce the same result (and write the same output files).
+    """
+    parts = [method, json.dumps(params, sort_keys=True, default=str)]
+    for key in _INPUT_FILES:
+        if key in params:
+            try:
+                parts.append(hash_file(params[key]))
+            except (OSError, TypeError):
+                parts.append("")  # Missing input: the endpoint reports it
+    return hash_bytes(*parts)
+
+
+# --- Job queue ---
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    seq: int
+    method: str = field(compare=False)
+    params: dict = field(compare=False)
+    key: str = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class JobService:
+    """
+    Priority job queue with bounded backlog and in-flight deduplication.
+
+    Must be created and used on one event loop.
+
+    Args:
+        workers: Jobs run concurrently
+        max_queue: Jobs allowed to wait; submit() raises QueueFull past that
+    """
+
+    def __init__(self, workers: int = 4, max_queue: int = DEFAULT_MAX_QUEUE):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._queue: "asyncio.PriorityQueue[_Job]" = asyncio.PriorityQueue()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._seq = itertools.count()
+        self._tasks: list[asyncio.Task] = []
+        self.counters = {"submitted": 0, "deduplicated": 0, "rejected": 0, "completed": 0, "failed": 0, "running": 0}
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)]
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def submit(self, method: str, params: dict, priority: int = DEFAULT_PRIORITY) -> dict:
+        """
+        Run an endpoint as a job and wait for its result.
+
+        Raises:
+            RequestError: Unknown endpoint
+            QueueFull: Backlog is at max_queue
+            Exception: Whatever the endpoint raised
+        """
+        if method not in ENDPOINTS:
+            raise RequestError(f"Unknown endpoint: {method}. Available: {sorted(ENDPOINTS)}")
+        key = await asyncio.to_thread(request_key, method, params)
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.counters["deduplicated"] += 1
+        else:
+            if self._queue.qsize() >= self.max_queue:
+                self.counters["rejected"] += 1
+                raise QueueFull(f"{self._queue.qsize()} jobs queued")
+            future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+            self._queue.put_nowait(_Job(priority, next(self._seq), method, params, key, future))
+            self.counters["submitted"] += 1
+        # A disconnecting client must not cancel the job other requests share
+        return await asyncio.shield(future)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            self.counters["running"] += 1
+            try:
+                result = await ENDPOINTS[job.method](job.params)
+            except Exception as e:
+                self.counters["failed"] += 1
+                job.future.set_exception(e)
+                job.future.exception()  # Retrieved: no warning if every waiter left
+            else:
+                self.counters["completed"] += 1
+                job.future.set_result(result)
+            finally:
+                self.counters["running"] -= 1
+                self._in_flight.pop(job.key, None)
+                self._queue.task_done()
+
+    def stats(self) -> dict:
+        return {"workers": self.workers, "max_queue": self.max_queue, "queued": self._queue.qsize(), **self.counters}
+
+
+# --- HTTP ---
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, dict, bytes]:
+    """(method, path, headers, body) of one HTTP/1.1 request."""
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    if not request_line:
+        raise ConnectionError("empty request")
+    method, target, _ = request_line.split(" ", 2)
+    headers = {}
+    while (line := (await reader.readline()).decode("latin-1").strip()):
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length > MAX_BODY:
+        raise OverflowError(length)
+    body = await reader.readexactly(length) if length else b""
+    return method, target.split("?", 1)[0], headers, body
+
+
+async def _write_response(writer: asyncio.StreamWriter, status: int, payload: dict, headers: Optional[dict] = None) -> None:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = [
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        "Connection: close",
+        *(f"{name}: {value}" for name, value in (headers or {}).items()),
+    ]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+
+async def _dispatch(service: JobService, method: str, path: str, body: bytes) -> tuple[int, dict, dict]:
+    """(status, payload, extra headers) for one request."""
+    name = path.strip("/")
+    if name == "health":
+        return 200, {"status": "ok", **service.stats()}, {}
+    if name not in ENDPOINTS:
+        return 404, {"error": f"Unknown endpoint: /{name}", "endpoints": sorted(ENDPOINTS)}, {}
+    if method != "POST":
+        return 405, {"error": f"Use POST for /{name}"}, {"Allow": "POST"}
+
+    try:
+        params = json.loads(body or b"{}")
+        if not isinstance(params, dict):
+            raise ValueError("expected a JSON object")
+        priority = int(params.pop("priority", DEFAULT_PRIORITY))
+    except (TypeError, ValueError) as e:
+        return 400, {"error": f"Invalid request body: {e}"}, {}
+
+    start = time.perf_counter()
+    try:
+        result = await service.submit(name, params, priority)
+    except QueueFull as e:
+        return 503, {"error": f"Service busy: {e}"}, {"Retry-After": "1"}
+    except ResumeValidationError as e:
+        return 400, {"error": "Invalid resume data", "errors": e.errors}, {}
+    except RequestError as e:
+        return 400, {"error": str(e)}, {}
+    except Exception as e:
+        return 500, {"error": f"{type(e).__name__}: {e}"}, {}
+    return 200, {**result, "seconds": round(time.perf_counter() - start, 4)}, {}
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+async def serve(
+    host: str = HOST,
+    port: int = DEFAULT_PORT,
+    workers: Optional[int] = None,
+    max_queue: int = DEFAULT_MAX_QUEUE,
+) -> None:
+    """Run the service until cancelled."""
+    service = JobService(workers or os.cpu_count() or 4, max_queue)
+    service.start()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                method, path, _, body = await _read_request(reader)
+            except OverflowError:
+                await _write_response(writer, 413, {"error": f"Request body over {MAX_BODY} bytes"})
+                return
+            except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+                return
+            status, payload, headers = await _dispatch(service, method, path, body)
+            await _write_response(writer, status, payload, headers)
+        except ConnectionError:
+            pass  # Client went away
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Local job service for Typst generation, compiles and PDF checks")
+    parser.add_argument("--host", default=HOST, help="Interface to bind (default: localhost only)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent jobs (default: CPU count)")
+    parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE, help="Waiting jobs before 503s")
+
+    args = parser.parse_args()
+    if not _is_loopback(args.host):
+        parser.error(f"--host {args.host} is not a loopback address; callers could read and write any file")
+    print(f"Serving on http://{args.host}:{args.port}", file=sys.stderr, flush=True)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_queue))
+    except KeyboardInterrupt:
+        pass
+    sys.exit(0)
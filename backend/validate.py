@@ -1,17 +1,27 @@
-import sys
-import fitz
+import glob
 import json
-from backend.monitor import detect_runts
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from backend.layout import extract_layout
+from backend.monitor import analyze_pdf
+
+# Resumes must fit on one page
+MAX_PAGES = 1
 
 def validate_resume(pdf_path):
     print(f"🔍 Validating: {pdf_path}")
     
-    # 1. Page Count Check
+    # 1. Page Count Check (one open and parse covers every check)
     try:
-        doc = fitz.open(pdf_path)
-        page_count = len(doc)
-        if page_count > 1:
-            print(f"❌ FAILURE: Page count is {page_count} (Limit: 1)")
+        analysis = analyze_pdf(pdf_path)
+        page_count = analysis.page_count
+        if page_count > MAX_PAGES:
+            print(f"❌ FAILURE: Page count is {page_count} (Limit: {MAX_PAGES})")
             print("   👉 Action: Shorten bullets or remove skills.")
             return False
         else:
@@ -21,27 +31,149 @@ def validate_resume(pdf_path):
         return False
 
     # 2. Runt Check (Warning only)
-    try:
-        runts = detect_runts(pdf_path)
-        if runts:
-            print(f"⚠️ WARNING: {len(runts)} potential runts found:")
-            for runt in runts:
-                print(f"   - Page {runt['page']}: \"{runt['text']}\"")
-            print("   👉 Action: Tweaking wording slightly to fix.")
+    runts = analysis.runts
+    if runts:
+        print(f"⚠️ WARNING: {len(runts)} potential runts found:")
+        for runt in runts:
+            print(f"   - Page {runt['page']}: \"{runt['text']}\"")
+        print("   👉 Action: Tweaking wording slightly to fix.")
+    else:
+        print("✅ No runts detected.")
+    
+    return True
+
+
+def iter_pdf_files(paths: Iterable[Union[str, Path]]) -> Iterator[Path]:
+    """
+    Expand directories (searched recursively) and glob patterns into PDFs.
+    
+    Plain file paths are yielded as-is, so a missing or non-PDF file still
+    shows up as an error record in the batch.
+    """
+    for entry in paths:
+        entry = str(entry)
+        if any(c in entry for c in "*?["):
+            for match in sorted(glob.glob(entry, recursive=True)):
+                if match.lower().endswith(".pdf"):
+                    yield Path(match)
+        elif Path(entry).is_dir():
+            yield from sorted(p for p in Path(entry).rglob("*") if p.suffix.lower() == ".pdf")
         else:
-            print("✅ No runts detected.")
+            yield Path(entry)
+
+
+def _validate_one(path: Path) -> dict:
+    """Process-pool worker: validate one PDF and never raise."""
+    start = time.perf_counter()
+    record = {"path": str(path)}
+    try:
+        layout = extract_layout(path)
+        parsed = time.perf_counter()
+        analysis = analyze_pdf(layout)
     except Exception as e:
-        print(f"⚠️ WARNING: Runt detection failed: {e}")
+        record.update({
+            "ok": False,
+            "error": f"{type(e).__name__}: {e}",
+            "seconds": round(time.perf_counter() - start, 4),
+        })
+        return record
     
-    return True
+    done = time.perf_counter()
+    record.update({
+        "ok": analysis.page_count <= MAX_PAGES,
+        "pages": analysis.page_count,
+        "fill_percent": analysis.fill["fill_percent"],
+        "runts": [
+            {"page": r["page"], "text": r["text"], "width_ratio": r["width_ratio"]}
+            for r in analysis.runts
+        ],
+        "seconds": round(done - start, 4),
+        "timings": {"parse": round(parsed - start, 4), "checks": round(done - parsed, 4)},
+    })
+    return record
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python -m backend.validate <pdf_path>")
-        sys.exit(1)
+
+def validate_batch(
+    paths: Iterable[Union[str, Path]],
+    workers: Optional[int] = None,
+) -> Iterator[dict]:
+    """
+    Validate many PDFs across a process pool.
+    
+    Results are yielded in completion order, one dict per file:
+    ``{"path", "ok", "pages", "fill_percent", "runts", "seconds", "timings"}``,
+    or ``{"path", "ok": False, "error", "seconds"}`` if the file could not
+    be read. ``ok`` is False when a PDF breaks the one-page rule.
+    
+    Args:
+        paths: Files, directories (searched recursively) and/or glob patterns
+        workers: Number of worker processes (default: CPU count)
         
-    pdf_path = sys.argv[1]
-    success = validate_resume(pdf_path)
+    Yields:
+        Per-file result dictionaries
+    """
+    files = list(iter_pdf_files(paths))
+    if not files:
+        return
+    
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(files) == 1:
+        # Skip pool startup for trivial batches
+        for path in files:
+            yield _validate_one(path)
+        return
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+        futures = [pool.submit(_validate_one, path) for path in files]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _run_batch(paths: list[str], workers: Optional[int]) -> int:
+    """CLI batch mode: one JSON line per PDF, then a summary on stderr."""
+    start = time.perf_counter()
+    total = 0
+    overflow: list[str] = []
+    errors: list[str] = []
+    with_runts = 0
+    
+    for record in validate_batch(paths, workers=workers):
+        total += 1
+        if "error" in record:
+            errors.append(record["path"])
+        elif not record["ok"]:
+            overflow.append(record["path"])
+        elif record["runts"]:
+            with_runts += 1
+        print(json.dumps(record, ensure_ascii=False), flush=True)
+    
+    elapsed = time.perf_counter() - start
+    print(
+        f"Validated {total} PDFs in {elapsed:.2f}s: {total - len(overflow) - len(errors)} ok "
+        f"({with_runts} with runts), {len(overflow)} over {MAX_PAGES} page(s), {len(errors)} errors",
+        file=sys.stderr,
+    )
+    for path in overflow:
+        print(f"  over page limit: {path}", file=sys.stderr)
+    for path in errors:
+        print(f"  error: {path}", file=sys.stderr)
+    return 1 if overflow or errors or total == 0 else 0
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Validate resume PDFs")
+    parser.add_argument("paths", nargs="+", help="PDF files, directories or glob patterns")
+    parser.add_argument("--batch", action="store_true", help="Validate many PDFs; JSON lines on stdout")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    
+    args = parser.parse_args()
+    
+    if args.batch:
+        sys.exit(_run_batch(args.paths, args.workers))
+    
+    success = validate_resume(args.paths[0])
     
     if not success:
         sys.exit(1)
@@ -49,9 +49,9 @@
 }
 
 // 4. Body Text
-#let main(body) = {
+#let main(body, leading: 0.875em) = {
   set text(weight: weight-regular)
-  set par(leading: 0.875em)
+  set par(leading: leading)
   show strong: set text(weight: weight-semibold)
   pad(left: 20pt, right: 15pt, body)
 }
@@ -86,16 +86,23 @@
 }
 
 // --- Render Function ---
+// Optional data.layout overrides spacing, e.g. to fit one page:
+//   layout: (margin-x: 45pt, margin-y: 20pt, leading: 0.8em, list-spacing: 0.8em)
 
 #let render(data) = {
+  let layout = data.at("layout", default: (:))
+  let margin-x = layout.at("margin-x", default: 50pt)
+  let margin-y = layout.at("margin-y", default: 25pt)
+  let main = main.with(leading: layout.at("leading", default: 0.875em))
+
   set page(
     paper: "a4",
     fill: white,
-    margin: (left: 50pt, right: 50pt, top: 25pt, bottom: 25pt),
+    margin: (left: margin-x, right: margin-x, top: margin-y, bottom: margin-y),
   )
 
   set text(font: "Myriad Pro", fill: text-color, size: 10pt, ligatures: true)
-  set list(marker: [•], body-indent: 8pt, spacing: 1em)
+  set list(marker: [•], body-indent: 8pt, spacing: layout.at("list-spacing", default: 1em))
 
   // Header
   // Note: Contact details laid out to match user preference (2 lines of header info)